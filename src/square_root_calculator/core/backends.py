@@ -0,0 +1,419 @@
+"""Pluggable real square root backends with automatic selection.
+
+Подключаемые вычислители вещественного квадратного корня с автоматическим выбором.
+"""
+
+import decimal
+from decimal import Decimal
+from typing import Callable, Dict, Optional, Tuple
+
+from .constants import (
+    BACKEND_LONG_INPUT_BAND,
+    BACKEND_SHORT_INPUT_BAND,
+    ENGINE_DECIMAL,
+    ENGINE_GMPY2,
+    ENGINE_ISQRT,
+    ENGINE_MPMATH,
+    ENGINE_NEWTON,
+    NEWTON_SEED_DIGITS,
+)
+from .fixed_point import (
+    EXACT_CONTEXT,
+    decimal_exponent,
+    decimal_to_integer_parts,
+    fixed_point_sqrt,
+    isqrt_rem,
+)
+from .refinement import refine_real_root
+
+# Integer backends in order of preference, fastest first
+_INTEGER_PREFERENCE = (ENGINE_GMPY2, ENGINE_MPMATH, ENGINE_ISQRT)
+
+
+class SqrtBackend:
+    """Square root of a non-negative Decimal rounded like ``Context.sqrt``.
+
+    Квадратный корень неотрицательного Decimal с округлением как у ``Context.sqrt``.
+
+    Every backend returns the correctly rounded (half-even) root with the
+    exponent ``Decimal.sqrt`` would choose, so results never depend on
+    which backend computed them.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize backend.
+
+        Инициализировать вычислитель.
+
+        Args:
+            name: Engine name the backend is registered under
+                 Имя движка, под которым регистрируется вычислитель
+        """
+        self.name = name
+
+    def sqrt(self, num: Decimal, context: decimal.Context) -> Decimal:
+        """Compute the square root of a finite non-negative value.
+
+        Вычислить квадратный корень конечного неотрицательного значения.
+
+        Args:
+            num: Finite non-negative value
+                Конечное неотрицательное значение
+            context: Context giving the precision of the result
+                    Контекст, задающий точность результата
+
+        Returns:
+            Root rounded to ``context.prec`` digits, half-even
+            Корень, округлённый до ``context.prec`` цифр до чётного
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r})"
+
+
+class DecimalBackend(SqrtBackend):
+    """``Decimal.sqrt`` from the standard library.
+
+    ``Decimal.sqrt`` из стандартной библиотеки.
+    """
+
+    def __init__(self) -> None:
+        """Initialize Decimal backend.
+
+        Инициализировать вычислитель на Decimal.
+        """
+        super().__init__(ENGINE_DECIMAL)
+
+    def sqrt(self, num: Decimal, context: decimal.Context) -> Decimal:
+        return context.sqrt(num)
+
+
+class IntegerBackend(SqrtBackend):
+    """Fixed-point root built on an integer square root with remainder.
+
+    Корень в фиксированной точке на основе целочисленного корня с остатком.
+
+    The integer root only sees the leading ``2 * prec + 3`` digits of the
+    input, so longer inputs are first cut to one digit more with
+    ``ROUND_05UP``. That keeps a nonzero last digit whenever anything was
+    dropped, and the int conversion costs the same for any input length.
+    """
+
+    def __init__(self, name: str, sqrtrem: Callable[[int], Tuple[int, int]]) -> None:
+        """Initialize integer backend.
+
+        Инициализировать целочисленный вычислитель.
+
+        Args:
+            name: Engine name the backend is registered under
+                 Имя движка, под которым регистрируется вычислитель
+            sqrtrem: Function returning (floor root, remainder) of an int
+                    Функция, возвращающая (целую часть корня, остаток) целого
+        """
+        super().__init__(name)
+        self.sqrtrem = sqrtrem
+
+    def sqrt(self, num: Decimal, context: decimal.Context) -> Decimal:
+        ideal_exponent = decimal_exponent(num) // 2
+        sticky = decimal.Context(
+            prec=2 * context.prec + 4,
+            rounding=decimal.ROUND_05UP,
+            Emax=decimal.MAX_EMAX,
+            Emin=decimal.MIN_EMIN,
+        )
+        coefficient, exponent = decimal_to_integer_parts(sticky.plus(num))
+        return fixed_point_sqrt(
+            coefficient, exponent, context.prec, self.sqrtrem, ideal_exponent
+        ).to_decimal()
+
+
+class NewtonBackend(SqrtBackend):
+    """Newton steps in Decimal from a short ``Decimal.sqrt`` seed.
+
+    Шаги Ньютона в Decimal от короткого начального ``Decimal.sqrt``.
+
+    Each step is a libmpdec division, which multiplies by number-theoretic
+    transform at high precision, so from some thousand digits on the steps
+    beat both ``Decimal.sqrt`` and an integer root with its quadratic
+    conversions. The refined root is verified against the input and falls
+    back to ``Context.sqrt`` if the check fails.
+    """
+
+    def __init__(self) -> None:
+        """Initialize Newton backend.
+
+        Инициализировать вычислитель на шагах Ньютона.
+        """
+        super().__init__(ENGINE_NEWTON)
+
+    def sqrt(self, num: Decimal, context: decimal.Context) -> Decimal:
+        if not num:
+            return context.sqrt(num)
+        # sqrt(m * 10**(2k)) = sqrt(m) * 10**k keeps the steps near one
+        half = num.adjusted() // 2
+        mantissa = EXACT_CONTEXT.scaleb(num, -2 * half)
+        seed_context = decimal.Context(prec=NEWTON_SEED_DIGITS)
+        root = refine_real_root(mantissa, seed_context.sqrt(mantissa), context.prec)
+        if root is None:
+            return context.sqrt(num)
+        return context.plus(EXACT_CONTEXT.scaleb(root, half))
+
+
+class BackendRegistry:
+    """Registered square root backends and the bands where each one wins.
+
+    Зарегистрированные вычислители корня и диапазоны, где каждый выигрывает.
+
+    A band is a pair (lower, upper) of precisions: below ``lower``
+    ``Decimal.sqrt`` wins, from there the fastest registered integer
+    backend does, and from ``upper`` on the quadratic int <-> Decimal
+    conversions hand the lead to the Newton backend, or back to
+    ``Decimal.sqrt`` if it is not registered. Inputs with more
+    digits than the precision have a band of their own. The bands can be
+    measured on the host with ``calibration.calibrate``.
+    """
+
+    def __init__(
+        self,
+        short_input_band: Tuple[int, int] = BACKEND_SHORT_INPUT_BAND,
+        long_input_band: Tuple[int, int] = BACKEND_LONG_INPUT_BAND,
+    ) -> None:
+        """Initialize registry with the Decimal backend.
+
+        Инициализировать реестр с вычислителем на Decimal.
+
+        Args:
+            short_input_band: Band for inputs of at most ``precision`` digits
+                             Диапазон для входов не длиннее ``precision`` цифр
+            long_input_band: Band for longer inputs
+                            Диапазон для более длинных входов
+        """
+        self._backends: Dict[str, SqrtBackend] = {}
+        self._bands: Dict[bool, Tuple[int, int]] = {}
+        self.register(DecimalBackend())
+        self.set_band(*short_input_band)
+        self.set_band(*long_input_band, long_input=True)
+
+    def set_band(self, lower: int, upper: int, long_input: bool = False) -> None:
+        """Set the precisions where integer backends win for an input class.
+
+        Установить точности, на которых выигрывают целочисленные вычислители
+        для класса входов.
+
+        Equal bounds leave no band for integer backends.
+
+        Args:
+            lower: Digits where integer backends take over
+                  Число цифр, с которого выигрывают целочисленные вычислители
+            upper: Digits where the high-precision backend takes over
+                  Число цифр, с которого выигрывает вычислитель высокой
+                  точности
+            long_input: Whether the band is for inputs longer than the precision
+                       Относится ли диапазон к входам длиннее точности
+
+        Raises:
+            ValueError: If lower is less than 1 or above upper
+                       Если lower меньше 1 или больше upper
+        """
+        if lower < 1:
+            raise ValueError("Lower crossover must be at least 1")
+        if upper < lower:
+            raise ValueError("Upper crossover must not be below the lower crossover")
+        self._bands[long_input] = (lower, upper)
+
+    def band(self, long_input: bool = False) -> Tuple[int, int]:
+        """Get the precisions where integer backends win for an input class.
+
+        Получить точности, на которых выигрывают целочисленные вычислители
+        для класса входов.
+
+        Args:
+            long_input: Whether to get the band of inputs longer than the precision
+                       Получить ли диапазон входов длиннее точности
+
+        Returns:
+            Tuple (lower, upper)
+            Кортеж (lower, upper)
+        """
+        return self._bands[long_input]
+
+    def register(self, backend: SqrtBackend) -> None:
+        """Register a backend, replacing one with the same name.
+
+        Зарегистрировать вычислитель, заменив вычислитель с тем же именем.
+
+        Args:
+            backend: Backend to register
+                    Регистрируемый вычислитель
+        """
+        self._backends[backend.name] = backend
+
+    def available(self) -> Tuple[str, ...]:
+        """Get the names of the registered backends.
+
+        Получить имена зарегистрированных вычислителей.
+
+        Returns:
+            Tuple of engine names in registration order
+            Кортеж имён движков в порядке регистрации
+        """
+        return tuple(self._backends)
+
+    def get(self, name: str) -> SqrtBackend:
+        """Get a registered backend by name.
+
+        Получить зарегистрированный вычислитель по имени.
+
+        Args:
+            name: Engine name
+                 Имя движка
+
+        Returns:
+            Registered backend
+            Зарегистрированный вычислитель
+
+        Raises:
+            ValueError: If no backend is registered under the name
+                       Если под этим именем нет вычислителя
+        """
+        try:
+            return self._backends[name]
+        except KeyError:
+            raise ValueError(f"Unknown engine: {name}") from None
+
+    def select(self, num: Decimal, precision: int) -> SqrtBackend:
+        """Choose the fastest backend for a precision and an input.
+
+        Выбрать самый быстрый вычислитель для точности и входного значения.
+
+        Integer backends cut long inputs to twice the precision first, so
+        past that their cost does not depend on the input length.
+
+        Args:
+            num: Finite non-negative value
+                Конечное неотрицательное значение
+            precision: Number of significant digits of the result
+                      Количество значащих цифр результата
+
+        Returns:
+            Selected backend
+            Выбранный вычислитель
+        """
+        digits = num.adjusted() - decimal_exponent(num) + 1
+        return self.select_for_digits(digits, precision)
+
+    def select_for_digits(self, input_digits: int, precision: int) -> SqrtBackend:
+        """Choose the fastest backend for a precision and an input length.
+
+        Выбрать самый быстрый вычислитель для точности и длины входа.
+
+        Args:
+            input_digits: Significant digits of the input
+                         Значащие цифры входа
+            precision: Number of significant digits of the result
+                      Количество значащих цифр результата
+
+        Returns:
+            Selected backend
+            Выбранный вычислитель
+        """
+        lower, upper = self._bands[input_digits > precision]
+        if precision >= upper:
+            return self.high_precision_backend()
+        if precision >= lower:
+            integer_backend = self.fastest_integer_backend()
+            if integer_backend is not None:
+                return integer_backend
+        return self._backends[ENGINE_DECIMAL]
+
+    def high_precision_backend(self) -> SqrtBackend:
+        """Get the backend used above the integer band.
+
+        Получить вычислитель, используемый выше целочисленного диапазона.
+
+        Returns:
+            Newton backend if registered, otherwise the Decimal backend
+            Вычислитель Ньютона, если зарегистрирован, иначе вычислитель на Decimal
+        """
+        return self._backends.get(ENGINE_NEWTON, self._backends[ENGINE_DECIMAL])
+
+    def fastest_integer_backend(self) -> Optional[SqrtBackend]:
+        """Get the most preferred registered integer backend.
+
+        Получить самый предпочтительный зарегистрированный целочисленный вычислитель.
+
+        Returns:
+            Backend, or None if no integer backend is registered
+            Вычислитель или None, если целочисленных вычислителей нет
+        """
+        for name in _INTEGER_PREFERENCE:
+            if name in self._backends:
+                return self._backends[name]
+        return None
+
+
+def _gmpy2_sqrtrem() -> Optional[Callable[[int], Tuple[int, int]]]:
+    """Get ``gmpy2.isqrt_rem`` returning ints, if gmpy2 is installed.
+
+    Получить ``gmpy2.isqrt_rem``, возвращающую int, если установлен gmpy2.
+    """
+    try:
+        import gmpy2
+    except ImportError:
+        return None
+
+    def sqrtrem(n: int) -> Tuple[int, int]:
+        root, remainder = gmpy2.isqrt_rem(n)
+        return int(root), int(remainder)
+
+    return sqrtrem
+
+
+def _mpmath_sqrtrem() -> Optional[Callable[[int], Tuple[int, int]]]:
+    """Get mpmath's integer ``sqrtrem`` when it runs on gmpy.
+
+    Получить целочисленную ``sqrtrem`` из mpmath, если она работает на gmpy.
+
+    Without gmpy mpmath's integer root is plain Python, slower than
+    ``math.isqrt``, so it is not offered.
+    """
+    try:
+        from mpmath import libmp
+    except ImportError:
+        return None
+    mpmath_sqrtrem = getattr(libmp, "sqrtrem", None)
+    if mpmath_sqrtrem is None or getattr(libmp, "BACKEND", "python") == "python":
+        return None
+
+    def sqrtrem(n: int) -> Tuple[int, int]:
+        root, remainder = mpmath_sqrtrem(n)
+        return int(root), int(remainder)
+
+    return sqrtrem
+
+
+def _discover_backends(registry: BackendRegistry) -> None:
+    """Register the standard library and installed optional backends.
+
+    Зарегистрировать вычислители стандартной библиотеки и установленные
+    необязательные вычислители.
+
+    Args:
+        registry: Registry to fill
+                 Заполняемый реестр
+    """
+    registry.register(IntegerBackend(ENGINE_ISQRT, isqrt_rem))
+    registry.register(NewtonBackend())
+    for name, factory in (
+        (ENGINE_GMPY2, _gmpy2_sqrtrem),
+        (ENGINE_MPMATH, _mpmath_sqrtrem),
+    ):
+        sqrtrem = factory()
+        if sqrtrem is not None:
+            registry.register(IntegerBackend(name, sqrtrem))
+
+
+# Registry shared by all calculators
+default_registry = BackendRegistry()
+_discover_backends(default_registry)
@@ -0,0 +1,404 @@
+"""Batch execution of square root calculations on worker pools.
+
+Пакетное выполнение вычислений квадратных корней в пулах исполнителей.
+"""
+
+import itertools
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .backends import default_registry
+from .calculator import CalculationResult, SquareRootCalculator
+from .cancellation import CancellationToken
+from .estimation import AdmissionPolicy
+from .exact import IntegerSquareRoot
+from .constants import DEFAULT_ENGINE, DEFAULT_PROCESS_CHUNK_SIZE
+
+# Compact wire format of one result: (input, is_complex, real root, imag root,
+# is_exact, integer input or None, decimal_places, real and imaginary input
+# parts or None)
+SerializedResult = Tuple[
+    str, bool, str, str, bool, Optional[int], bool, Optional[str], Optional[str]
+]
+
+# Warm calculator of the current worker process
+_worker_calculator: Optional[SquareRootCalculator] = None
+
+
+class BatchJob:
+    """Single calculation request for a batch executor.
+
+    Один запрос на вычисление для пакетного исполнителя.
+    """
+
+    def __init__(
+        self,
+        value: Union[int, float, str, Decimal, None] = None,
+        real_part: Union[int, float, str, None] = None,
+        imag_part: Union[int, float, str, None] = None,
+        precision: int = 50,
+        token: Optional[CancellationToken] = None,
+        progress: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        """Initialize batch job.
+
+        Инициализировать пакетное задание.
+
+        Token and progress callback are honoured by ThreadPoolBatchExecutor;
+        they cannot cross a process boundary.
+
+        Args:
+            value: Value for real mode
+                  Значение для режима действительных чисел
+            real_part: Real part for complex mode
+                      Действительная часть для режима комплексных чисел
+            imag_part: Imaginary part for complex mode
+                      Мнимая часть для режима комплексных чисел
+            precision: Precision used for this job
+                      Точность, используемая для этого задания
+            token: Optional cancellation token, may be shared by many jobs
+                  Необязательный токен отмены, может быть общим для заданий
+            progress: Optional callback receiving the fraction of the job done
+                     Необязательная функция, получающая долю выполненного задания
+        """
+        self.value = value
+        self.real_part = real_part
+        self.imag_part = imag_part
+        self.precision = precision
+        self.token = token
+        self.progress = progress
+
+
+class ThreadPoolBatchExecutor:
+    """Runs calculations of mixed precision concurrently on a thread pool.
+
+    Выполняет вычисления разной точности параллельно в пуле потоков.
+
+    Every calculator owns its decimal context, so one calculator per precision
+    is shared by all worker threads without reconfiguring any global state.
+    With an admission policy every job is estimated first and rejected, or
+    run at a lower precision, when it exceeds the policy limits.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        engine: str = DEFAULT_ENGINE,
+        admission_policy: Optional[AdmissionPolicy] = None,
+    ) -> None:
+        """Initialize thread pool executor.
+
+        Инициализировать исполнитель с пулом потоков.
+
+        Args:
+            max_workers: Number of worker threads (None for the default)
+                        Количество рабочих потоков (None по умолчанию)
+            engine: Real square root engine for the calculators
+                   Движок действительного корня для калькуляторов
+            admission_policy: Optional limits on estimated time and memory
+                             Необязательные пределы оценённого времени и памяти
+        """
+        self.engine = engine
+        self.admission_policy = admission_policy
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._calculators: Dict[int, SquareRootCalculator] = {}
+        self._lock = threading.Lock()
+
+    def _get_calculator(self, precision: int) -> SquareRootCalculator:
+        """Get the shared calculator for a precision, creating it if needed.
+
+        Получить общий калькулятор для точности, создав его при необходимости.
+
+        Args:
+            precision: Calculation precision
+                      Точность вычисления
+
+        Returns:
+            Calculator configured for the precision
+            Калькулятор, настроенный на эту точность
+        """
+        with self._lock:
+            calculator = self._calculators.get(precision)
+            if calculator is None:
+                calculator = SquareRootCalculator(precision, engine=self.engine)
+                self._calculators[precision] = calculator
+            return calculator
+
+    def _run_job(self, job: BatchJob) -> CalculationResult:
+        """Run a single job on a worker thread.
+
+        Выполнить одно задание в рабочем потоке.
+
+        Args:
+            job: Job to run
+                Задание для выполнения
+
+        Returns:
+            CalculationResult of the job
+            CalculationResult задания
+        """
+        calculator = self._get_calculator(job.precision)
+        if self.admission_policy is not None:
+            precision = calculator.check_admission(
+                self.admission_policy, job.value, job.real_part, job.imag_part
+            )
+            calculator = self._get_calculator(precision)
+        return calculator.calculate(
+            job.value, job.real_part, job.imag_part, job.token, job.progress
+        )
+
+    def run(self, jobs: Iterable[BatchJob]) -> List[CalculationResult]:
+        """Run jobs concurrently and collect their results.
+
+        Выполнить задания параллельно и собрать их результаты.
+
+        Args:
+            jobs: Jobs to run, possibly with different precisions
+                 Задания для выполнения, возможно с разной точностью
+
+        Returns:
+            Results in the same order as the jobs
+            Результаты в том же порядке, что и задания
+
+        Raises:
+            CalculatorError: The first error raised by a job, in job order
+                            Первая ошибка, возникшая в задании, в порядке заданий
+            CalculationCancelledError: If a job's token was cancelled
+                                      Если токен задания был отменён
+            AdmissionRejectedError: If a job exceeds the admission policy
+                                    Если задание превышает политику допуска
+        """
+        return list(self._executor.map(self._run_job, jobs))
+
+    def map(
+        self, values: Iterable[Union[int, float, str, Decimal]], precision: int
+    ) -> List[CalculationResult]:
+        """Calculate real square roots of many values at one precision.
+
+        Вычислить действительные квадратные корни многих значений с одной точностью.
+
+        Args:
+            values: Values for real mode
+                   Значения для режима действительных чисел
+            precision: Calculation precision
+                      Точность вычисления
+
+        Returns:
+            Results in the same order as the values
+            Результаты в том же порядке, что и значения
+        """
+        return self.run(BatchJob(value, precision=precision) for value in values)
+
+    def shutdown(self) -> None:
+        """Stop the worker threads.
+
+        Остановить рабочие потоки.
+        """
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ThreadPoolBatchExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
+
+
+def serialize_result(result: CalculationResult) -> SerializedResult:
+    """Convert a result to its compact wire format.
+
+    Преобразовать результат в компактный формат передачи.
+
+    Args:
+        result: Result to serialize
+               Результат для сериализации
+
+    Returns:
+        Tuple of the input string, mode flag, principal root digits, exact
+        flag, integer input, decimal places flag and complex input parts
+        Кортеж из строки ввода, флага режима, цифр главного корня, флага
+        точности, целого ввода, флага знаков после запятой и частей
+        комплексного ввода
+    """
+    real, imag = result.roots[0]
+    integer = None if result.integer_root is None else result.integer_root.value
+    parts = result.complex_parts or (None, None)
+    return (
+        result.input_value,
+        result.is_complex,
+        str(real),
+        str(imag),
+        result.is_exact,
+        integer,
+        result.decimal_places,
+        *(None if part is None else str(part) for part in parts),
+    )
+
+
+def deserialize_result(data: SerializedResult, precision: int) -> CalculationResult:
+    """Rebuild a result from its compact wire format.
+
+    Восстановить результат из компактного формата передачи.
+
+    Args:
+        data: Serialized result
+             Сериализованный результат
+        precision: Precision the result was computed with
+                  Точность, с которой был вычислен результат
+
+    Returns:
+        CalculationResult with both roots
+        CalculationResult с обоими корнями
+    """
+    (
+        input_value,
+        is_complex,
+        real_str,
+        imag_str,
+        is_exact,
+        integer,
+        places,
+        input_real,
+        input_imag,
+    ) = data
+    real, imag = Decimal(real_str), Decimal(imag_str)
+    # Real roots keep a plain zero imaginary part, as calculate builds them
+    negative_imag = imag.copy_negate() if is_complex else Decimal(0)
+    roots = [(real, imag), (real.copy_negate(), negative_imag)]
+    integer_root = None if integer is None else IntegerSquareRoot(integer)
+    return CalculationResult(
+        input_value,
+        roots,
+        is_complex,
+        precision,
+        integer_root,
+        is_exact,
+        places,
+        None if input_real is None else (Decimal(input_real), Decimal(input_imag)),
+    )
+
+
+def _init_worker(
+    precision: int,
+    engine: str,
+    bands: Tuple[Tuple[int, int], Tuple[int, int]],
+) -> None:
+    """Create the warm calculator of a worker process.
+
+    Создать подготовленный калькулятор рабочего процесса.
+
+    Args:
+        precision: Calculation precision
+                  Точность вычисления
+        engine: Real square root engine
+               Движок действительного корня
+        bands: Backend bands of the parent for short and long inputs
+              Диапазоны вычислителей родителя для коротких и длинных входов
+    """
+    global _worker_calculator
+    short_input_band, long_input_band = bands
+    default_registry.set_band(*short_input_band)
+    default_registry.set_band(*long_input_band, long_input=True)
+    _worker_calculator = SquareRootCalculator(precision, engine=engine)
+
+
+def _calculate_chunk(chunk: list) -> List[SerializedResult]:
+    """Calculate a chunk of inputs in a worker process.
+
+    Вычислить блок значений в рабочем процессе.
+
+    Args:
+        chunk: Real or complex inputs accepted by calculate_many
+              Действительные или комплексные значения, принимаемые calculate_many
+
+    Returns:
+        Serialized results in input order
+        Сериализованные результаты в порядке ввода
+    """
+    results = _worker_calculator.calculate_many(chunk, chunk_size=len(chunk))
+    return [serialize_result(result) for result in results]
+
+
+class ProcessPoolBatchExecutor:
+    """Spreads CPU-bound calculations of one precision across processes.
+
+    Распределяет ресурсоёмкие вычисления одной точности по процессам.
+
+    Inputs are sent to the workers in chunks and each worker keeps a warm
+    calculator, so only plain strings cross the process boundary.
+    """
+
+    def __init__(
+        self,
+        precision: int,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_PROCESS_CHUNK_SIZE,
+        engine: str = DEFAULT_ENGINE,
+    ) -> None:
+        """Initialize process pool executor.
+
+        Инициализировать исполнитель с пулом процессов.
+
+        Args:
+            precision: Calculation precision for all inputs
+                      Точность вычисления для всех значений
+            max_workers: Number of worker processes (None for CPU count)
+                        Количество рабочих процессов (None - число процессоров)
+            chunk_size: Number of inputs sent to a worker at once
+                       Количество значений, передаваемых процессу за раз
+            engine: Real square root engine for the workers
+                   Движок действительного корня для рабочих процессов
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self.precision = precision
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(
+                precision,
+                engine,
+                (default_registry.band(), default_registry.band(long_input=True)),
+            ),
+        )
+
+    def map(
+        self, values: Iterable[Union[int, float, str, Decimal, complex, tuple]]
+    ) -> Iterator[CalculationResult]:
+        """Calculate square roots of many inputs on the worker processes.
+
+        Вычислить квадратные корни многих значений в рабочих процессах.
+
+        Args:
+            values: Real or complex inputs accepted by calculate_many
+                   Действительные или комплексные значения, принимаемые
+                   calculate_many
+
+        Yields:
+            CalculationResult for each input, in input order
+            CalculationResult для каждого значения в порядке ввода
+
+        Raises:
+            CalculatorError: The first error raised by a chunk, in input order
+                            Первая ошибка, возникшая в блоке, в порядке ввода
+        """
+        iterator = iter(values)
+        chunks = iter(lambda: list(itertools.islice(iterator, self.chunk_size)), [])
+        for serialized in self._executor.map(_calculate_chunk, chunks):
+            for data in serialized:
+                yield deserialize_result(data, self.precision)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes.
+
+        Остановить рабочие процессы.
+        """
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "ProcessPoolBatchExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
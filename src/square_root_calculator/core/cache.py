@@ -0,0 +1,329 @@
+"""Bounded in-memory cache of calculated square roots.
+
+Ограниченный кэш вычисленных квадратных корней в памяти.
+"""
+
+import heapq
+import sys
+import threading
+from decimal import Decimal
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from .constants import DEFAULT_CACHE_MAX_BYTES, DEFAULT_CACHE_MAX_ENTRIES
+
+# Principal root stored in the cache: (real part, imaginary part)
+CachedRoot = Tuple[Decimal, Decimal]
+
+# Cache key: (mode, normalized input, precision)
+CacheKey = Tuple[str, Hashable, int]
+
+
+class CacheEntry:
+    """Cached root with its size and compute cost.
+
+    Кэшированный корень с его размером и стоимостью вычисления.
+    """
+
+    def __init__(self, root: CachedRoot, size: int, cost: float) -> None:
+        """Initialize cache entry.
+
+        Инициализировать запись кэша.
+
+        Args:
+            root: Principal root (real, imaginary)
+                 Главный корень (действительная, мнимая части)
+            size: Approximate size in bytes
+                 Примерный размер в байтах
+            cost: Time it took to compute the root, in seconds
+                 Время вычисления корня в секундах
+        """
+        self.root = root
+        self.size = size
+        self.cost = cost
+        self.priority = 0.0
+        self.serial = 0
+
+
+class ResultCache:
+    """Cost-aware LRU cache bounded by entry count and approximate bytes.
+
+    Кэш LRU с учётом стоимости, ограниченный числом записей и объёмом в байтах.
+
+    Eviction follows GreedyDual-Size: every entry gets a priority of the
+    current age plus its compute cost per byte, refreshed on each hit, and
+    the lowest priority goes first. With equal cost per byte this is plain
+    LRU; an expensive result outlives cheap ones of the same size, while a
+    huge but cheap result is the first to go instead of flushing the cache.
+
+    Entries are also indexed by (mode, normalized input), so a request at a
+    lower precision can be answered from the closest higher-precision entry
+    and a request at a higher precision can be seeded from a lower one.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        """Initialize result cache.
+
+        Инициализировать кэш результатов.
+
+        Args:
+            max_entries: Maximum number of cached roots
+                        Максимальное количество кэшированных корней
+            max_bytes: Maximum approximate size of all cached roots
+                      Максимальный примерный размер всех кэшированных корней
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejections = 0
+        self.derived_hits = 0
+        self.seed_hits = 0
+        self._entries: Dict[CacheKey, CacheEntry] = {}
+        self._precisions: Dict[Tuple[str, Hashable], Set[int]] = {}
+        self._heap: List[Tuple[float, int, CacheKey]] = []
+        self._bytes = 0
+        self._age = 0.0
+        self._serial = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def estimate_size(root: CachedRoot) -> int:
+        """Estimate the memory used by a cached root.
+
+        Оценить объём памяти, занимаемый кэшированным корнем.
+
+        Args:
+            root: Principal root (real, imaginary)
+                 Главный корень (действительная, мнимая части)
+
+        Returns:
+            Approximate size in bytes
+            Примерный размер в байтах
+        """
+        return sum(sys.getsizeof(part) for part in root)
+
+    def get(self, key: CacheKey) -> Optional[CachedRoot]:
+        """Look up a cached root and mark it as recently used.
+
+        Найти кэшированный корень и отметить его как недавно использованный.
+
+        Args:
+            key: Cache key (mode, normalized input, precision)
+                Ключ кэша (режим, нормализованный ввод, точность)
+
+        Returns:
+            Cached root or None if missing
+            Кэшированный корень или None, если его нет
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touch(key, entry)
+            return entry.root
+
+    def put(self, key: CacheKey, root: CachedRoot, cost: float) -> None:
+        """Store a root, evicting low-priority entries if the cache is full.
+
+        Сохранить корень, вытеснив записи с низким приоритетом при переполнении.
+
+        Args:
+            key: Cache key (mode, normalized input, precision)
+                Ключ кэша (режим, нормализованный ввод, точность)
+            root: Principal root (real, imaginary)
+                 Главный корень (действительная, мнимая части)
+            cost: Time it took to compute the root, in seconds
+                 Время вычисления корня в секундах
+        """
+        size = self.estimate_size(root)
+        with self._lock:
+            if size > self.max_bytes or self.max_entries < 1:
+                self.rejections += 1
+                return
+
+            if key in self._entries:
+                self._remove(key)
+
+            entry = CacheEntry(root, size, cost)
+            self._entries[key] = entry
+            self._precisions.setdefault(key[:2], set()).add(key[2])
+            self._bytes += size
+            self._touch(key, entry)
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                victim = self._remove(self._pop_lowest())
+                self._age = victim.priority
+                if victim is entry:
+                    self.rejections += 1
+                else:
+                    self.evictions += 1
+
+    def get_higher_precision(self, key: CacheKey) -> Optional[Tuple[int, CachedRoot]]:
+        """Find the closest entry for the same input at a higher precision.
+
+        Найти ближайшую запись для того же ввода с более высокой точностью.
+
+        Args:
+            key: Cache key (mode, normalized input, precision)
+                Ключ кэша (режим, нормализованный ввод, точность)
+
+        Returns:
+            Tuple (precision, root) of the cheapest entry to round down,
+            or None if no entry has a higher precision
+            Кортеж (точность, корень) записи, которую проще всего округлить,
+            или None, если записей с более высокой точностью нет
+        """
+        with self._lock:
+            precisions = self._precisions.get(key[:2], ())
+            higher = [precision for precision in precisions if precision > key[2]]
+            if not higher:
+                return None
+            self.derived_hits += 1
+            return self._use(key, min(higher))
+
+    def get_lower_precision(self, key: CacheKey) -> Optional[Tuple[int, CachedRoot]]:
+        """Find the closest entry for the same input at a lower precision.
+
+        Найти ближайшую запись для того же ввода с более низкой точностью.
+
+        Args:
+            key: Cache key (mode, normalized input, precision)
+                Ключ кэша (режим, нормализованный ввод, точность)
+
+        Returns:
+            Tuple (precision, root) of the best seed for refinement,
+            or None if no entry has a lower precision
+            Кортеж (точность, корень) лучшего начального значения для
+            уточнения или None, если записей с более низкой точностью нет
+        """
+        with self._lock:
+            precisions = self._precisions.get(key[:2], ())
+            lower = [precision for precision in precisions if precision < key[2]]
+            if not lower:
+                return None
+            self.seed_hits += 1
+            return self._use(key, max(lower))
+
+    def _use(self, key: CacheKey, precision: int) -> Tuple[int, CachedRoot]:
+        """Refresh and return the entry of the same input at another precision.
+
+        Обновить и вернуть запись того же ввода с другой точностью.
+
+        Args:
+            key: Requested cache key
+                Запрошенный ключ кэша
+            precision: Precision of the entry to use
+                      Точность используемой записи
+
+        Returns:
+            Tuple (precision, root)
+            Кортеж (точность, корень)
+        """
+        found_key = key[:2] + (precision,)
+        entry = self._entries[found_key]
+        self._touch(found_key, entry)
+        return precision, entry.root
+
+    def _remove(self, key: CacheKey) -> CacheEntry:
+        """Remove an entry and its precision index record.
+
+        Удалить запись и её запись в индексе точностей.
+
+        Args:
+            key: Cache key of the entry
+                Ключ записи в кэше
+
+        Returns:
+            Removed entry
+            Удалённая запись
+        """
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        precisions = self._precisions[key[:2]]
+        precisions.discard(key[2])
+        if not precisions:
+            del self._precisions[key[:2]]
+        return entry
+
+    def _touch(self, key: CacheKey, entry: CacheEntry) -> None:
+        """Refresh the priority of an entry.
+
+        Обновить приоритет записи.
+
+        Args:
+            key: Cache key of the entry
+                Ключ записи в кэше
+            entry: Entry to refresh
+                  Запись для обновления
+        """
+        self._serial += 1
+        entry.serial = self._serial
+        entry.priority = self._age + entry.cost / max(entry.size, 1)
+        heapq.heappush(self._heap, (entry.priority, entry.serial, key))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(e.priority, e.serial, k) for k, e in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_lowest(self) -> CacheKey:
+        """Pop the key of the live entry with the lowest priority.
+
+        Извлечь ключ действующей записи с наименьшим приоритетом.
+
+        Returns:
+            Key of the entry to evict
+            Ключ записи для вытеснения
+        """
+        while True:
+            _, serial, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+            # Heap items left behind by refreshed or removed entries are stale
+            if entry is not None and entry.serial == serial:
+                return key
+
+    def clear(self) -> None:
+        """Remove all cached roots and reset the counters.
+
+        Удалить все кэшированные корни и сбросить счётчики.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._precisions.clear()
+            self._heap.clear()
+            self._bytes = 0
+            self._age = 0.0
+            self.hits = self.misses = self.evictions = self.rejections = 0
+            self.derived_hits = 0
+            self.seed_hits = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters.
+
+        Получить счётчики кэша.
+
+        Returns:
+            Dictionary with hits, misses, evictions, rejections, derived hits,
+            seed hits, entries and bytes
+            Словарь с попаданиями, промахами, вытеснениями, отказами,
+            производными попаданиями, начальными значениями, записями и байтами
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "rejections": self.rejections,
+                "derived_hits": self.derived_hits,
+                "seed_hits": self.seed_hits,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
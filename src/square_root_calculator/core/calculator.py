@@ -4,16 +4,74 @@
 """
 
 import decimal
-from decimal import Decimal, getcontext
-from typing import Union, Dict, List, Tuple
+import itertools
+import math
+import time
+from decimal import Decimal
+from fractions import Fraction
+from typing import Callable, Union, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .constants import (
-    MAX_SCIENTIFIC_PRECISION,
-    MAX_FRACTION_VALUE,
     MAX_FRACTION_DENOMINATOR,
     FRACTION_TOLERANCE,
-    MAX_POLAR_PRECISION,
+    MAX_INTEGER_REPRESENTATION_DIGITS,
+    DEFAULT_ENGINE,
+    ENGINE_AUTO,
+    ENGINE_ISQRT,
+    DEFAULT_BATCH_CHUNK_SIZE,
+    MODE_REAL,
+    MODE_COMPLEX,
+    REFINEMENT_MIN_PRECISION,
+    REFINEMENT_GUARD_DIGITS,
+    MONITORED_STEPS_MIN_PRECISION,
+    NEWTON_SEED_DIGITS,
+    DEFAULT_DIGIT_CHUNK_SIZE,
+    COMPLEX_GUARD_DIGITS,
+    PLACES_GUARD_DIGITS,
+    PLACES_MAX_ATTEMPTS,
+    POLAR_DEGREE_DIGITS,
+    TRANSCENDENTAL_GUARD_DIGITS,
+    REAL_REPRESENTATIONS,
+    COMPLEX_REPRESENTATIONS,
 )
+from .backends import SqrtBackend, default_registry
+from .cache import ResultCache
+from .cancellation import (  # noqa: F401
+    CalculationCancelledError,
+    CancellationToken,
+    checkpoint,
+    is_monitored,
+    monitoring,
+    stage,
+)
+from .estimation import AdmissionPolicy, CostEstimate, default_cost_model
+from .fast_paths import float_complex_sqrt
+from .exact import IntegerSquareRoot, exact_complex_root, square_fraction_root
+from .formatting import format_decimal, format_scientific
+from .precision import (
+    complex_significant_digits,
+    fits_places,
+    fraction_adjusted,
+    real_significant_digits,
+    round_small_root,
+    round_to_places,
+)
+from .rational import ContinuedFraction
+from .transcendental import modulus, pi, root_angle
+from .refinement import newton_sqrt, refine_fraction_root, refine_real_root
+from .fixed_point import (
+    EXACT_CONTEXT,
+    FixedPointRoot,
+    decimal_exponent,
+    decimal_to_integer_parts,
+    fixed_point_sqrt,
+    integer_to_decimal,
+    integer_to_str,
+    iter_sqrt_digits,
+    rational_sqrt,
+)
+
+_ZERO = Decimal(0)
 
 
 class CalculatorError(Exception):
@@ -70,6 +128,10 @@ class CalculationResult:
         roots: List[Tuple[Decimal, Decimal]],
         is_complex: bool,
         precision: int,
+        integer_root: Optional[IntegerSquareRoot] = None,
+        is_exact: bool = False,
+        decimal_places: bool = False,
+        complex_parts: Optional[Tuple[Decimal, Decimal]] = None,
     ) -> None:
         """Initialize calculation result.
 
@@ -84,11 +146,33 @@ class CalculationResult:
                        Является ли это комплексным вычислением
             precision: Precision used for calculation
                       Точность, используемая для вычисления
+            integer_root: Exact integer root when the input is an integer
+                         Точный целочисленный корень, если ввод - целое число
+            is_exact: Whether the roots are exact rather than rounded
+                     Являются ли корни точными, а не округлёнными
+            decimal_places: Whether precision counts decimal places of the
+                            roots rather than significant digits
+                           Означает ли точность знаки корней после запятой,
+                           а не значащие цифры
+            complex_parts: Parsed (real, imaginary) input of a complex
+                           calculation, from which the polar forms are built
+                          Разобранный ввод (действительная, мнимая части)
+                          комплексного вычисления, по которому строятся
+                          полярные формы
         """
         self.input_value = input_value
         self.roots = roots
         self.is_complex = is_complex
         self.precision = precision
+        self.integer_root = integer_root
+        self.is_exact = is_exact
+        self.decimal_places = decimal_places
+        self.complex_parts = complex_parts
+        # Strings are built on first access; None marks a form that does not apply
+        self._representations: Dict[str, Optional[str]] = {}
+        self._formatted_roots: Dict[int, List[str]] = {}
+        self._polar_parts: Optional[Tuple[str, str, str]] = None
+        self._continued_fraction: Optional[ContinuedFraction] = None
 
     def get_formatted_roots(self, max_digits: int = None) -> List[str]:
         """Get formatted string representations of all roots.
@@ -103,149 +187,322 @@ class CalculationResult:
             List of formatted root strings
             Список форматированных строк корней
         """
-        formatted = []
-        for real, imag in self.roots:
-            if max_digits is None:
-                max_digits = self.precision
+        if max_digits is None:
+            max_digits = self.precision
 
-            real_str = self._format_decimal(real, max_digits)
-            imag_str = self._format_decimal(abs(imag), max_digits)
+        formatted = self._formatted_roots.get(max_digits)
+        if formatted is None:
+            formatted = []
+            for real, imag in self.roots:
+                real_str = self._format_decimal(real, max_digits)
+                imag_str = self._format_decimal(imag.copy_abs(), max_digits)
 
-            if imag == 0:
-                formatted.append(real_str)
-            else:
-                sign = "+" if imag >= 0 else "-"
-                formatted.append(f"{real_str}{sign}{imag_str}i")
+                if imag == 0:
+                    formatted.append(real_str)
+                else:
+                    sign = "+" if imag >= 0 else "-"
+                    formatted.append(f"{real_str}{sign}{imag_str}i")
+            self._formatted_roots[max_digits] = formatted
 
-        return formatted
+        return list(formatted)
 
     def _format_decimal(self, value: Decimal, max_digits: int) -> str:
         """Format a single decimal value.
 
         Форматировать одно десятичное значение.
 
+        Results to a number of decimal places are always written without
+        an exponent.
+
         Args:
             value: Decimal value to format
                   Десятичное значение для форматирования
-            max_digits: Maximum digits after decimal point
-                       Максимум цифр после десятичной точки
+            max_digits: Maximum digits after decimal point, rounded half-even
+                       Максимум цифр после десятичной точки, с округлением
+                       до чётного
 
         Returns:
             Formatted string
             Форматированная строка
         """
-        result = str(value)
-
-        if "E" in result.upper():
-            return result
-
-        if "." in result:
-            integer_part, decimal_part = result.split(".")
-            if len(decimal_part) > max_digits:
-                decimal_part = decimal_part[:max_digits]
-            result = f"{integer_part}.{decimal_part}"
+        return format_decimal(value, max_digits, self.decimal_places)
 
-        return result
-
-    def get_representations(self) -> Dict[str, str]:
+    def get_representations(
+        self,
+        kinds: Optional[Iterable[str]] = None,
+        token: Optional[CancellationToken] = None,
+        progress: Optional[Callable[[float], None]] = None,
+    ) -> Dict[str, str]:
         """Get various representations of the result.
 
         Получить различные представления результата.
 
+        Each representation is computed on first access and kept on the
+        result, so repeated calls only build the forms not seen before.
+        Cancellation is checked and progress reported between forms.
+
+        Args:
+            kinds: Representations to return (default: all forms of the mode),
+                   see REAL_REPRESENTATIONS and COMPLEX_REPRESENTATIONS
+                  Возвращаемые представления (по умолчанию: все формы режима),
+                  см. REAL_REPRESENTATIONS и COMPLEX_REPRESENTATIONS
+            token: Optional cancellation token
+                  Необязательный токен отмены
+            progress: Optional callback receiving the fraction done
+                     Необязательная функция, получающая долю выполненного
+
         Returns:
-            Dictionary with different representations
-            Словарь с различными представлениями
-        """
-        representations = {}
+            Dictionary with different representations; forms that do not
+            apply to the result are left out
+            Словарь с различными представлениями; неприменимые к результату
+            формы пропускаются
 
-        if not self.is_complex and len(self.roots) > 0:
-            self._add_real_representations(representations)
-        elif self.is_complex and len(self.roots) > 0:
-            self._add_complex_representations(representations)
+        Raises:
+            InvalidInputError: If a representation kind is unknown
+                              Если вид представления неизвестен
+            CalculationCancelledError: If the token is cancelled
+                                      Если токен отменён
+        """
+        if kinds is None:
+            kinds = COMPLEX_REPRESENTATIONS if self.is_complex else REAL_REPRESENTATIONS
+        kinds = list(kinds)
 
+        representations = {}
+        with monitoring(token, progress):
+            for index, kind in enumerate(kinds):
+                with stage(index / len(kinds), (index + 1) / len(kinds)):
+                    representation = self.get_representation(kind)
+                if representation is not None:
+                    representations[kind] = representation
         return representations
 
-    def _add_real_representations(self, representations: Dict[str, str]) -> None:
-        """Add representations for real numbers.
+    def get_representation(self, kind: str) -> Optional[str]:
+        """Get a single representation of the result.
 
-        Добавить представления для действительных чисел.
+        Получить одно представление результата.
 
         Args:
-            representations: Dictionary to add representations to
+            kind: Representation kind, e.g. "decimal" or "polar"
+                 Вид представления, например "decimal" или "polar"
+
+        Returns:
+            Representation string, or None if it does not apply
+            Строка представления или None, если оно неприменимо
+
+        Raises:
+            InvalidInputError: If the representation kind is unknown
+                              Если вид представления неизвестен
+        """
+        if kind not in self._representations:
+            if kind in REAL_REPRESENTATIONS:
+                applies = not self.is_complex
+            elif kind in COMPLEX_REPRESENTATIONS:
+                applies = self.is_complex
+            else:
+                raise InvalidInputError(f"Unknown representation: {kind}")
+
+            builder = getattr(self, f"_build_{kind}_representation")
+            self._representations[kind] = builder() if applies and self.roots else None
+        return self._representations[kind]
+
+    def _build_decimal_representation(self) -> Optional[str]:
+        """Build the standard decimal representation.
+
+        Построить стандартное десятичное представление.
+
+        Returns:
+            Decimal string
+            Десятичная строка
+        """
+        return self._format_decimal(self.roots[0][0], self.precision)
+
+    def _build_integer_representation(self) -> Optional[str]:
+        """Build the exact integer root as "root²" or "root² + remainder".
+
+        Построить точный целочисленный корень как "root²" или "root² + remainder".
+
+        Returns:
+            Integer root string, or None if the input is not an integer
+            Строка целочисленного корня или None, если ввод не целое число
+        """
+        if self.integer_root is None:
+            return None
+        root = integer_to_str(self.integer_root.root)
+        if self.integer_root.is_perfect_square:
+            return f"{root}²"
+        return f"{root}² + {integer_to_str(self.integer_root.remainder)}"
+
+    def _build_scientific_representation(self) -> Optional[str]:
+        """Build the scientific notation representation.
+
+        Построить представление в научной нотации.
+
+        Returns:
+            Scientific notation string with ``precision`` significant digits,
+            or with the digits of the root for decimal places
+            Строка в научной нотации с ``precision`` значащими цифрами
+            или, для знаков после запятой, с цифрами корня
+        """
+        root = self.roots[0][0]
+        if self.decimal_places:
+            return format_scientific(root, len(root.as_tuple().digits) - 1)
+        return format_scientific(root, self.precision - 1)
+
+    def _build_fraction_representation(self) -> Optional[str]:
+        """Build the best fractional approximation of the root.
+
+        Построить наилучшее приближение корня дробью.
+
+        Returns:
+            "numerator/denominator", or None if no close fraction exists
+            "числитель/знаменатель" или None, если близкой дроби нет
         """
+        # Integer parts longer than the precision leave nothing to approximate,
+        # and roots below the tolerance would only approximate to zero
         real_val = self.roots[0][0]
+        if real_val.adjusted() >= self.precision or 0 < real_val < FRACTION_TOLERANCE:
+            return None
 
-        # Standard decimal
-        representations["decimal"] = self._format_decimal(real_val, self.precision)
+        frac = self.get_rational_approximation(MAX_FRACTION_DENOMINATOR)
+        if self.get_continued_fraction().is_within(frac, FRACTION_TOLERANCE):
+            return f"{frac.numerator}/{frac.denominator}"
+        return None
 
-        # Scientific notation
-        try:
-            precision = min(MAX_SCIENTIFIC_PRECISION, self.precision)
-            exp_notation = f"{float(real_val):.{precision}e}"
-            representations["scientific"] = exp_notation
-        except (ValueError, OverflowError):
-            pass
-
-        # Fractional approximation (for small numbers)
-        if abs(real_val) < MAX_FRACTION_VALUE:
-            self._add_fraction_representation(real_val, representations)
-
-    def _add_fraction_representation(
-        self, real_val: Decimal, representations: Dict[str, str]
-    ) -> None:
-        """Add fractional representation if applicable.
+    def get_continued_fraction(self) -> ContinuedFraction:
+        """Get the continued fraction of the principal real root.
+
+        Получить цепную дробь главного действительного корня.
+
+        The expansion is kept on the result, so later requests with tighter
+        bounds continue from the partial quotients already found.
+
+        Returns:
+            ContinuedFraction of the full-precision root
+            ContinuedFraction корня с полной точностью
+        """
+        if self._continued_fraction is None:
+            self._continued_fraction = ContinuedFraction(self.roots[0][0])
+        return self._continued_fraction
+
+    def get_rational_approximation(
+        self,
+        max_denominator: Optional[int] = None,
+        max_error: Optional[Union[Decimal, Fraction]] = None,
+    ) -> Fraction:
+        """Get the best rational approximation of the principal real root.
 
-        Добавить дробное представление, если применимо.
+        Получить наилучшее рациональное приближение главного действительного корня.
 
         Args:
-            real_val: Real value to represent as fraction
-            representations: Dictionary to add representation to
+            max_denominator: Largest allowed denominator
+                            Наибольший допустимый знаменатель
+            max_error: Largest allowed absolute error
+                      Наибольшая допустимая абсолютная погрешность
+
+        Returns:
+            Best approximation within the bounds
+            Наилучшее приближение в заданных границах
         """
-        try:
-            from fractions import Fraction
+        return self.get_continued_fraction().best_approximation(
+            max_denominator, max_error
+        )
 
-            frac = Fraction(float(real_val)).limit_denominator(
-                MAX_FRACTION_DENOMINATOR
-            )
-            if abs(float(frac) - float(real_val)) < FRACTION_TOLERANCE:
-                representations["fraction"] = (
-                    f"{frac.numerator}/{frac.denominator}"
-                )
-        except (ValueError, ZeroDivisionError):
-            pass
+    def _build_polar_representation(self) -> Optional[str]:
+        """Build the polar form (r, θ).
 
-    def _add_complex_representations(
-        self, representations: Dict[str, str]
-    ) -> None:
-        """Add representations for complex numbers.
+        Построить полярную форму (r, θ).
 
-        Добавить представления для комплексных чисел.
+        Returns:
+            Polar form string
+            Строка полярной формы
+        """
+        r_fmt, theta_fmt, theta_deg = self._get_polar_parts()
+        return f"{r_fmt} ∠ {theta_fmt} rad ({theta_deg}°)"
 
-        Args:
-            representations: Dictionary to add representations to
+    def _build_exponential_representation(self) -> Optional[str]:
+        """Build the exponential form r * e^(iθ).
+
+        Построить показательную форму r * e^(iθ).
+
+        Returns:
+            Exponential form string
+            Строка показательной формы
         """
-        import math
+        r_fmt, theta_fmt, _ = self._get_polar_parts()
+        return f"{r_fmt} * e^(i*{theta_fmt})"
 
-        real_val, imag_val = self.roots[0]
+    def _get_polar_parts(self) -> Tuple[str, str, str]:
+        """Get the formatted modulus and angle shared by the polar forms.
 
-        # Convert to polar form (r, θ)
-        try:
-            r = math.sqrt(float(real_val) ** 2 + float(imag_val) ** 2)
-            theta = math.atan2(float(imag_val), float(real_val))
-            theta_deg = math.degrees(theta)
+        Получить форматированные модуль и угол, общие для полярных форм.
+
+        Both come from the input parts rather than the rounded root: the
+        modulus is sqrt(|z|) and the angle arg(z) / 2, computed at the full
+        precision of the result; for decimal places, with enough significant
+        digits to cover the integer digits of the modulus before rounding.
+        The angle in degrees has its own POLAR_DEGREE_DIGITS digits, so its
+        two decimals do not depend on the precision.
 
-            precision = min(MAX_POLAR_PRECISION, self.precision)
-            r_fmt = self._format_decimal(Decimal(str(r)), precision)
-            theta_fmt = self._format_decimal(Decimal(str(theta)), precision)
+        Returns:
+            Tuple (modulus, angle in radians, angle in degrees)
+            Кортеж (модуль, угол в радианах, угол в градусах)
+        """
+        if self._polar_parts is None:
+            real_val, imag_val = self.roots[0]
+            precision = self.precision
+            if self.decimal_places:
+                # The modulus has at most one integer digit more than the
+                # larger part, and the angle at most one
+                largest = max(
+                    (part.adjusted() for part in (real_val, imag_val) if part),
+                    default=0,
+                )
+                precision += max(largest + 2, 1) + PLACES_GUARD_DIGITS
+            a, b = self.complex_parts or self._squared_root()
+            degree_digits = POLAR_DEGREE_DIGITS + TRANSCENDENTAL_GUARD_DIGITS
+            magnitude = modulus(
+                a,
+                b,
+                max(precision, degree_digits) + TRANSCENDENTAL_GUARD_DIGITS,
+                SquareRootCalculator._seed_modulus(real_val, imag_val),
+            )
 
-            representations["polar"] = (
-                f"{r_fmt} ∠ {theta_fmt} rad ({theta_deg:.2f}°)"
+            # sqrt(m * 10**(2k)) = sqrt(m) * 10**k stays in the context range
+            half = magnitude.adjusted() // 2
+            scaled = EXACT_CONTEXT.scaleb(magnitude, -2 * half)
+            context = decimal.Context(
+                prec=precision, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
             )
+            r = default_registry.select(scaled, precision).sqrt(scaled, context)
+            r = context.scaleb(r, half)
+            theta = root_angle(a, b, magnitude, precision)
+
+            context = decimal.Context(prec=degree_digits)
+            angle = root_angle(a, b, magnitude, degree_digits)
+            theta_deg = context.divide(context.multiply(angle, 180), pi(degree_digits))
+
+            r_fmt = self._format_decimal(r, self.precision)
+            theta_fmt = self._format_decimal(theta, self.precision)
+            self._polar_parts = (r_fmt, theta_fmt, f"{theta_deg:.2f}")
+        return self._polar_parts
+
+    def _squared_root(self) -> Tuple[Decimal, Decimal]:
+        """Get the input parts as the exact square of the principal root.
+
+        Получить части входа как точный квадрат главного корня.
 
-            # Exponential form: r * e^(iθ)
-            representations["exponential"] = f"{r_fmt} * e^(i*{theta_fmt})"
-        except (ValueError, OverflowError):
-            pass
+        Used for results built without their input parts.
+
+        Returns:
+            Tuple (real, imaginary) of the squared root
+            Кортеж (действительная, мнимая части) квадрата корня
+        """
+        real, imag = self.roots[0]
+        multiply = EXACT_CONTEXT.multiply
+        return (
+            EXACT_CONTEXT.subtract(multiply(real, real), multiply(imag, imag)),
+            multiply(2, multiply(real, imag)),
+        )
 
 
 class SquareRootCalculator:
@@ -254,17 +511,39 @@ class SquareRootCalculator:
     Калькулятор для вычисления квадратных корней с настраиваемой точностью.
     """
 
-    def __init__(self, precision: int = 50) -> None:
+    def __init__(
+        self,
+        precision: int = 50,
+        engine: str = DEFAULT_ENGINE,
+        cache: Optional[ResultCache] = None,
+        decimal_places: bool = False,
+    ) -> None:
         """Initialize calculator with specified precision.
 
         Инициализировать калькулятор с заданной точностью.
 
         Args:
-            precision: Number of decimal places for precision (default: 50)
-                      Количество десятичных знаков для точности (по умолчанию: 50)
+            precision: Number of significant digits, or of decimal places
+                       with ``decimal_places`` (default: 50)
+                      Количество значащих цифр или, с ``decimal_places``,
+                      знаков после запятой (по умолчанию: 50)
+            engine: Real square root engine, ENGINE_AUTO or a registered backend
+                   Движок действительного корня, ENGINE_AUTO или
+                   зарегистрированный вычислитель
+            cache: Optional result cache consulted by calculate
+                  Необязательный кэш результатов, используемый calculate
+            decimal_places: Round the results of calculate to ``precision``
+                            decimal places, computing each root only to the
+                            significant digits this needs
+                           Округлять результаты calculate до ``precision``
+                           знаков после запятой, вычисляя каждый корень
+                           лишь с нужным для этого числом значащих цифр
         """
         self.precision = precision
-        getcontext().prec = precision
+        self.context = decimal.Context(prec=precision)
+        self.cache = cache
+        self.decimal_places = decimal_places
+        self.set_engine(engine)
 
     def set_precision(self, precision: int) -> None:
         """Set the precision for calculations.
@@ -272,8 +551,10 @@ class SquareRootCalculator:
         Установить точность для вычислений.
 
         Args:
-            precision: Number of decimal places
-                      Количество десятичных знаков
+            precision: Number of significant digits, or of decimal places
+                       with ``decimal_places``
+                      Количество значащих цифр или, с ``decimal_places``,
+                      знаков после запятой
 
         Raises:
             InvalidInputError: If precision is less than 1
@@ -282,29 +563,319 @@ class SquareRootCalculator:
         if precision < 1:
             raise InvalidInputError("Precision must be at least 1")
         self.precision = precision
-        getcontext().prec = precision
+        self.context = decimal.Context(prec=precision)
+
+    def set_engine(self, engine: str) -> None:
+        """Select the engine used for real square roots.
+
+        Выбрать движок для вычисления действительных квадратных корней.
+
+        Args:
+            engine: ENGINE_AUTO to pick the fastest backend per precision,
+                    or the name of a registered backend (ENGINE_DECIMAL,
+                    ENGINE_ISQRT, ENGINE_NEWTON, and ENGINE_GMPY2 or
+                    ENGINE_MPMATH when installed)
+                   ENGINE_AUTO для выбора самого быстрого вычислителя по
+                   точности или имя зарегистрированного вычислителя
+                   (ENGINE_DECIMAL, ENGINE_ISQRT, ENGINE_NEWTON, а также
+                   ENGINE_GMPY2 или ENGINE_MPMATH, если установлены)
+
+        Raises:
+            InvalidInputError: If the engine is unknown
+                              Если движок неизвестен
+        """
+        if engine != ENGINE_AUTO and engine not in default_registry.available():
+            raise InvalidInputError(f"Unknown engine: {engine}")
+        self.engine = engine
+
+    def _backend_for(self, num: Decimal, precision: int) -> SqrtBackend:
+        """Get the backend computing a real root with the selected engine.
+
+        Получить вычислитель действительного корня для выбранного движка.
+
+        Args:
+            num: Finite non-negative value
+                Конечное неотрицательное значение
+            precision: Number of significant digits of the root
+                      Количество значащих цифр корня
+
+        Returns:
+            Backend chosen by the engine setting
+            Вычислитель, выбранный по настройке движка
+        """
+        if self.engine == ENGINE_AUTO:
+            return default_registry.select(num, precision)
+        return default_registry.get(self.engine)
+
+    def _engine_for_digits(self, input_digits: int, precision: int) -> str:
+        """Get the engine a real root of an input length would use.
+
+        Получить движок, который использовал бы корень входа данной длины.
+
+        Args:
+            input_digits: Significant digits of the input
+                         Значащие цифры входа
+            precision: Number of significant digits of the root
+                      Количество значащих цифр корня
+
+        Returns:
+            Engine name
+            Имя движка
+        """
+        if self.engine == ENGINE_AUTO:
+            return default_registry.select_for_digits(input_digits, precision).name
+        return self.engine
+
+    def estimate_cost(
+        self,
+        value: Union[int, float, str, Decimal, Fraction] = None,
+        real_part: Union[int, float, str] = None,
+        imag_part: Union[int, float, str] = None,
+        precision: Optional[int] = None,
+    ) -> CostEstimate:
+        """Estimate the time and peak memory of ``calculate`` without running it.
+
+        Оценить время и пиковую память ``calculate``, не выполняя вычисление.
+
+        The roots are estimated for the engine the calculation would select,
+        from the shared cost model that ``--calibrate`` fits on the host.
+        Only the mantissa of an input reaches the engine, so the exponent
+        matters only through the exact integer root of integral inputs and,
+        for decimal places, through the significant digits of the root.
+        Exact, fast-path and cached results finish sooner than estimated.
+
+        Args:
+            value: Value for real mode
+                  Значение для режима действительных чисел
+            real_part: Real part for complex mode
+                      Действительная часть для режима комплексных чисел
+            imag_part: Imaginary part for complex mode
+                      Мнимая часть для режима комплексных чисел
+            precision: Precision to estimate for (default: calculator precision)
+                      Точность для оценки (по умолчанию: точность калькулятора)
+
+        Returns:
+            CostEstimate of the calculation
+            CostEstimate вычисления
+
+        Raises:
+            InvalidInputError: If input is invalid
+                              Если ввод некорректен
+        """
+        precision = self.precision if precision is None else precision
+        if real_part is not None or imag_part is not None:
+            a, b = self._parse_complex_parts(
+                0 if real_part is None else real_part,
+                0 if imag_part is None else imag_part,
+            )
+            root_precision = precision
+            if self.decimal_places and (a or b):
+                planned = complex_significant_digits(
+                    a, b, precision, PLACES_GUARD_DIGITS
+                )
+                if fits_places(planned, precision, PLACES_GUARD_DIGITS):
+                    root_precision = planned
+            # The modulus and the root itself are real roots at the guarded
+            # precision; the sum of squares is rounded to that precision
+            working = root_precision + COMPLEX_GUARD_DIGITS
+            digits = min(
+                2 * max(self._significant_digits(a), self._significant_digits(b)),
+                working,
+            )
+            root = default_cost_model.estimate(
+                self._engine_for_digits(digits, working), working, digits
+            )
+            return CostEstimate(
+                2 * root.seconds, root.peak_bytes, root.engine, precision
+            )
+
+        # Reducing the terms would cost as much as the gcd being estimated
+        rational = self._parse_rational(value, reduce=False)
+        if rational is not None and rational[1] != 1:
+            # sqrt(p/q * 10**e) is one integer root of p * 10**(2k) // q, after
+            # the terms are converted and reduced; the exponent is split off
+            # and only shifts the digits that decimal places need
+            numerator, denominator, exponent = rational
+            numerator_digits, denominator_digits = (
+                1 + int(term.bit_length() * math.log10(2))
+                for term in (numerator, denominator)
+            )
+            digits = max(numerator_digits, denominator_digits)
+            root_precision = self._root_digits(
+                fraction_adjusted(numerator, denominator) + exponent, precision
+            )
+            estimate = default_cost_model.estimate(
+                ENGINE_ISQRT, root_precision, digits
+            ) + default_cost_model.estimate_fraction_terms(
+                ENGINE_ISQRT, root_precision, numerator_digits, denominator_digits
+            )
+            estimate.precision = precision
+            return estimate
+
+        if rational is not None:
+            num = self._rational_numerator(rational)
+        else:
+            num = self._parse_non_negative(value)
+        digits = self._significant_digits(num)
+        root_precision = self._root_digits(num.adjusted() if num else 0, precision)
+        estimate = default_cost_model.estimate(
+            self._engine_for_digits(digits, root_precision), root_precision, digits
+        )
+        estimate.precision = precision
+        if (
+            num.adjusted() < MAX_INTEGER_REPRESENTATION_DIGITS
+            and EXACT_CONTEXT.to_integral_value(num) == num
+        ):
+            # Integral inputs also get their exact integer root
+            integer_digits = max(num.adjusted() + 1, 1)
+            estimate = estimate + default_cost_model.estimate(
+                ENGINE_ISQRT, (integer_digits + 1) // 2, integer_digits
+            )
+        return estimate
+
+    def check_admission(
+        self,
+        policy: AdmissionPolicy,
+        value: Union[int, float, str, Decimal, Fraction] = None,
+        real_part: Union[int, float, str] = None,
+        imag_part: Union[int, float, str] = None,
+    ) -> int:
+        """Get the precision an admission policy lets a calculation run at.
+
+        Получить точность, с которой политика допуска разрешает вычисление.
+
+        Args:
+            policy: Admission policy with time and memory limits
+                   Политика допуска с пределами времени и памяти
+            value: Value for real mode
+                  Значение для режима действительных чисел
+            real_part: Real part for complex mode
+                      Действительная часть для режима комплексных чисел
+            imag_part: Imaginary part for complex mode
+                      Мнимая часть для режима комплексных чисел
+
+        Returns:
+            The calculator precision, or a lower one if the policy downgrades
+            Точность калькулятора или более низкая, если политика её понижает
+
+        Raises:
+            InvalidInputError: If input is invalid
+                              Если ввод некорректен
+            AdmissionRejectedError: If the calculation exceeds the limits
+                                    Если вычисление превышает пределы
+        """
+        return policy.admit(
+            lambda precision: self.estimate_cost(
+                value, real_part, imag_part, precision
+            ),
+            self.precision,
+        )
+
+    def _root_digits(self, adjusted: int, precision: int) -> int:
+        """Get the significant digits a real root is computed to.
+
+        Получить число значащих цифр, с которым вычисляется действительный
+        корень.
+
+        Args:
+            adjusted: Exponent of the leading digit of the input, 0 for zero
+                     Показатель старшей цифры входа, 0 для нуля
+            precision: Significant digits, or decimal places of the result
+                      Значащие цифры или знаки результата после запятой
+
+        Returns:
+            Number of significant digits, at least 1
+            Количество значащих цифр, не меньше 1
+        """
+        if not self.decimal_places:
+            return precision
+        planned = real_significant_digits(adjusted, precision)
+        if not fits_places(planned, precision):
+            return precision
+        return max(planned, 1)
+
+    @staticmethod
+    def _significant_digits(num: Decimal) -> int:
+        """Count the significant digits of a finite value.
+
+        Подсчитать значащие цифры конечного значения.
+
+        Args:
+            num: Finite value
+                Конечное значение
+
+        Returns:
+            Number of digits, 1 for zero
+            Количество цифр, 1 для нуля
+        """
+        if not num:
+            return 1
+        return num.adjusted() - decimal_exponent(num) + 1
 
     def calculate(
         self,
-        value: Union[int, float, str, Decimal],
+        value: Union[int, float, str, Decimal, Fraction],
         real_part: Union[int, float, str] = None,
         imag_part: Union[int, float, str] = None,
+        token: Optional[CancellationToken] = None,
+        progress: Optional[Callable[[float], None]] = None,
     ) -> CalculationResult:
         """Calculate square root(s) and return all roots with multiple representations.
 
         Вычислить квадратный корень(и) и вернуть все корни с множественными представлениями.
 
+        With a token or a progress callback, roots from
+        MONITORED_STEPS_MIN_PRECISION digits on are taken in Newton steps,
+        between which the calculation can stop and report progress.
+
         Args:
-            value: Value for real mode
-                  Значение для режима действительных чисел
+            value: Value for real mode, possibly a fraction such as "1/3"
+                  Значение для режима действительных чисел, возможно дробь
+                  вида "1/3"
             real_part: Real part for complex mode
                       Действительная часть для режима комплексных чисел
             imag_part: Imaginary part for complex mode
                       Мнимая часть для режима комплексных чисел
+            token: Optional cancellation token
+                  Необязательный токен отмены
+            progress: Optional callback receiving the fraction done, called
+                      in the calculating thread
+                     Необязательная функция, получающая долю выполненного;
+                     вызывается в потоке вычисления
 
         Returns:
             CalculationResult with all roots and representations
             CalculationResult со всеми корнями и представлениями
+
+        Raises:
+            CalculationCancelledError: If the token is cancelled
+                                      Если токен отменён
+        """
+        with monitoring(token, progress):
+            return self._calculate(value, real_part, imag_part)
+
+    def _calculate(
+        self,
+        value: Union[int, float, str, Decimal, Fraction],
+        real_part: Union[int, float, str, None],
+        imag_part: Union[int, float, str, None],
+    ) -> CalculationResult:
+        """Calculate a real or complex result under the active monitor.
+
+        Вычислить действительный или комплексный результат под активным
+        монитором.
+
+        Args:
+            value: Value for real mode
+                  Значение для режима действительных чисел
+            real_part: Real part for complex mode
+                      Действительная часть для режима комплексных чисел
+            imag_part: Imaginary part for complex mode
+                      Мнимая часть для режима комплексных чисел
+
+        Returns:
+            CalculationResult with all roots
+            CalculationResult со всеми корнями
         """
         if real_part is not None or imag_part is not None:
             # Complex mode
@@ -314,144 +885,1369 @@ class SquareRootCalculator:
                 imag_part = 0
 
             input_str = self._format_complex_input(real_part, imag_part)
-            root1_real, root1_imag = self.sqrt_complex(real_part, imag_part)
-
-            # Both roots: +sqrt and -sqrt
-            roots = [(root1_real, root1_imag), (-root1_real, -root1_imag)]
-
-            return CalculationResult(input_str, roots, True, self.precision)
+            a, b = self._parse_complex_parts(real_part, imag_part)
+            if self.decimal_places:
+                return self._complex_to_places(input_str, a, b)
+            return self._calculate_complex(input_str, a, b, self._sqrt_complex_local)
         else:
             # Real mode
-            input_str = str(value)
-            root = self.sqrt_real(value)
-
-            # Both roots: +sqrt and -sqrt
-            roots = [(root, Decimal(0)), (-root, Decimal(0))]
+            if self.decimal_places:
+                return self._real_to_places(str(value), value)
+            return self._calculate_real(str(value), value)
 
-            return CalculationResult(input_str, roots, False, self.precision)
-
-    def _format_complex_input(
-        self, real: Union[int, float, str], imag: Union[int, float, str]
-    ) -> str:
-        """Format complex input for display.
+    def _planned_calculator(self, significant: int) -> "SquareRootCalculator":
+        """Get a calculator sharing this one's settings at other precision.
 
-        Форматировать комплексный ввод для отображения.
+        Получить калькулятор с настройками этого, но другой точностью.
 
         Args:
-            real: Real part
-                 Действительная часть
-            imag: Imaginary part
-                 Мнимая часть
+            significant: Number of significant digits
+                        Количество значащих цифр
 
         Returns:
-            Formatted string (e.g., "3+4i" or "3-4i")
-            Форматированная строка (напр., "3+4i" или "3-4i")
+            Calculator with the same engine and cache
+            Калькулятор с тем же движком и кэшем
         """
-        real_str = str(real)
-        imag_str = str(imag)
+        return SquareRootCalculator(significant, engine=self.engine, cache=self.cache)
 
-        if imag_str == "0":
-            return real_str
-
-        if imag_str.startswith("-"):
-            return f"{real_str}{imag_str}i"
-        else:
-            return f"{real_str}+{imag_str}i"
+    def _real_to_places(
+        self, input_str: str, value: Union[int, float, str, Decimal, Fraction]
+    ) -> CalculationResult:
+        """Calculate a real-mode result to ``precision`` decimal places.
 
-    def sqrt_real(self, value: Union[int, float, str, Decimal]) -> Decimal:
-        """Calculate square root of a real number.
+        Вычислить результат для режима действительных чисел с ``precision``
+        знаками после запятой.
 
-        Вычислить квадратный корень действительного числа.
+        The root is computed to exactly as many significant digits as it has
+        down to the last place, which already rounds it correctly; roots
+        below one unit of the last place need no root at all. Roots with more
+        than MAX_PLACES_INTEGER_DIGITS integer digits are computed to
+        ``precision`` significant digits instead.
 
         Args:
-            value: The number to calculate square root of
-                  Число для вычисления квадратного корня
+            input_str: Input as displayed
+                      Ввод в отображаемом виде
+            value: Real input, possibly a fraction such as "1/3"
+                  Действительный ввод, возможно дробь вида "1/3"
 
         Returns:
-            Square root as Decimal
-            Квадратный корень как Decimal
+            CalculationResult with +root and -root
+            CalculationResult с +корнем и -корнем
 
         Raises:
             InvalidInputError: If input is invalid or negative
                               Если ввод некорректен или отрицателен
         """
-        try:
-            num = Decimal(str(value))
-        except (ValueError, decimal.InvalidOperation) as e:
-            raise InvalidInputError(f"Invalid number format: {e}")
+        rational = self._parse_rational(value)
+        if rational is None or rational[1] == 1:
+            if rational is None:
+                num = self._parse_non_negative(value)
+            else:
+                num = self._rational_numerator(rational)
+            adjusted = num.adjusted() if num else 0
+        else:
+            numerator, denominator, exponent = rational
+            adjusted = fraction_adjusted(numerator, denominator) + exponent
 
-        if num < 0:
-            raise InvalidInputError(
-                "Cannot calculate square root of negative real number. Use complex mode."
-            )
+        significant = real_significant_digits(adjusted, self.precision)
+        if not fits_places(significant, self.precision):
+            result = self._calculate_real(input_str, value)
+            result.decimal_places = False
+            return result
+        if significant < 1:
+            if rational is None or rational[1] == 1:
+                exact = num
+            elif significant == 0:
+                exact = self._rational_value(rational)
+            else:
+                # Only a root one digit below the last place is compared
+                exact = _ZERO
+            root = round_small_root(exact, self.precision, significant)
+            return self._real_result(input_str, root, None)
 
-        return num.sqrt()
+        result = self._planned_calculator(significant)._calculate_real(input_str, value)
+        root = round_to_places(result.roots[0][0], self.precision)
+        return self._places_result(result, root, _ZERO, result.is_exact)
 
-    def sqrt_complex(
-        self, real: Union[int, float, str], imag: Union[int, float, str] = 0
-    ) -> tuple[Decimal, Decimal]:
-        """Calculate square root of a complex number.
+    def _complex_to_places(
+        self, input_str: str, a: Decimal, b: Decimal
+    ) -> CalculationResult:
+        """Calculate a complex-mode result to ``precision`` decimal places.
 
-        Вычислить квадратный корень комплексного числа.
+        Вычислить результат для режима комплексных чисел с ``precision``
+        знаками после запятой.
+
+        The parts are computed with PLACES_GUARD_DIGITS digits below the
+        last place and rounded once both ends of their error bound round
+        alike; otherwise the guard doubles, up to PLACES_MAX_ATTEMPTS times.
+        Like real roots, roots too long for places keep ``precision``
+        significant digits.
 
         Args:
-            real: Real part of the complex number
-                 Действительная часть комплексного числа
-            imag: Imaginary part of the complex number
-                 Мнимая часть комплексного числа
+            input_str: Input as displayed
+                      Ввод в отображаемом виде
+            a: Real part
+              Действительная часть
+            b: Imaginary part
+              Мнимая часть
 
         Returns:
-            Tuple of (real_part, imaginary_part) of the result
-            Кортеж (действительная_часть, мнимая_часть) результата
+            CalculationResult with +root and -root
+            CalculationResult с +корнем и -корнем
+        """
+        if not (a.is_finite() and b.is_finite()):
+            return self._calculate_complex(input_str, a, b, self._sqrt_complex_local)
+
+        if (a or b) and not fits_places(
+            complex_significant_digits(a, b, self.precision, 0), self.precision
+        ):
+            result = self._calculate_complex(input_str, a, b, self._sqrt_complex_local)
+            result.decimal_places = False
+            return result
 
-        Raises:
+        guard = PLACES_GUARD_DIGITS
+        for _ in range(PLACES_MAX_ATTEMPTS):
+            significant = (
+                complex_significant_digits(a, b, self.precision, guard) if a or b else 1
+            )
+            planned = self._planned_calculator(significant)
+            result = planned._calculate_complex(
+                input_str, a, b, planned._sqrt_complex_local
+            )
+            # Neither part has a digit above the root's bound, so both are
+            # rounded at or below 10**-(precision + guard)
+            tolerance = (
+                _ZERO
+                if result.is_exact
+                else Decimal((0, (1,), -self.precision - guard))
+            )
+            parts = [
+                round_to_places(part, self.precision, tolerance)
+                for part in result.roots[0]
+            ]
+            if None not in parts:
+                break
+            guard *= 2
+        else:
+            # Only a root within the last bound of a tie gets here
+            parts = [round_to_places(part, self.precision) for part in result.roots[0]]
+
+        real, imag = parts
+        is_exact = result.is_exact and (real, imag) == result.roots[0]
+        return self._places_result(result, real, imag, is_exact)
+
+    def _places_result(
+        self,
+        result: CalculationResult,
+        real: Decimal,
+        imag: Decimal,
+        is_exact: bool,
+    ) -> CalculationResult:
+        """Build a result to decimal places from a planned result.
+
+        Построить результат со знаками после запятой из запланированного.
+
+        Args:
+            result: Result computed to the planned significant digits
+                   Результат, вычисленный с запланированными значащими цифрами
+            real: Real part of the rounded principal root
+                 Действительная часть округлённого главного корня
+            imag: Imaginary part of the rounded principal root
+                 Мнимая часть округлённого главного корня
+            is_exact: Whether the rounded root is exact
+                     Является ли округлённый корень точным
+
+        Returns:
+            CalculationResult with +root and -root
+            CalculationResult с +корнем и -корнем
+        """
+        negative_imag = imag.copy_negate() if result.is_complex else _ZERO
+        return CalculationResult(
+            result.input_value,
+            [(real, imag), (real.copy_negate(), negative_imag)],
+            result.is_complex,
+            self.precision,
+            result.integer_root,
+            is_exact,
+            self.decimal_places,
+            result.complex_parts,
+        )
+
+    def _cached_root(
+        self,
+        mode: str,
+        normalized: Union[str, tuple],
+        compute: Callable[[Optional[tuple]], Tuple[Decimal, Decimal]],
+    ) -> Tuple[Decimal, Decimal]:
+        """Get a principal root from the cache or compute and store it.
+
+        Получить главный корень из кэша или вычислить и сохранить его.
+
+        Args:
+            mode: MODE_REAL or MODE_COMPLEX
+                 MODE_REAL или MODE_COMPLEX
+            normalized: Canonical form of the parsed input
+                       Каноническая форма разобранного ввода
+            compute: Function computing the (real, imaginary) root from an
+                     optional lower-precision seed root
+                    Функция, вычисляющая корень (действительная, мнимая части)
+                    от необязательного корня меньшей точности
+
+        Returns:
+            Principal root as (real, imaginary)
+            Главный корень как (действительная, мнимая части)
+        """
+        if self.cache is None:
+            return compute(None)
+
+        key = (mode, normalized, self.precision)
+        root = self.cache.get(key)
+        if root is None:
+            start = time.perf_counter()
+            root = self._round_higher_precision_root(key)
+            if root is None:
+                seed = self.cache.get_lower_precision(key)
+                root = compute(seed and seed[1])
+            self.cache.put(key, root, time.perf_counter() - start)
+        return root
+
+    def _round_higher_precision_root(
+        self, key: tuple
+    ) -> Optional[Tuple[Decimal, Decimal]]:
+        """Answer a cache miss by rounding a cached higher-precision root.
+
+        Ответить на промах кэша округлением корня с более высокой точностью.
+
+        Args:
+            key: Cache key (mode, normalized input, precision)
+                Ключ кэша (режим, нормализованный ввод, точность)
+
+        Returns:
+            Root rounded to the calculator precision, or None if there is no
+            usable higher-precision entry
+            Корень, округлённый до точности калькулятора, или None, если
+            подходящей записи с более высокой точностью нет
+        """
+        found = self.cache.get_higher_precision(key)
+        if found is None:
+            return None
+        _, (real, imag) = found
+
+        # A cached digit string ending in an exact half at this precision may
+        # stem from a true root slightly below or above it; only an exact
+        # root can be rounded safely in that case
+        if key[0] == MODE_COMPLEX:
+            if self._ends_in_half(real) or self._ends_in_half(imag):
+                return None
+            return self.context.plus(real), self.context.plus(imag)
+
+        if self._ends_in_half(real):
+            # Fractions are cached under their normalized "p/q" form, whose
+            # denominator is coprime to 10, so their roots are never exact
+            if "/" in key[1] or EXACT_CONTEXT.multiply(real, real) != Decimal(key[1]):
+                return None
+        return self.context.plus(real), _ZERO
+
+    def _ends_in_half(self, value: Decimal) -> bool:
+        """Check whether digits past the precision are exactly one half.
+
+        Проверить, равны ли цифры за пределами точности ровно половине.
+
+        Args:
+            value: Cached root or part of a root
+                  Кэшированный корень или часть корня
+
+        Returns:
+            True if the dropped digits are 5 followed only by zeros
+            True, если отбрасываемые цифры - 5 и только нули за ней
+        """
+        tail = value.as_tuple().digits[self.precision :]
+        return bool(tail) and tail[0] == 5 and not any(tail[1:])
+
+    def calculate_many(
+        self,
+        values: Iterable[Union[int, float, str, Decimal, complex, tuple]],
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+        token: Optional[CancellationToken] = None,
+    ) -> Iterator[CalculationResult]:
+        """Calculate square roots of many inputs, yielding results lazily.
+
+        Вычислить квадратные корни многих значений, выдавая результаты лениво.
+
+        Real inputs are given as plain values, complex inputs as ``complex``
+        objects or ``(real, imag)`` tuples. Inputs are consumed ``chunk_size``
+        at a time and each chunk is computed under a single decimal context.
+
+        Args:
+            values: Iterable of real or complex inputs
+                   Итерируемый набор действительных или комплексных значений
+            chunk_size: Number of inputs computed per chunk
+                       Количество значений, вычисляемых за один блок
+            token: Optional cancellation token, checked between inputs
+                  Необязательный токен отмены, проверяемый между значениями
+
+        Yields:
+            CalculationResult for each input, in input order
+            CalculationResult для каждого значения в порядке ввода
+
+        Raises:
+            InvalidInputError: If chunk_size is less than 1 or an input is invalid
+                              Если chunk_size меньше 1 или ввод некорректен
+            CalculationCancelledError: If the token is cancelled
+                                      Если токен отменён
+        """
+        if chunk_size < 1:
+            raise InvalidInputError("Chunk size must be at least 1")
+
+        iterator = iter(values)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                return
+            # Compute the whole chunk before yielding so the local context
+            # and the monitor are never left active in the caller's thread
+            with monitoring(token):
+                results = self._calculate_chunk(chunk)
+            yield from results
+
+    def _calculate_chunk(self, chunk: list) -> List[CalculationResult]:
+        """Calculate one chunk of batch inputs under the calculator context.
+
+        Вычислить один блок пакетных значений в контексте калькулятора.
+
+        Args:
+            chunk: Real or complex inputs
+                  Действительные или комплексные значения
+
+        Returns:
+            Results in input order
+            Результаты в порядке ввода
+        """
+        results = []
+        with decimal.localcontext(self.context):
+            for item in chunk:
+                checkpoint()
+                if isinstance(item, (tuple, complex)):
+                    real, imag = (
+                        (item.real, item.imag) if isinstance(item, complex) else item
+                    )
+                    a, b = self._parse_complex_parts(real, imag)
+                    input_str = self._format_complex_input(real, imag)
+                    if self.decimal_places:
+                        results.append(self._complex_to_places(input_str, a, b))
+                    else:
+                        results.append(
+                            self._calculate_complex(
+                                input_str, a, b, self._sqrt_complex_decimal
+                            )
+                        )
+                else:
+                    input_str = item if isinstance(item, str) else str(item)
+                    if self.decimal_places:
+                        results.append(self._real_to_places(input_str, item))
+                    else:
+                        results.append(self._calculate_real(input_str, item))
+        return results
+
+    def _calculate_complex(
+        self,
+        input_str: str,
+        a: Decimal,
+        b: Decimal,
+        compute: Callable[
+            [Decimal, Decimal, Optional[Tuple[Decimal, Decimal]]],
+            Tuple[Decimal, Decimal],
+        ],
+    ) -> CalculationResult:
+        """Calculate a complex-mode result, exactly when the root is rational.
+
+        Вычислить результат для режима комплексных чисел, точно, если корень
+        рационален.
+
+        Args:
+            input_str: Input as displayed
+                      Ввод в отображаемом виде
+            a: Real part
+              Действительная часть
+            b: Imaginary part
+              Мнимая часть
+            compute: Rounded complex square root taking a, b and a seed
+                    Округлённый комплексный корень от a, b и начального значения
+
+        Returns:
+            CalculationResult with +root and -root
+            CalculationResult с +корнем и -корнем
+        """
+        exact = self._exact_complex_root(a, b)
+        if exact is not None:
+            return self._complex_result(input_str, a, b, *exact, is_exact=True)
+
+        root_real, root_imag = self._cached_root(
+            MODE_COMPLEX, (str(a), str(b)), lambda seed: compute(a, b, seed)
+        )
+        return self._complex_result(input_str, a, b, root_real, root_imag)
+
+    def _calculate_real(
+        self, input_str: str, value: Union[int, float, str, Decimal, Fraction]
+    ) -> CalculationResult:
+        """Calculate a real-mode result through the result cache.
+
+        Вычислить результат для режима действительных чисел через кэш результатов.
+
+        Args:
+            input_str: Input as displayed
+                      Ввод в отображаемом виде
+            value: Real input, possibly a fraction such as "1/3"
+                  Действительный ввод, возможно дробь вида "1/3"
+
+        Returns:
+            CalculationResult with +root and -root
+            CalculationResult с +корнем и -корнем
+
+        Raises:
+            InvalidInputError: If input is invalid or negative
+                              Если ввод некорректен или отрицателен
+        """
+        rational = self._parse_rational(value)
+        if rational is not None and rational[1] != 1:
+            normalized = (
+                f"{self._rational_numerator(rational)}/{integer_to_str(rational[1])}"
+            )
+            root, _ = self._cached_root(
+                MODE_REAL,
+                normalized,
+                lambda seed: (self._sqrt_fraction(rational), _ZERO),
+            )
+            # A denominator coprime to 10 leaves a root that never terminates
+            return self._real_result(input_str, root, None)
+
+        if rational is not None:
+            num = self._rational_numerator(rational)
+        else:
+            num = self._parse_non_negative(value)
+        root, _ = self._cached_root(
+            MODE_REAL,
+            str(num),
+            lambda seed: (self._sqrt_real_decimal(num, seed and seed[0]), _ZERO),
+        )
+        return self._real_result(
+            input_str, root, num, EXACT_CONTEXT.multiply(root, root) == num
+        )
+
+    def _real_result(
+        self,
+        input_str: str,
+        root: Decimal,
+        num: Optional[Decimal],
+        is_exact: bool = False,
+    ) -> CalculationResult:
+        """Build a real-mode result with both roots.
+
+        Построить результат для режима действительных чисел с обоими корнями.
+
+        Args:
+            input_str: Input as displayed
+                      Ввод в отображаемом виде
+            root: Principal square root
+                 Главный квадратный корень
+            num: Parsed input, or None for a non-integral fraction
+                Разобранный ввод или None для нецелой дроби
+            is_exact: Whether the root is exact
+                     Является ли корень точным
+
+        Returns:
+            CalculationResult with +root and -root
+            CalculationResult с +корнем и -корнем
+        """
+        # Both roots: +sqrt and -sqrt
+        roots = [(root, _ZERO), (root.copy_negate(), _ZERO)]
+        integer_root = None
+        if num is not None and num.adjusted() < MAX_INTEGER_REPRESENTATION_DIGITS:
+            value = self._as_integral(num)
+            integer_root = None if value is None else IntegerSquareRoot(value)
+        return CalculationResult(
+            input_str,
+            roots,
+            False,
+            self.precision,
+            integer_root,
+            is_exact,
+            self.decimal_places,
+        )
+
+    def _complex_result(
+        self,
+        input_str: str,
+        a: Decimal,
+        b: Decimal,
+        root_real: Decimal,
+        root_imag: Decimal,
+        is_exact: bool = False,
+    ) -> CalculationResult:
+        """Build a complex-mode result with both roots.
+
+        Построить результат для режима комплексных чисел с обоими корнями.
+
+        Args:
+            input_str: Input as displayed
+                      Ввод в отображаемом виде
+            a: Real part of the input
+              Действительная часть ввода
+            b: Imaginary part of the input
+              Мнимая часть ввода
+            root_real: Real part of the principal root
+                      Действительная часть главного корня
+            root_imag: Imaginary part of the principal root
+                      Мнимая часть главного корня
+            is_exact: Whether the root is exact
+                     Является ли корень точным
+
+        Returns:
+            CalculationResult with +root and -root
+            CalculationResult с +корнем и -корнем
+        """
+        # Both roots: +sqrt and -sqrt
+        roots = [
+            (root_real, root_imag),
+            (root_real.copy_negate(), root_imag.copy_negate()),
+        ]
+        return CalculationResult(
+            input_str,
+            roots,
+            True,
+            self.precision,
+            is_exact=is_exact,
+            decimal_places=self.decimal_places,
+            complex_parts=(a, b),
+        )
+
+    def _format_complex_input(
+        self, real: Union[int, float, str], imag: Union[int, float, str]
+    ) -> str:
+        """Format complex input for display.
+
+        Форматировать комплексный ввод для отображения.
+
+        Args:
+            real: Real part
+                 Действительная часть
+            imag: Imaginary part
+                 Мнимая часть
+
+        Returns:
+            Formatted string (e.g., "3+4i" or "3-4i")
+            Форматированная строка (напр., "3+4i" или "3-4i")
+        """
+        real_str = str(real)
+        imag_str = str(imag)
+
+        if imag_str == "0":
+            return real_str
+
+        if imag_str.startswith("-"):
+            return f"{real_str}{imag_str}i"
+        else:
+            return f"{real_str}+{imag_str}i"
+
+    def sqrt_real(
+        self,
+        value: Union[int, float, str, Decimal, Fraction],
+        seed: Optional[Decimal] = None,
+        token: Optional[CancellationToken] = None,
+        progress: Optional[Callable[[float], None]] = None,
+    ) -> Decimal:
+        """Calculate square root of a real number.
+
+        Вычислить квадратный корень действительного числа.
+
+        Args:
+            value: The number to calculate square root of, possibly a
+                  fraction such as "1/3"
+                  Число для вычисления квадратного корня, возможно дробь
+                  вида "1/3"
+            seed: Optional lower-precision root of the same value to refine
+                 Необязательный корень того же числа меньшей точности для уточнения
+            token: Optional cancellation token, checked between Newton steps
+                  Необязательный токен отмены, проверяемый между шагами Ньютона
+            progress: Optional callback receiving the fraction done
+                     Необязательная функция, получающая долю выполненного
+
+        Returns:
+            Square root as Decimal
+            Квадратный корень как Decimal
+
+        Raises:
+            InvalidInputError: If input is invalid or negative
+                              Если ввод некорректен или отрицателен
+            CalculationCancelledError: If the token is cancelled
+                                      Если токен отменён
+        """
+        with monitoring(token, progress):
+            rational = self._parse_rational(value)
+            if rational is not None:
+                if rational[1] == 1:
+                    return self._sqrt_real_decimal(
+                        self._rational_numerator(rational), seed
+                    )
+                return self._sqrt_fraction(rational)
+            return self._sqrt_real_decimal(self._parse_non_negative(value), seed)
+
+    def _sqrt_fraction(self, rational: Tuple[int, int, int]) -> Decimal:
+        """Calculate the square root of a non-negative fraction.
+
+        Вычислить квадратный корень неотрицательной дроби.
+
+        sqrt(p/q * 10**e) is sqrt(p/q * 10**(e mod 2)) * 10**(e // 2), and
+        the first root is computed from p and q directly, so the work depends
+        on the sizes of the coefficients and not on the exponent or on a
+        decimal expansion of the quotient. When both terms are perfect
+        squares the root is their quotient.
+
+        Args:
+            rational: Result of ``_parse_rational``
+                     Результат ``_parse_rational``
+
+        Returns:
+            Square root rounded to the calculator precision
+            Квадратный корень, округлённый до точности калькулятора
+        """
+        numerator, denominator, exponent = rational
+        half, odd = divmod(exponent, 2)
+        numerator *= 10**odd
+        exact = square_fraction_root(numerator, denominator)
+        if exact is not None:
+            context = decimal.Context(
+                prec=self.precision, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+            )
+            root = context.divide(
+                integer_to_decimal(exact[0]), integer_to_decimal(exact[1])
+            )
+        else:
+            root = self._monitored_fraction_root(numerator, denominator)
+            if root is None:
+                root = rational_sqrt(
+                    numerator, denominator, self.precision
+                ).to_decimal()
+        return EXACT_CONTEXT.scaleb(root, half)
+
+    def _monitored_fraction_root(
+        self, numerator: int, denominator: int
+    ) -> Optional[Decimal]:
+        """Calculate an irrational fraction root in steps that can be cancelled.
+
+        Вычислить иррациональный корень дроби шагами, которые можно отменить.
+
+        ``rational_sqrt`` divides and takes the root of the full terms in two
+        single calls, so a monitored calculation refines the root of the
+        quotient in Newton steps instead, like ``_monitored_seed`` does for
+        decimal inputs.
+
+        Args:
+            numerator: Positive numerator coprime to the denominator
+                      Положительный числитель, взаимно простой со знаменателем
+            denominator: Positive denominator; not both terms are squares
+                        Положительный знаменатель; не оба члена - квадраты
+
+        Returns:
+            Root rounded to the calculator precision, or None if the
+            calculation is not monitored or short or the check failed
+            Корень, округлённый до точности калькулятора, или None, если
+            вычисление не отслеживается, коротко или проверка не прошла
+        """
+        if self.precision < MONITORED_STEPS_MIN_PRECISION or not is_monitored():
+            return None
+        # Converting a term is the only step not split into checkpoints
+        terms = []
+        for term in (numerator, denominator):
+            checkpoint()
+            terms.append(integer_to_decimal(term))
+        context = decimal.Context(
+            prec=NEWTON_SEED_DIGITS, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+        )
+        seed = context.sqrt(context.divide(*terms))
+        return refine_fraction_root(*terms, seed, self.precision)
+
+    def _sqrt_real_decimal(
+        self, num: Decimal, seed: Optional[Decimal] = None
+    ) -> Decimal:
+        """Calculate the square root of a parsed non-negative Decimal.
+
+        Вычислить квадратный корень разобранного неотрицательного Decimal.
+
+        Args:
+            num: Non-negative value
+                Неотрицательное значение
+            seed: Optional lower-precision root to refine with Newton steps
+                 Необязательный корень меньшей точности для уточнения
+                 методом Ньютона
+
+        Returns:
+            Square root with the selected engine
+            Квадратный корень выбранным движком
+        """
+        if seed is None:
+            seed = self._monitored_seed(num)
+
+        # Inside the context range the engine takes the value as it is
+        if self.context.Emin <= num.adjusted() <= self.context.Emax:
+            return self._sqrt_mantissa(num, seed, 0)
+
+        # sqrt(m * 10**(2k)) = sqrt(m) * 10**k: only the mantissa reaches the
+        # engine, so the exponent costs nothing and may exceed the context Emax
+        half = num.as_tuple().exponent // 2
+        mantissa = EXACT_CONTEXT.scaleb(num, -2 * half)
+        return EXACT_CONTEXT.scaleb(self._sqrt_mantissa(mantissa, seed, half), half)
+
+    def _monitored_seed(self, num: Decimal) -> Optional[Decimal]:
+        """Get a short seed root so a monitored calculation runs in Newton steps.
+
+        Получить короткий начальный корень, чтобы отслеживаемое вычисление
+        шло шагами Ньютона.
+
+        Newton steps from a NEWTON_SEED_DIGITS root are no slower than an
+        integer root and can stop between steps, unlike a single call.
+
+        Args:
+            num: Non-negative value
+                Неотрицательное значение
+
+        Returns:
+            Seed root, or None if the calculation is not monitored or short
+            Начальный корень или None, если вычисление не отслеживается
+            или коротко
+        """
+        if (
+            self.precision < MONITORED_STEPS_MIN_PRECISION
+            or not num
+            or not num.is_finite()
+            or not is_monitored()
+        ):
+            return None
+        context = decimal.Context(
+            prec=NEWTON_SEED_DIGITS, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+        )
+        return context.sqrt(num)
+
+    def _sqrt_mantissa(
+        self, num: Decimal, seed: Optional[Decimal], half: int
+    ) -> Decimal:
+        """Calculate the square root of a mantissa with the selected engine.
+
+        Вычислить квадратный корень мантиссы выбранным движком.
+
+        Args:
+            num: Non-negative value in the context range, or a mantissa
+                with exponent 0 or 1
+                Неотрицательное значение в диапазоне контекста или мантисса
+                с показателем 0 или 1
+            seed: Optional lower-precision root of the unscaled value
+                 Необязательный корень меньшей точности исходного значения
+            half: Power of ten split off the root
+                 Степень десяти, отделённая от корня
+
+        Returns:
+            Square root of the mantissa
+            Квадратный корень мантиссы
+        """
+        if self._can_refine(num, seed):
+            root = refine_real_root(
+                num, EXACT_CONTEXT.scaleb(seed, -half), self.precision
+            )
+            if root is not None:
+                return root
+
+        return self._backend_for(num, self.precision).sqrt(num, self.context)
+
+    def sqrt_real_fixed(self, value: Union[int, float, str, Decimal]) -> FixedPointRoot:
+        """Calculate square root of a real number as a fixed-point integer.
+
+        Вычислить квадратный корень действительного числа как целое
+        с фиксированной точкой.
+
+        The result is rounded to the calculator precision exactly like
+        ``Decimal.sqrt`` but never touches a decimal context, so it stays
+        cheap at very high precision. Convert with ``to_decimal()`` on demand.
+
+        Args:
+            value: The number to calculate square root of
+                  Число для вычисления квадратного корня
+
+        Returns:
+            Square root as FixedPointRoot
+            Квадратный корень как FixedPointRoot
+
+        Raises:
+            InvalidInputError: If input is invalid or negative
+                              Если ввод некорректен или отрицателен
+        """
+        num = self._parse_non_negative(value)
+        coefficient, exponent = decimal_to_integer_parts(num)
+        return fixed_point_sqrt(coefficient, exponent, self.precision)
+
+    def iter_sqrt_real_digits(
+        self,
+        value: Union[int, float, str, Decimal],
+        decimal_places: Optional[int] = None,
+        chunk_size: int = DEFAULT_DIGIT_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        """Stream the decimal digits of a real square root as they are found.
+
+        Выдавать десятичные цифры действительного квадратного корня по мере
+        их нахождения.
+
+        Joining the chunks gives the root truncated (not rounded) to
+        ``decimal_places`` fractional digits, e.g. "1", ".4142", "1356".
+        Exact roots stop early without trailing zeros.
+
+        Args:
+            value: The number to calculate square root of
+                  Число для вычисления квадратного корня
+            decimal_places: Fractional digits to produce (default: precision)
+                           Количество дробных цифр (по умолчанию: точность)
+            chunk_size: Maximum number of digits per chunk
+                       Максимальное количество цифр в блоке
+
+        Yields:
+            Digit strings; the first fractional chunk starts with "."
+            Строки цифр; первый дробный блок начинается с "."
+
+        Raises:
+            InvalidInputError: If input is invalid or negative, or chunk_size
+                               is less than 1
+                              Если ввод некорректен или отрицателен, либо
+                              chunk_size меньше 1
+        """
+        if chunk_size < 1:
+            raise InvalidInputError("Chunk size must be at least 1")
+        if decimal_places is None:
+            decimal_places = self.precision
+
+        coefficient, exponent = decimal_to_integer_parts(
+            self._parse_non_negative(value)
+        )
+        return iter_sqrt_digits(coefficient, exponent, decimal_places, chunk_size)
+
+    def sqrt_integer(self, value: Union[int, str, Decimal]) -> IntegerSquareRoot:
+        """Calculate the exact floor square root of a non-negative integer.
+
+        Вычислить точную целую часть квадратного корня неотрицательного целого.
+
+        No rounding to the calculator precision happens. Most non-squares
+        are recognized by cheap residue filters on the decimal input before
+        it is converted to int, and the floor root is only computed when it
+        is first read.
+
+        Args:
+            value: Non-negative integer, possibly as a string such as "1E+6"
+                  Неотрицательное целое число, возможно строкой вида "1E+6"
+
+        Returns:
+            IntegerSquareRoot with root, remainder and is_perfect_square
+            IntegerSquareRoot с корнем, остатком и признаком полного квадрата
+
+        Raises:
+            InvalidInputError: If input is invalid, negative or not an integer
+                              Если ввод некорректен, отрицателен или не целый
+        """
+        if isinstance(value, int) and not isinstance(value, bool):
+            if value < 0:
+                raise InvalidInputError(
+                    "Cannot calculate square root of negative number"
+                )
+            return IntegerSquareRoot(value)
+
+        integer = self._as_integral(self._parse_non_negative(value))
+        if integer is None:
+            raise InvalidInputError("Integer mode requires an integer input")
+        return IntegerSquareRoot(integer)
+
+    @staticmethod
+    def _as_integral(num: Decimal) -> Optional[Decimal]:
+        """Check that a Decimal is an integer without converting it to int.
+
+        Проверить, что Decimal целое, не преобразуя его в int.
+
+        The value stays in decimal form so that the residue filters of
+        IntegerSquareRoot can reject most non-squares before the conversion.
+
+        Args:
+            num: Finite Decimal value
+                Конечное значение Decimal
+
+        Returns:
+            ``num`` itself, or None if it has a fractional part
+            Само ``num`` или None, если у него есть дробная часть
+        """
+        if num.adjusted() < 0:
+            # Below one, only zero is an integer
+            return None if num else _ZERO
+        if EXACT_CONTEXT.to_integral_value(num) != num:
+            return None
+        return num
+
+    def _parse_rational(
+        self, value: Union[int, float, str, Decimal, Fraction], reduce: bool = True
+    ) -> Optional[Tuple[int, int, int]]:
+        """Parse a fraction input such as "1/3", "2.5/7" or "1/1e2000000".
+
+        Разобрать ввод-дробь вида "1/3", "2.5/7" или "1/1e2000000".
+
+        Powers of ten are split off the terms into an exponent, as for
+        decimal inputs, so only the coefficients become integers. Factors 2
+        and 5 of the denominator are moved into the numerator and exponent,
+        which leaves one normal form per value; a denominator of 1 then means
+        the input is a plain decimal.
+
+        Args:
+            value: Input value
+                  Входное значение
+            reduce: Whether to divide the terms by their gcd; unreduced terms
+                   are enough to size them and skip its quadratic cost
+                   Делить ли члены на их НОД; несокращённых членов достаточно
+                   для оценки их размера без квадратичной цены НОД
+
+        Returns:
+            Tuple (p, q, e) of the value p/q * 10**e with p and q coprime, p
+            without trailing zeros and q coprime to 10, or None if the input
+            is not written as a fraction
+            Кортеж (p, q, e) значения p/q * 10**e, где p и q взаимно просты,
+            p без конечных нулей, а q взаимно просто с 10, или None, если
+            ввод не записан как дробь
+
+        Raises:
+            InvalidInputError: If the fraction is invalid or negative
+                              Если дробь некорректна или отрицательна
+        """
+        if isinstance(value, Fraction):
+            numerator, denominator, exponent = value.numerator, value.denominator, 0
+        elif isinstance(value, str) and "/" in value:
+            terms = value.split("/")
+            if len(terms) != 2:
+                raise InvalidInputError(f"Invalid number format: {value}")
+            (numerator, top), (denominator, bottom) = (
+                decimal_to_integer_parts(
+                    EXACT_CONTEXT.normalize(self._parse_finite(term))
+                )
+                for term in terms
+            )
+            if not denominator:
+                raise InvalidInputError("Denominator must not be zero")
+            exponent = top - bottom
+            if reduce:
+                divisor = math.gcd(numerator, denominator)
+                numerator //= divisor
+                denominator //= divisor
+        else:
+            return None
+
+        if numerator and (numerator < 0) != (denominator < 0):
+            raise InvalidInputError(
+                "Cannot calculate square root of negative real number. Use complex mode."
+            )
+        numerator, denominator = abs(numerator), abs(denominator)
+        if not numerator:
+            return 0, 1, 0
+
+        # p/(2**a * 5**b * q) = p * 2**(k-a) * 5**(k-b) / q * 10**-k, k = max(a, b)
+        twos = (denominator & -denominator).bit_length() - 1
+        fives = 0
+        while denominator % 5 == 0:
+            denominator //= 5
+            fives += 1
+        denominator >>= twos
+        shift = max(twos, fives)
+        numerator *= 2 ** (shift - twos) * 5 ** (shift - fives)
+        exponent -= shift
+        while numerator % 10 == 0:
+            numerator //= 10
+            exponent += 1
+        return numerator, denominator, exponent
+
+    @staticmethod
+    def _rational_numerator(rational: Tuple[int, int, int]) -> Decimal:
+        """Get p * 10**e of a parsed fraction as an exact Decimal.
+
+        Получить p * 10**e разобранной дроби как точное Decimal.
+
+        Args:
+            rational: Result of ``_parse_rational``
+                     Результат ``_parse_rational``
+
+        Returns:
+            Numerator with the exponent, the value itself if q is 1
+            Числитель с показателем; само значение, если q равно 1
+        """
+        numerator, _, exponent = rational
+        return EXACT_CONTEXT.scaleb(integer_to_decimal(numerator), exponent)
+
+    @staticmethod
+    def _rational_value(rational: Tuple[int, int, int]) -> Fraction:
+        """Get the exact value of a parsed fraction.
+
+        Получить точное значение разобранной дроби.
+
+        Only for exponents of moderate size, which ``10**e`` expands.
+
+        Args:
+            rational: Result of ``_parse_rational``
+                     Результат ``_parse_rational``
+
+        Returns:
+            p/q * 10**e as a Fraction
+            p/q * 10**e как Fraction
+        """
+        numerator, denominator, exponent = rational
+        return Fraction(numerator, denominator) * Fraction(10) ** exponent
+
+    @staticmethod
+    def _parse_finite(text: str) -> Decimal:
+        """Parse one term of a fraction.
+
+        Разобрать один член дроби.
+
+        Args:
+            text: Term text
+                 Текст члена
+
+        Returns:
+            Finite Decimal value
+            Конечное значение Decimal
+
+        Raises:
+            InvalidInputError: If the term is not a finite number
+                              Если член не является конечным числом
+        """
+        try:
+            num = Decimal(text.strip())
+        except decimal.InvalidOperation as e:
+            raise InvalidInputError(f"Invalid number format: {e}")
+        if not num.is_finite():
+            raise InvalidInputError(f"Invalid number format: {text}")
+        return num
+
+    def _parse_non_negative(self, value: Union[int, float, str, Decimal]) -> Decimal:
+        """Parse a real input and check that it is not negative.
+
+        Разобрать действительный ввод и проверить, что он неотрицателен.
+
+        Args:
+            value: Input value
+                  Входное значение
+
+        Returns:
+            Parsed Decimal value
+            Разобранное значение Decimal
+
+        Raises:
+            InvalidInputError: If input is invalid or negative
+                              Если ввод некорректен или отрицателен
+        """
+        try:
+            if isinstance(value, (int, Decimal)):
+                num = Decimal(value)
+            else:
+                num = Decimal(str(value))
+        except (ValueError, decimal.InvalidOperation) as e:
+            raise InvalidInputError(f"Invalid number format: {e}")
+
+        if not num.is_finite():
+            raise InvalidInputError(f"Invalid number format: {value}")
+
+        if num < 0:
+            raise InvalidInputError(
+                "Cannot calculate square root of negative real number. Use complex mode."
+            )
+
+        return num
+
+    def sqrt_complex(
+        self,
+        real: Union[int, float, str],
+        imag: Union[int, float, str] = 0,
+        seed: Optional[Tuple[Decimal, Decimal]] = None,
+        token: Optional[CancellationToken] = None,
+        progress: Optional[Callable[[float], None]] = None,
+    ) -> tuple[Decimal, Decimal]:
+        """Calculate square root of a complex number.
+
+        Вычислить квадратный корень комплексного числа.
+
+        Args:
+            real: Real part of the complex number
+                 Действительная часть комплексного числа
+            imag: Imaginary part of the complex number
+                 Мнимая часть комплексного числа
+            seed: Optional lower-precision (real, imaginary) root to refine
+                 Необязательный корень (действительная, мнимая части)
+                 меньшей точности для уточнения
+            token: Optional cancellation token, checked between Newton steps
+                  Необязательный токен отмены, проверяемый между шагами Ньютона
+            progress: Optional callback receiving the fraction done
+                     Необязательная функция, получающая долю выполненного
+
+        Returns:
+            Tuple of (real_part, imaginary_part) of the result
+            Кортеж (действительная_часть, мнимая_часть) результата
+
+        Raises:
             InvalidInputError: If input is invalid
                               Если ввод некорректен
-            CalculatorError: If precision is too low for the calculation
-                           Если точность слишком низкая для вычисления
+            CalculationCancelledError: If the token is cancelled
+                                      Если токен отменён
+        """
+        with monitoring(token, progress):
+            a, b = self._parse_complex_parts(real, imag)
+            exact = self._exact_complex_root(a, b)
+            if exact is not None:
+                return exact
+            return self._sqrt_complex_local(a, b, seed)
+
+    @staticmethod
+    def _exact_complex_root(
+        a: Decimal, b: Decimal
+    ) -> Optional[Tuple[Decimal, Decimal]]:
+        """Find the exact root of a finite complex input, if it is rational.
+
+        Найти точный корень конечного комплексного ввода, если он рационален.
+
+        Args:
+            a: Real part
+              Действительная часть
+            b: Imaginary part
+              Мнимая часть
+
+        Returns:
+            Tuple (real_part, imaginary_part), or None
+            Кортеж (действительная_часть, мнимая_часть) или None
+        """
+        if not (a.is_finite() and b.is_finite()):
+            return None
+        return exact_complex_root(a, b)
+
+    def _sqrt_complex_local(
+        self, a: Decimal, b: Decimal, seed: Optional[Tuple[Decimal, Decimal]] = None
+    ) -> tuple[Decimal, Decimal]:
+        """Calculate the complex square root under the calculator context.
+
+        Вычислить комплексный квадратный корень в контексте калькулятора.
+
+        Args:
+            a: Real part of the complex number
+              Действительная часть комплексного числа
+            b: Imaginary part of the complex number
+              Мнимая часть комплексного числа
+            seed: Optional lower-precision root to refine
+                 Необязательный корень меньшей точности для уточнения
+
+        Returns:
+            Tuple of (real_part, imaginary_part) of the result
+            Кортеж (действительная_часть, мнимая_часть) результата
+        """
+        with decimal.localcontext(self.context):
+            return self._sqrt_complex_decimal(a, b, seed)
+
+    def _parse_complex_parts(
+        self, real: Union[int, float, str], imag: Union[int, float, str]
+    ) -> tuple[Decimal, Decimal]:
+        """Parse the real and imaginary parts of a complex input.
+
+        Разобрать действительную и мнимую части комплексного ввода.
+
+        Args:
+            real: Real part
+                 Действительная часть
+            imag: Imaginary part
+                 Мнимая часть
+
+        Returns:
+            Tuple of parsed Decimal parts
+            Кортеж разобранных частей Decimal
+
+        Raises:
+            InvalidInputError: If a part is invalid or written as a fraction
+                              Если часть некорректна или записана дробью
         """
+        if any(isinstance(part, str) and "/" in part for part in (real, imag)):
+            raise InvalidInputError("Fractions are only supported in real mode")
         try:
-            a = Decimal(str(real))
-            b = Decimal(str(imag))
+            return Decimal(str(real)), Decimal(str(imag))
         except (ValueError, decimal.InvalidOperation) as e:
             raise InvalidInputError(f"Invalid number format: {e}")
 
-        # For complex number z = a + bi, sqrt(z) is calculated as:
-        # sqrt(z) = sqrt((|z| + a)/2) + i * sign(b) * sqrt((|z| - a)/2)
-        # where |z| = sqrt(a^2 + b^2)
+    def _sqrt_complex_decimal(
+        self, a: Decimal, b: Decimal, seed: Optional[Tuple[Decimal, Decimal]] = None
+    ) -> tuple[Decimal, Decimal]:
+        """Calculate the complex square root under the active decimal context.
 
-        try:
-            magnitude = (a**2 + b**2).sqrt()
-
-            real_part = ((magnitude + a) / 2).sqrt()
-
-            # Handle the imaginary part calculation which may fail with low precision
-            imag_value = (magnitude - a) / 2
-
-            # Check if the value is negative (can happen with rounding in low precision)
-            if imag_value < 0:
-                # With very low precision, rounding errors can make this slightly negative
-                # when it should be zero or very small positive. Use absolute value.
-                # Define tolerance as one order of magnitude larger than precision
-                tolerance = Decimal(10) ** (-self.precision + 1)
-                if abs(imag_value) < tolerance:
-                    # Treat as zero
-                    imag_part = Decimal(0)
-                else:
-                    raise PrecisionError(
-                        self.precision, self.precision + 2, is_generic=False
-                    )
-            else:
-                if b >= 0:
-                    imag_part = imag_value.sqrt()
-                else:
-                    imag_part = -imag_value.sqrt()
-        except decimal.InvalidOperation:
-            raise PrecisionError(
-                self.precision, max(10, self.precision + 5), is_generic=True
+        Вычислить комплексный квадратный корень в активном десятичном контексте.
+
+        Only one component needs a square root: t = sqrt((|z| + |a|)/2) adds
+        two non-negative values, so nothing cancels, and the other component
+        is |b| / (2t). For a >= 0 the real part is t, otherwise the imaginary
+        part is t with the sign of b. Intermediate steps carry
+        COMPLEX_GUARD_DIGITS extra digits. Up to FAST_PATH_MAX_PRECISION
+        digits ``cmath.sqrt`` is tried first and kept when its rounding is
+        provably the same.
+
+        Args:
+            a: Real part of the complex number
+              Действительная часть комплексного числа
+            b: Imaginary part of the complex number
+              Мнимая часть комплексного числа
+            seed: Optional lower-precision root; its squared modulus and the
+                  matching part seed the two real square roots
+                 Необязательный корень меньшей точности; квадрат его модуля и
+                 соответствующая часть служат начальными значениями двух
+                 действительных корней
+
+        Returns:
+            Tuple of (real_part, imaginary_part) of the result
+            Кортеж (действительная_часть, мнимая_часть) результата
+        """
+        if not a and not b:
+            return _ZERO, _ZERO
+
+        result_context = decimal.getcontext()
+        if result_context.rounding == decimal.ROUND_HALF_EVEN:
+            fast = float_complex_sqrt(a, b, result_context.prec)
+            if fast is not None:
+                return fast
+
+        if (
+            seed is None
+            and result_context.prec >= MONITORED_STEPS_MIN_PRECISION
+            and is_monitored()
+        ):
+            # A short root seeds both square roots, so they run in Newton steps
+            with decimal.localcontext() as context:
+                context.prec = NEWTON_SEED_DIGITS
+                seed = self._sqrt_complex_decimal(a, b)
+
+        # sqrt(z * 10**(2k)) = sqrt(z) * 10**k keeps both parts near one
+        # when they would leave the context range
+        scale = max(part.adjusted() for part in (a, b) if part)
+        in_range = result_context.Emin <= scale <= result_context.Emax
+        half = 0 if in_range else scale // 2
+        if half:
+            a = EXACT_CONTEXT.scaleb(a, -2 * half)
+            b = EXACT_CONTEXT.scaleb(b, -2 * half)
+            seed = seed and tuple(EXACT_CONTEXT.scaleb(part, -half) for part in seed)
+            # Round in the full exponent range: a part too small for the
+            # context before scaling back may well fit into it afterwards
+            with decimal.localcontext(result_context) as context:
+                context.Emax, context.Emin = decimal.MAX_EMAX, decimal.MIN_EMIN
+                real, imag = self._sqrt_complex_decimal(a, b, seed)
+            return tuple(
+                EXACT_CONTEXT.scaleb(part, half) if part else part
+                for part in (real, imag)
             )
 
-        return real_part, imag_part
+        seed_real, seed_imag = seed or (None, None)
+        with decimal.localcontext() as context:
+            context.prec = result_context.prec + COMPLEX_GUARD_DIGITS
+            # |z| may exceed the input exponent range before the root halves it
+            context.Emax, context.Emin = decimal.MAX_EMAX, decimal.MIN_EMIN
+
+            with stage(0.0, 0.5):
+                magnitude = modulus(
+                    a,
+                    b,
+                    context.prec,
+                    seed and self._seed_modulus(seed_real, seed_imag),
+                )
+
+            if a.is_signed():
+                seed_root = seed_imag and seed_imag.copy_abs()
+            else:
+                seed_root = seed_real
+            with stage(0.5, 1.0):
+                root = self._active_sqrt((magnitude + a.copy_abs()) / 2, seed_root)
+            other = b.copy_abs() / (2 * root) if b else _ZERO
+
+        root = result_context.plus(root)
+        other = result_context.plus(other)
+        if not a.is_signed():
+            return root, other.copy_sign(b)
+        return other, root.copy_sign(b)
+
+    @staticmethod
+    def _seed_modulus(seed_real: Decimal, seed_imag: Decimal) -> Decimal:
+        """Square the modulus of a seed root at the seed's own precision.
+
+        Возвести модуль начального корня в квадрат с точностью самого корня.
+
+        Newton refinement infers the number of correct digits from the digit
+        count, so the result must not carry more digits than the seed.
+
+        Args:
+            seed_real: Real part of the seed root
+                      Действительная часть начального корня
+            seed_imag: Imaginary part of the seed root
+                      Мнимая часть начального корня
+
+        Returns:
+            seed_real**2 + seed_imag**2 rounded to the seed precision
+            seed_real**2 + seed_imag**2, округлённое до точности корня
+        """
+        digits = [
+            len(part.as_tuple().digits) for part in (seed_real, seed_imag) if part
+        ]
+        context = decimal.Context(
+            prec=min(digits, default=1), Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+        )
+        return context.add(
+            context.multiply(seed_real, seed_real),
+            context.multiply(seed_imag, seed_imag),
+        )
+
+    def _can_refine(self, num: Decimal, seed: Optional[Decimal]) -> bool:
+        """Check whether Newton refinement from a seed is worth it.
+
+        Проверить, стоит ли уточнять корень методом Ньютона от начального значения.
+
+        Args:
+            num: Value to take the square root of
+                Значение для извлечения корня
+            seed: Candidate seed root
+                 Возможное начальное значение корня
+
+        Returns:
+            True if the seed is usable and the precision is high enough
+            True, если начальное значение пригодно и точность достаточно высока
+        """
+        return (
+            seed is not None
+            and self.precision >= REFINEMENT_MIN_PRECISION
+            and seed.is_finite()
+            and seed > 0
+            and num > 0
+        )
+
+    def _active_sqrt(self, num: Decimal, seed: Optional[Decimal]) -> Decimal:
+        """Square root under the active context, refined from a seed if possible.
+
+        Квадратный корень в активном контексте, уточнённый от начального
+        значения, если возможно.
+
+        Args:
+            num: Value to take the square root of
+                Значение для извлечения корня
+            seed: Optional lower-precision root of ``num``
+                 Необязательный корень ``num`` меньшей точности
+
+        Returns:
+            Square root rounded to the active context precision
+            Квадратный корень, округлённый до точности активного контекста
+        """
+        context = decimal.getcontext()
+        if self._can_refine(num, seed):
+            return context.plus(
+                newton_sqrt(num, seed, context.prec + REFINEMENT_GUARD_DIGITS)
+            )
+        # Backends round half-even like the default context
+        if context.rounding != decimal.ROUND_HALF_EVEN:
+            return num.sqrt(context)
+        return self._backend_for(num, context.prec).sqrt(num, context)
 
     def format_result(self, value: Decimal, max_digits: int = None) -> str:
         """Format a decimal result for display.
@@ -461,8 +2257,10 @@ class SquareRootCalculator:
         Args:
             value: The decimal value to format
                   Десятичное значение для форматирования
-            max_digits: Maximum number of digits to display (None for all)
-                       Максимальное количество отображаемых цифр (None для всех)
+            max_digits: Maximum digits after the decimal point, rounded
+                        half-even (None for the precision)
+                       Максимум цифр после десятичной точки, с округлением
+                       до чётного (None - по точности)
 
         Returns:
             Formatted string representation
@@ -470,19 +2268,4 @@ class SquareRootCalculator:
         """
         if max_digits is None:
             max_digits = self.precision
-
-        # Convert to string and limit digits
-        result = str(value)
-
-        # Handle scientific notation for very large/small numbers
-        if "E" in result.upper():
-            return result
-
-        # Limit decimal places
-        if "." in result:
-            integer_part, decimal_part = result.split(".")
-            if len(decimal_part) > max_digits:
-                decimal_part = decimal_part[:max_digits]
-            result = f"{integer_part}.{decimal_part}"
-
-        return result
+        return format_decimal(value, max_digits, self.decimal_places)
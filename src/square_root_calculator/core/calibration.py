@@ -0,0 +1,490 @@
+"""On-host calibration of the square root backend bands.
+
+Калибровка диапазонов вычислителей корня на текущей машине.
+"""
+
+import decimal
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .backends import BackendRegistry, SqrtBackend, default_registry
+from .estimation import CostModel, default_cost_model
+from .constants import (
+    CALIBRATION_FILE_NAME,
+    CALIBRATION_INPUT_FACTORS,
+    CALIBRATION_MAX_EXTRAPOLATION,
+    CALIBRATION_MAX_REPEATS,
+    CALIBRATION_MEMORY_PRECISION,
+    CALIBRATION_MIN_TIME,
+    CALIBRATION_PRECISIONS,
+    CALIBRATION_VERSION,
+    ENGINE_DECIMAL,
+)
+from .settings import settings_directory
+
+# One benchmark row: precision, input digits and seconds per engine
+Measurement = Dict[str, Any]
+
+
+def calibration_file() -> Path:
+    """Get the path of the saved calibration, next to settings.json.
+
+    Получить путь к сохранённой калибровке рядом с settings.json.
+
+    Returns:
+        Path of the calibration file
+        Путь к файлу калибровки
+    """
+    return settings_directory() / CALIBRATION_FILE_NAME
+
+
+def _random_input(digits: int, rng: random.Random) -> Decimal:
+    """Build a value in [1, 10) with the given number of random digits.
+
+    Построить значение в [1, 10) с заданным количеством случайных цифр.
+    """
+    coefficient = (rng.randint(1, 9),) + tuple(
+        rng.randrange(10) for _ in range(digits - 1)
+    )
+    return Decimal((0, coefficient, 1 - digits))
+
+
+def time_backend(backend: SqrtBackend, num: Decimal, context: decimal.Context) -> float:
+    """Measure the best time of one backend on one input.
+
+    Измерить наилучшее время одного вычислителя на одном значении.
+
+    The root is repeated until ``CALIBRATION_MIN_TIME`` has passed or
+    ``CALIBRATION_MAX_REPEATS`` runs are done, so slow rungs run once.
+
+    Args:
+        backend: Backend to time
+                Измеряемый вычислитель
+        num: Input value
+            Входное значение
+        context: Context giving the precision
+                Контекст, задающий точность
+
+    Returns:
+        Fastest run in seconds
+        Самый быстрый запуск в секундах
+    """
+    best = math.inf
+    spent = 0.0
+    for _ in range(CALIBRATION_MAX_REPEATS):
+        start = time.perf_counter()
+        backend.sqrt(num, context)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        spent += elapsed
+        if spent >= CALIBRATION_MIN_TIME:
+            break
+    return best
+
+
+def measure(
+    backends: Sequence[SqrtBackend],
+    precisions: Sequence[int] = CALIBRATION_PRECISIONS,
+    input_factors: Sequence[int] = CALIBRATION_INPUT_FACTORS,
+    progress: Optional[Callable[[Measurement], None]] = None,
+    seed: int = 0,
+) -> List[Measurement]:
+    """Benchmark backends across a ladder of precisions and input sizes.
+
+    Измерить вычислители на лестнице точностей и размеров входа.
+
+    Args:
+        backends: Backends to time
+                 Измеряемые вычислители
+        precisions: Precisions of the ladder, ascending
+                   Точности лестницы по возрастанию
+        input_factors: Input digits per digit of precision
+                      Цифры входа на цифру точности
+        progress: Optional callback receiving each finished row
+                 Необязательная функция, получающая каждую готовую строку
+        seed: Seed of the random inputs
+             Начальное значение случайных входов
+
+    Returns:
+        Rows with "precision", "input_digits" and seconds per engine name
+        Строки с "precision", "input_digits" и секундами для каждого движка
+    """
+    rng = random.Random(seed)
+    measurements = []
+    for precision in precisions:
+        context = decimal.Context(prec=precision)
+        for factor in input_factors:
+            num = _random_input(precision * factor, rng)
+            row: Measurement = {
+                "precision": precision,
+                "input_digits": precision * factor,
+            }
+            for backend in backends:
+                row[backend.name] = time_backend(backend, num, context)
+            measurements.append(row)
+            if progress is not None:
+                progress(row)
+    return measurements
+
+
+def measure_memory(
+    backends: Sequence[SqrtBackend],
+    precision: int = CALIBRATION_MEMORY_PRECISION,
+    input_factors: Sequence[int] = CALIBRATION_INPUT_FACTORS,
+    seed: int = 0,
+) -> List[Measurement]:
+    """Trace the peak memory of backends at one precision.
+
+    Отследить пиковую память вычислителей при одной точности.
+
+    Decimal and int buffers are allocated through the Python allocator, so
+    ``tracemalloc`` sees them; tracing slows the roots down, which is why
+    memory is measured apart from the timings.
+
+    Args:
+        backends: Backends to trace
+                 Отслеживаемые вычислители
+        precision: Precision of the roots
+                  Точность корней
+        input_factors: Input digits per digit of precision
+                      Цифры входа на цифру точности
+        seed: Seed of the random inputs
+             Начальное значение случайных входов
+
+    Returns:
+        Rows with "precision", "input_digits" and peak bytes per engine name
+        Строки с "precision", "input_digits" и пиковыми байтами для каждого движка
+    """
+    rng = random.Random(seed)
+    context = decimal.Context(prec=precision)
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    rows = []
+    try:
+        for factor in input_factors:
+            num = _random_input(precision * factor, rng)
+            row: Measurement = {
+                "precision": precision,
+                "input_digits": precision * factor,
+            }
+            for backend in backends:
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                backend.sqrt(num, context)
+                row[backend.name] = tracemalloc.get_traced_memory()[1] - baseline
+            rows.append(row)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return rows
+
+
+def fit_cost_model(
+    measurements: List[Measurement], memory: List[Measurement]
+) -> CostModel:
+    """Build a cost model from timing and memory rows.
+
+    Построить модель стоимости по строкам времени и памяти.
+
+    Engines keep their reference values for any input class not measured.
+
+    Args:
+        measurements: Rows returned by ``measure``
+                     Строки, возвращённые ``measure``
+        memory: Rows returned by ``measure_memory``
+               Строки, возвращённые ``measure_memory``
+
+    Returns:
+        Fitted CostModel
+        Построенная CostModel
+    """
+    model = CostModel()
+    points: Dict[Tuple[str, bool], Dict[int, float]] = {}
+    for row in measurements:
+        long_input = row["input_digits"] > row["precision"]
+        for name, seconds in row.items():
+            if name in ("precision", "input_digits"):
+                continue
+            slowest = points.setdefault((name, long_input), {})
+            slowest[row["precision"]] = max(seconds, slowest.get(row["precision"], 0))
+    for (name, long_input), by_precision in points.items():
+        model.set_points(name, list(by_precision.items()), long_input)
+    for row in memory:
+        long_input = row["input_digits"] > row["precision"]
+        for name, peak in row.items():
+            if name not in ("precision", "input_digits"):
+                model.set_bytes_per_digit(name, peak / row["precision"], long_input)
+    return model
+
+
+def find_band(
+    measurements: List[Measurement],
+    integer_name: str,
+    high_name: str = ENGINE_DECIMAL,
+) -> Tuple[int, int]:
+    """Find where an integer backend beats Decimal.sqrt and where it stops.
+
+    Найти, где целочисленный вычислитель обгоняет Decimal.sqrt и где перестаёт.
+
+    A precision counts as won when the integer backend is faster for every
+    input measured at it. The band ends where the high-precision backend
+    wins again; if the integer backend still wins at the top of the ladder,
+    the upper crossover is extrapolated from a power law through the last
+    two rungs and capped at ``CALIBRATION_MAX_EXTRAPOLATION`` times the top
+    rung.
+
+    Args:
+        measurements: Rows returned by ``measure`` for one input class
+                     Строки, возвращённые ``measure``, для одного класса входов
+        integer_name: Engine name of the integer backend
+                     Имя движка целочисленного вычислителя
+        high_name: Engine name of the backend used above the band
+                  Имя движка вычислителя, используемого выше диапазона
+
+    Returns:
+        Band (lower, upper); equal bounds mean the integer backend never wins
+        Диапазон (lower, upper); равные границы означают, что целочисленный
+        вычислитель не выигрывает нигде
+    """
+    # Slowdown of the integer backend against Decimal.sqrt and against the
+    # high-precision backend per precision
+    low_ratios: Dict[int, float] = {}
+    ratios: Dict[int, float] = {}
+    for row in measurements:
+        precision = row["precision"]
+        low_ratio = row[integer_name] / max(row[ENGINE_DECIMAL], 1e-9)
+        low_ratios[precision] = max(low_ratio, low_ratios.get(precision, 0.0))
+        ratio = row[integer_name] / max(row[high_name], 1e-9)
+        ratios[precision] = max(ratio, ratios.get(precision, 0.0))
+    precisions = sorted(ratios)
+    top = precisions[-1]
+
+    winning = [precision for precision in precisions if low_ratios[precision] < 1]
+    if not winning:
+        return top, top
+    lower = winning[0]
+    for precision in precisions:
+        if precision >= lower and ratios[precision] >= 1:
+            return lower, precision
+
+    cap = top * CALIBRATION_MAX_EXTRAPOLATION
+    if len(precisions) < 2:
+        return lower, cap
+    previous = precisions[-2]
+    slope = math.log(ratios[top] / ratios[previous]) / math.log(top / previous)
+    if slope <= 0:
+        return lower, cap
+    upper = top * (1 / ratios[top]) ** (1 / slope)
+    return lower, min(cap, max(top + 1, int(upper)))
+
+
+def calibrate(
+    registry: BackendRegistry = default_registry,
+    precisions: Sequence[int] = CALIBRATION_PRECISIONS,
+    progress: Optional[Callable[[Measurement], None]] = None,
+) -> Dict[str, Any]:
+    """Measure the backend bands of this host.
+
+    Измерить диапазоны вычислителей на этой машине.
+
+    Runs in the calling thread and takes a few seconds with the default
+    ladder, so it must never be called from the GUI thread.
+
+    Args:
+        registry: Registry whose backends are timed
+                 Реестр, вычислители которого измеряются
+        precisions: Precisions of the ladder, ascending
+                   Точности лестницы по возрастанию
+        progress: Optional callback receiving each finished row
+                 Необязательная функция, получающая каждую готовую строку
+
+    Returns:
+        Calibration data for ``apply_calibration`` and ``save_calibration``
+        Данные калибровки для ``apply_calibration`` и ``save_calibration``
+    """
+    decimal_backend = registry.get(ENGINE_DECIMAL)
+    integer_backend = registry.fastest_integer_backend()
+    high_backend = registry.high_precision_backend()
+    backends = [decimal_backend]
+    if integer_backend is not None:
+        backends.append(integer_backend)
+    if high_backend is not decimal_backend:
+        backends.append(high_backend)
+
+    measurements = measure(backends, precisions, progress=progress)
+    memory = measure_memory(backends, min(precisions[-1], CALIBRATION_MEMORY_PRECISION))
+    data: Dict[str, Any] = {
+        "version": CALIBRATION_VERSION,
+        "integer_backend": None if integer_backend is None else integer_backend.name,
+        "high_precision_backend": high_backend.name,
+    }
+    for long_input, key in ((False, "short_input_band"), (True, "long_input_band")):
+        rows = [
+            row
+            for row in measurements
+            if (row["input_digits"] > row["precision"]) == long_input
+        ]
+        if integer_backend is None or not rows:
+            data[key] = list(registry.band(long_input))
+        else:
+            data[key] = list(find_band(rows, integer_backend.name, high_backend.name))
+    data["cost_model"] = fit_cost_model(measurements, memory).to_data()
+    data["measurements"] = measurements
+    return data
+
+
+def apply_calibration(
+    data: Dict[str, Any],
+    registry: BackendRegistry = default_registry,
+    cost_model: CostModel = default_cost_model,
+) -> None:
+    """Set the registry bands and the cost model from calibration data.
+
+    Установить диапазоны реестра и модель стоимости по данным калибровки.
+
+    Args:
+        data: Calibration data from ``calibrate`` or a saved file
+             Данные калибровки из ``calibrate`` или сохранённого файла
+        registry: Registry to update
+                 Обновляемый реестр
+        cost_model: Cost model to update, if the data has one
+                   Обновляемая модель стоимости, если она есть в данных
+
+    Raises:
+        ValueError: If the data is from another version, or for other
+                    integer or high-precision backends than registered now
+                   Если данные другой версии или для других
+                   целочисленного вычислителя или вычислителя высокой
+                   точности, чем зарегистрированы сейчас
+    """
+    if data.get("version") != CALIBRATION_VERSION:
+        raise ValueError("Unsupported calibration version")
+    integer_backend = registry.fastest_integer_backend()
+    current = None if integer_backend is None else integer_backend.name
+    if data.get("integer_backend") != current:
+        raise ValueError(
+            f"Calibration was measured for {data.get('integer_backend')}, "
+            f"not {current}; run --calibrate again"
+        )
+    high = registry.high_precision_backend().name
+    if data.get("high_precision_backend") != high:
+        raise ValueError(
+            f"Calibration was measured for {data.get('high_precision_backend')}, "
+            f"not {high}; run --calibrate again"
+        )
+    short_lower, short_upper = data["short_input_band"]
+    long_lower, long_upper = data["long_input_band"]
+    registry.set_band(int(short_lower), int(short_upper))
+    registry.set_band(int(long_lower), int(long_upper), long_input=True)
+    if data.get("cost_model"):
+        cost_model.load_data(data["cost_model"])
+
+
+def save_calibration(data: Dict[str, Any], path: Optional[Path] = None) -> Path:
+    """Save calibration data as JSON.
+
+    Сохранить данные калибровки в JSON.
+
+    Args:
+        data: Calibration data from ``calibrate``
+             Данные калибровки из ``calibrate``
+        path: Target file (default: ``calibration_file()``)
+             Файл назначения (по умолчанию: ``calibration_file()``)
+
+    Returns:
+        Path the data was written to
+        Путь, по которому записаны данные
+    """
+    path = calibration_file() if path is None else path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def load_calibration(
+    path: Optional[Path] = None,
+    registry: BackendRegistry = default_registry,
+    cost_model: CostModel = default_cost_model,
+) -> bool:
+    """Apply saved calibration data to the registry if there is any.
+
+    Применить сохранённые данные калибровки к реестру, если они есть.
+
+    A missing file leaves the built-in bands in place; an unreadable
+    or stale one is reported and ignored.
+
+    Args:
+        path: Calibration file (default: ``calibration_file()``)
+             Файл калибровки (по умолчанию: ``calibration_file()``)
+        registry: Registry to update
+                 Обновляемый реестр
+        cost_model: Cost model to update
+                   Обновляемая модель стоимости
+
+    Returns:
+        True if saved bands were applied
+        True, если сохранённые диапазоны применены
+    """
+    path = calibration_file() if path is None else path
+    try:
+        if not path.exists():
+            return False
+        with open(path, "r") as f:
+            apply_calibration(json.load(f), registry, cost_model)
+        return True
+    except Exception as e:
+        print(f"Could not load calibration: {e}")
+        return False
+
+
+def run_calibration(
+    path: Optional[Path] = None, output: Callable[[str], None] = print
+) -> int:
+    """Calibrate the default registry, save the result and report it.
+
+    Откалибровать реестр по умолчанию, сохранить и вывести результат.
+
+    Args:
+        path: Target file (default: ``calibration_file()``)
+             Файл назначения (по умолчанию: ``calibration_file()``)
+        output: Function printing report lines
+               Функция вывода строк отчёта
+
+    Returns:
+        Process exit code
+        Код завершения процесса
+    """
+
+    def report(row: Measurement) -> None:
+        timings = ", ".join(
+            f"{name} {seconds * 1000:.3f} ms"
+            for name, seconds in row.items()
+            if name not in ("precision", "input_digits")
+        )
+        output(
+            f"{row['precision']:>7} digits, input {row['input_digits']:>7}: {timings}"
+        )
+
+    data = calibrate(progress=report)
+    apply_calibration(data)
+    saved = save_calibration(data, path)
+    output(f"Integer backend: {data['integer_backend']}")
+    output(f"High-precision backend: {data['high_precision_backend']}")
+    for key in ("short_input_band", "long_input_band"):
+        lower, upper = data[key]
+        output(f"{key}: {lower} .. {upper} digits")
+    output(f"Saved to {saved}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_calibration())
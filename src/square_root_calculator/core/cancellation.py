@@ -0,0 +1,236 @@
+"""Cooperative cancellation and progress reporting of long calculations.
+
+Кооперативная отмена и отчёт о ходе длительных вычислений.
+
+A calculation started with a token or a progress callback runs under a
+monitor held in a context variable, so the numeric kernels only call
+``checkpoint`` between their steps and need no extra arguments. Without a
+monitor ``checkpoint`` returns at once.
+"""
+
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+# Monitor of the calculation running in the current thread, if any
+_active_monitor: contextvars.ContextVar[Optional["CalculationMonitor"]] = (
+    contextvars.ContextVar("calculation_monitor", default=None)
+)
+
+
+class CalculationCancelledError(Exception):
+    """Raised at a checkpoint once the calculation's token is cancelled.
+
+    Возникает в контрольной точке после отмены токена вычисления.
+    """
+
+
+class CancellationToken:
+    """Thread-safe flag asking running calculations to stop.
+
+    Потокобезопасный флаг, требующий остановить выполняющиеся вычисления.
+
+    One token may be shared by many calculations, e.g. all jobs of a batch;
+    cancelling it stops each of them at its next checkpoint.
+    """
+
+    def __init__(self) -> None:
+        """Initialize token.
+
+        Инициализировать токен.
+        """
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask the calculations using this token to stop.
+
+        Потребовать остановки вычислений, использующих этот токен.
+        """
+        self._event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Whether ``cancel`` has been called.
+
+        Был ли вызван ``cancel``.
+        """
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise if the token is cancelled.
+
+        Возбудить исключение, если токен отменён.
+
+        Raises:
+            CalculationCancelledError: If the token is cancelled
+                                      Если токен отменён
+        """
+        if self._event.is_set():
+            raise CalculationCancelledError("Calculation cancelled")
+
+
+class CalculationMonitor:
+    """Cancellation token and progress callback of one running calculation.
+
+    Токен отмены и функция хода одного выполняющегося вычисления.
+
+    Progress is a fraction from 0 to 1. Nested stages map the fractions
+    reported inside them onto their share of the enclosing range, and the
+    callback only sees increasing values.
+    """
+
+    def __init__(
+        self,
+        token: Optional[CancellationToken] = None,
+        progress: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        """Initialize monitor.
+
+        Инициализировать монитор.
+
+        Args:
+            token: Optional cancellation token
+                  Необязательный токен отмены
+            progress: Optional callback receiving the overall fraction done
+                     Необязательная функция, получающая общую долю выполненного
+        """
+        self.token = token
+        self.progress = progress
+        self._start = 0.0
+        self._span = 1.0
+        self._reported = 0.0
+
+    def check(self, fraction: Optional[float] = None) -> None:
+        """Stop if cancelled, otherwise report progress within the current stage.
+
+        Остановиться при отмене, иначе сообщить ход в пределах текущего этапа.
+
+        Args:
+            fraction: Optional fraction of the current stage done
+                     Необязательная доля выполненной части текущего этапа
+
+        Raises:
+            CalculationCancelledError: If the token is cancelled
+                                      Если токен отменён
+        """
+        if self.token is not None:
+            self.token.raise_if_cancelled()
+        if fraction is None or self.progress is None:
+            return
+        overall = self._start + self._span * min(max(fraction, 0.0), 1.0)
+        if overall > self._reported:
+            self._reported = overall
+            self.progress(overall)
+
+    def finish(self) -> None:
+        """Report completion without checking the token.
+
+        Сообщить о завершении без проверки токена.
+        """
+        if self.progress is not None and self._reported < 1.0:
+            self._reported = 1.0
+            self.progress(1.0)
+
+    @contextmanager
+    def stage(self, start: float, end: float) -> Iterator[None]:
+        """Run a part of the calculation covering [start, end] of the current range.
+
+        Выполнить часть вычисления, занимающую [start, end] текущего диапазона.
+
+        Args:
+            start: Fraction of the current range where the stage begins
+                  Доля текущего диапазона, где начинается этап
+            end: Fraction of the current range where the stage ends
+                Доля текущего диапазона, где заканчивается этап
+        """
+        saved = self._start, self._span
+        self._start += self._span * start
+        self._span *= end - start
+        try:
+            yield
+        finally:
+            self._start, self._span = saved
+        self.check(end)
+
+
+@contextmanager
+def monitoring(
+    token: Optional[CancellationToken] = None,
+    progress: Optional[Callable[[float], None]] = None,
+) -> Iterator[Optional[CalculationMonitor]]:
+    """Run the enclosed calculation under a token and a progress callback.
+
+    Выполнить вложенное вычисление с токеном и функцией хода.
+
+    Without a token and a callback the monitor already active, if any, is
+    kept, so public methods calling each other share one monitor.
+
+    Args:
+        token: Optional cancellation token
+              Необязательный токен отмены
+        progress: Optional callback receiving the fraction done
+                 Необязательная функция, получающая долю выполненного
+
+    Yields:
+        Active monitor, or None if the calculation is not monitored
+        Активный монитор или None, если вычисление не отслеживается
+    """
+    if token is None and progress is None:
+        yield _active_monitor.get()
+        return
+
+    monitor = CalculationMonitor(token, progress)
+    monitor.check()
+    reset = _active_monitor.set(monitor)
+    try:
+        yield monitor
+    finally:
+        _active_monitor.reset(reset)
+    monitor.finish()
+
+
+def is_monitored() -> bool:
+    """Whether the running calculation has a token or a progress callback.
+
+    Есть ли у выполняющегося вычисления токен или функция хода.
+    """
+    return _active_monitor.get() is not None
+
+
+def checkpoint(fraction: Optional[float] = None) -> None:
+    """Stop if the running calculation is cancelled, otherwise report progress.
+
+    Остановиться, если выполняющееся вычисление отменено, иначе сообщить ход.
+
+    Args:
+        fraction: Optional fraction of the current stage done
+                 Необязательная доля выполненной части текущего этапа
+
+    Raises:
+        CalculationCancelledError: If the calculation's token is cancelled
+                                  Если токен вычисления отменён
+    """
+    monitor = _active_monitor.get()
+    if monitor is not None:
+        monitor.check(fraction)
+
+
+@contextmanager
+def stage(start: float, end: float) -> Iterator[None]:
+    """Map progress reported inside onto [start, end] of the current range.
+
+    Отобразить ход, сообщаемый внутри, на [start, end] текущего диапазона.
+
+    Args:
+        start: Fraction of the current range where the stage begins
+              Доля текущего диапазона, где начинается этап
+        end: Fraction of the current range where the stage ends
+            Доля текущего диапазона, где заканчивается этап
+    """
+    monitor = _active_monitor.get()
+    if monitor is None:
+        yield
+        return
+    with monitor.stage(start, end):
+        yield
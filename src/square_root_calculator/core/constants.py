@@ -4,11 +4,129 @@
 """
 
 # Calculator constants - representation formatting
-MAX_SCIENTIFIC_PRECISION = 15
-MAX_FRACTION_VALUE = 1000
 MAX_FRACTION_DENOMINATOR = 10000
 FRACTION_TOLERANCE = 0.0001
-MAX_POLAR_PRECISION = 10
+MAX_INTEGER_REPRESENTATION_DIGITS = 2000
+
+# Result representations by mode, in display order
+REAL_REPRESENTATIONS = ("decimal", "integer", "scientific", "fraction")
+COMPLEX_REPRESENTATIONS = ("polar", "exponential")
+
+# Calculator constants - real square root engines
+ENGINE_DECIMAL = "decimal"  # Decimal.sqrt under the calculator context
+ENGINE_ISQRT = "isqrt"  # math.isqrt on a fixed-point integer
+ENGINE_GMPY2 = "gmpy2"  # gmpy2.isqrt_rem on a fixed-point integer, if installed
+ENGINE_MPMATH = "mpmath"  # mpmath's gmpy-backed sqrtrem, if installed
+ENGINE_NEWTON = "newton"  # Decimal Newton steps from a short Decimal.sqrt seed
+ENGINE_AUTO = "auto"  # fastest available engine for the precision band
+DEFAULT_ENGINE = ENGINE_AUTO
+
+# Working digits where integer engines overtake Decimal.sqrt, and where
+# Newton steps, whose divisions use libmpdec's transform multiplication,
+# overtake them. Inputs longer than the precision convert twice as many
+# digits: a narrower band
+BACKEND_SHORT_INPUT_BAND = (200, 5000)
+BACKEND_LONG_INPUT_BAND = (500, 1000)
+NEWTON_SEED_DIGITS = 50
+
+# Calibration - host-measured crossovers, saved next to settings.json
+CALIBRATION_FILE_NAME = "calibration.json"
+CALIBRATION_VERSION = 2
+CALIBRATION_PRECISIONS = (50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000)
+CALIBRATION_INPUT_FACTORS = (1, 10)  # input digits per digit of precision
+CALIBRATION_MIN_TIME = 0.02  # seconds spent timing one engine on one input
+CALIBRATION_MAX_REPEATS = 5
+# Extrapolated upper crossovers are capped at this multiple of the top rung
+CALIBRATION_MAX_EXTRAPOLATION = 100
+
+# Cost estimation - reference timings per engine as (precision, seconds for
+# inputs of at most that many digits, seconds for ten times longer inputs),
+# replaced by --calibrate; other precisions are interpolated in log-log
+COST_MODEL_SECONDS = {
+    ENGINE_DECIMAL: (
+        (1000, 4.3e-4, 4.3e-4),
+        (10000, 0.049, 0.045),
+        (50000, 0.49, 0.43),
+        (200000, 2.5, 2.0),
+    ),
+    ENGINE_ISQRT: (
+        (1000, 1.8e-4, 3.2e-4),
+        (10000, 0.011, 0.025),
+        (50000, 0.24, 0.57),
+        (200000, 3.3, 8.2),
+    ),
+    ENGINE_NEWTON: (
+        (1000, 1.7e-4, 1.7e-4),
+        (10000, 0.0059, 0.0058),
+        (50000, 0.078, 0.077),
+        (200000, 0.40, 0.38),
+    ),
+}
+# Peak bytes allocated per digit of precision, for short and long inputs
+COST_MODEL_BYTES_PER_DIGIT = {
+    ENGINE_DECIMAL: (7.4, 7.4),
+    ENGINE_ISQRT: (9.9, 19.7),
+    ENGINE_NEWTON: (7.8, 11.6),
+}
+DECIMAL_BYTES_PER_DIGIT = 8 / 19  # libmpdec packs 19 digits per 64-bit word
+CALIBRATION_MEMORY_PRECISION = 20000  # rung where peak memory is traced
+# Fraction terms are converted to integers and reduced by their gcd in full,
+# whatever the precision; reference seconds for terms of
+# FRACTION_REFERENCE_DIGITS digits, the conversion growing like a Karatsuba
+# product with the digits of both terms and the gcd with their product
+FRACTION_REFERENCE_DIGITS = 100000
+FRACTION_CONVERSION_SECONDS = 0.1
+FRACTION_CONVERSION_EXPONENT = 1.585  # log2(3)
+FRACTION_GCD_SECONDS = 0.22
+FRACTION_BYTES_PER_DIGIT = 11.0  # peak bytes per digit of both terms
+
+# Calculator constants - batch processing
+DEFAULT_BATCH_CHUNK_SIZE = 256
+DEFAULT_PROCESS_CHUNK_SIZE = 16
+DEFAULT_DIGIT_CHUNK_SIZE = 1000
+
+# Calculator constants - result cache
+MODE_REAL = "real"
+MODE_COMPLEX = "complex"
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Calculator constants - Newton refinement from lower-precision roots
+REFINEMENT_MIN_PRECISION = 300
+REFINEMENT_GUARD_DIGITS = 5
+
+# Calculator constants - calculations with a token or progress callback take their
+# roots in Newton steps from a NEWTON_SEED_DIGITS seed from this precision
+# on, so they can stop between steps
+MONITORED_STEPS_MIN_PRECISION = 1000
+
+# Calculator constants - extra digits carried by the complex square root
+COMPLEX_GUARD_DIGITS = 5
+
+# Calculator constants - results to a number of decimal places: guard digits
+# deciding the rounding of complex parts, doubled up to PLACES_MAX_ATTEMPTS
+# times while a part lies too close to a rounding boundary
+PLACES_GUARD_DIGITS = 3
+PLACES_MAX_ATTEMPTS = 4
+
+# Calculator constants - roots with more integer digits than this are not
+# written to decimal places but in scientific notation to ``precision``
+# significant digits, as without decimal places
+MAX_PLACES_INTEGER_DIGITS = MAX_INTEGER_REPRESENTATION_DIGITS
+
+# Calculator constants - double-precision fast path for low precisions;
+# above 13 digits the double's own error rarely lets the rounding be proven
+FAST_PATH_MAX_PRECISION = 13
+
+# Calculator constants - exact complex roots are only sought when both parts
+# fit in Gaussian integers of at most this many digits
+MAX_EXACT_COMPLEX_DIGITS = 4000
+
+# Calculator constants - arbitrary-precision pi and arctangent
+TRANSCENDENTAL_GUARD_DIGITS = 10
+# Significant digits of polar angles in degrees, which are below 100° and
+# shown with two decimals, whatever the precision of the result
+POLAR_DEGREE_DIGITS = 4
 
 # UI dimension constants
 LABEL_MIN_WIDTH = 120
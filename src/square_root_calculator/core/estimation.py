@@ -0,0 +1,379 @@
+"""Time and memory estimates of square roots and admission of costly jobs.
+
+Оценка времени и памяти вычисления корней и допуск дорогих заданий.
+"""
+
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .constants import (
+    COST_MODEL_BYTES_PER_DIGIT,
+    COST_MODEL_SECONDS,
+    DECIMAL_BYTES_PER_DIGIT,
+    ENGINE_DECIMAL,
+    FRACTION_BYTES_PER_DIGIT,
+    FRACTION_CONVERSION_EXPONENT,
+    FRACTION_CONVERSION_SECONDS,
+    FRACTION_GCD_SECONDS,
+    FRACTION_REFERENCE_DIGITS,
+)
+
+# Timing points of one engine and input class: (precision, seconds)
+CostPoints = List[Tuple[int, float]]
+
+
+class CostEstimate:
+    """Predicted time and peak memory of one calculation.
+
+    Прогноз времени и пиковой памяти одного вычисления.
+    """
+
+    def __init__(
+        self, seconds: float, peak_bytes: int, engine: str, precision: int
+    ) -> None:
+        """Initialize estimate.
+
+        Инициализировать оценку.
+
+        Args:
+            seconds: Predicted wall time in seconds
+                    Прогноз времени в секундах
+            peak_bytes: Predicted peak memory allocated, in bytes
+                       Прогноз пиковой выделяемой памяти в байтах
+            engine: Engine the calculation would use
+                   Движок, который использовало бы вычисление
+            precision: Precision the estimate is for
+                      Точность, для которой сделана оценка
+        """
+        self.seconds = seconds
+        self.peak_bytes = peak_bytes
+        self.engine = engine
+        self.precision = precision
+
+    def __add__(self, other: "CostEstimate") -> "CostEstimate":
+        return CostEstimate(
+            self.seconds + other.seconds,
+            max(self.peak_bytes, other.peak_bytes),
+            self.engine,
+            self.precision,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CostEstimate(seconds={self.seconds:.3g}, "
+            f"peak_bytes={self.peak_bytes}, engine={self.engine!r}, "
+            f"precision={self.precision})"
+        )
+
+
+def _interpolate(points: CostPoints, precision: int) -> float:
+    """Interpolate seconds in log-log between timing points.
+
+    Интерполировать секунды в логарифмическом масштабе между точками.
+
+    Outside the measured range the slope of the nearest segment is kept,
+    so growth past the top rung follows the last measured power law.
+    """
+    if len(points) == 1:
+        only_precision, only_seconds = points[0]
+        return only_seconds * precision / only_precision
+    index = 1
+    while index < len(points) - 1 and points[index][0] < precision:
+        index += 1
+    (low_precision, low_seconds), (high_precision, high_seconds) = (
+        points[index - 1],
+        points[index],
+    )
+    slope = math.log(high_seconds / low_seconds) / math.log(
+        high_precision / low_precision
+    )
+    return low_seconds * (precision / low_precision) ** slope
+
+
+class CostModel:
+    """Timing points and memory per digit of each square root engine.
+
+    Точки времени и память на цифру для каждого движка корня.
+
+    Times are kept separately for inputs of at most ``precision`` digits and
+    for longer ones, like the backend bands. Engines without points of
+    their own are estimated with the Decimal ones.
+    """
+
+    def __init__(self) -> None:
+        """Initialize model with the reference timings.
+
+        Инициализировать модель эталонными замерами.
+        """
+        self._seconds: Dict[Tuple[str, bool], CostPoints] = {}
+        self._bytes_per_digit: Dict[Tuple[str, bool], float] = {}
+        for engine, rows in COST_MODEL_SECONDS.items():
+            for long_input in (False, True):
+                self.set_points(
+                    engine,
+                    [(row[0], row[2 if long_input else 1]) for row in rows],
+                    long_input,
+                )
+        for engine, per_digit in COST_MODEL_BYTES_PER_DIGIT.items():
+            for long_input in (False, True):
+                self._bytes_per_digit[engine, long_input] = per_digit[long_input]
+
+    def set_points(
+        self, engine: str, points: Sequence[Tuple[int, float]], long_input: bool
+    ) -> None:
+        """Set the timing points of an engine for an input class.
+
+        Установить точки времени движка для класса входов.
+
+        Args:
+            engine: Engine name
+                   Имя движка
+            points: Pairs (precision, seconds)
+                   Пары (точность, секунды)
+            long_input: Whether the points are for inputs longer than the precision
+                       Относятся ли точки к входам длиннее точности
+
+        Raises:
+            ValueError: If there are no points or a value is not positive
+                       Если точек нет или значение не положительно
+        """
+        points = sorted((int(p), float(s)) for p, s in points)
+        if not points or any(p < 1 or s <= 0 for p, s in points):
+            raise ValueError("Cost points must be positive")
+        self._seconds[engine, long_input] = points
+
+    def set_bytes_per_digit(
+        self, engine: str, bytes_per_digit: float, long_input: bool
+    ) -> None:
+        """Set the peak memory per digit of precision of an engine.
+
+        Установить пиковую память на цифру точности для движка.
+
+        Args:
+            engine: Engine name
+                   Имя движка
+            bytes_per_digit: Peak bytes allocated per digit of precision
+                            Пиковые байты на цифру точности
+            long_input: Whether the value is for inputs longer than the precision
+                       Относится ли значение к входам длиннее точности
+        """
+        self._bytes_per_digit[engine, long_input] = float(bytes_per_digit)
+
+    def estimate(self, engine: str, precision: int, input_digits: int) -> CostEstimate:
+        """Estimate one real square root.
+
+        Оценить один действительный квадратный корень.
+
+        Args:
+            engine: Engine computing the root
+                   Движок, вычисляющий корень
+            precision: Number of significant digits of the root
+                      Количество значащих цифр корня
+            input_digits: Significant digits of the input
+                         Значащие цифры входа
+
+        Returns:
+            CostEstimate of the root
+            CostEstimate корня
+        """
+        key = (engine, input_digits > precision)
+        if key not in self._seconds:
+            key = (ENGINE_DECIMAL, key[1])
+        seconds = _interpolate(self._seconds[key], max(precision, 1))
+        peak = self._bytes_per_digit.get(key, 0.0) * precision
+        peak += DECIMAL_BYTES_PER_DIGIT * input_digits
+        return CostEstimate(seconds, int(peak), engine, precision)
+
+    def estimate_fraction_terms(
+        self,
+        engine: str,
+        precision: int,
+        numerator_digits: int,
+        denominator_digits: int,
+    ) -> CostEstimate:
+        """Estimate the work on the terms of a fraction before its root.
+
+        Оценить работу с членами дроби до извлечения корня.
+
+        Both terms are converted to integers and reduced by their gcd in
+        full, so this part of the cost depends on their digits alone and not
+        on the precision.
+
+        Args:
+            engine: Engine computing the root
+                   Движок, вычисляющий корень
+            precision: Number of significant digits of the root
+                      Количество значащих цифр корня
+            numerator_digits: Digits of the numerator
+                             Цифры числителя
+            denominator_digits: Digits of the denominator
+                               Цифры знаменателя
+
+        Returns:
+            CostEstimate of the conversions and the reduction
+            CostEstimate преобразований и сокращения
+        """
+        numerator = numerator_digits / FRACTION_REFERENCE_DIGITS
+        denominator = denominator_digits / FRACTION_REFERENCE_DIGITS
+        seconds = FRACTION_CONVERSION_SECONDS * (
+            numerator + denominator
+        ) ** FRACTION_CONVERSION_EXPONENT + FRACTION_GCD_SECONDS * (
+            numerator * denominator
+        )
+        peak = FRACTION_BYTES_PER_DIGIT * (numerator_digits + denominator_digits)
+        return CostEstimate(seconds, int(peak), engine, precision)
+
+    def to_data(self) -> List[Dict[str, Any]]:
+        """Export the model for a calibration file.
+
+        Экспортировать модель для файла калибровки.
+
+        Returns:
+            One JSON-ready entry per engine and input class
+            По одной готовой для JSON записи на движок и класс входов
+        """
+        return [
+            {
+                "engine": engine,
+                "long_input": long_input,
+                "points": [list(point) for point in points],
+                "bytes_per_digit": self._bytes_per_digit.get((engine, long_input)),
+            }
+            for (engine, long_input), points in self._seconds.items()
+        ]
+
+    def load_data(self, data: List[Dict[str, Any]]) -> None:
+        """Replace timing points and memory factors from exported entries.
+
+        Заменить точки времени и коэффициенты памяти из экспортированных записей.
+
+        Args:
+            data: Entries returned by ``to_data``
+                 Записи, возвращённые ``to_data``
+
+        Raises:
+            ValueError: If an entry is malformed
+                       Если запись некорректна
+        """
+        for entry in data:
+            engine, long_input = entry["engine"], bool(entry["long_input"])
+            self.set_points(engine, entry["points"], long_input)
+            if entry.get("bytes_per_digit") is not None:
+                self.set_bytes_per_digit(engine, entry["bytes_per_digit"], long_input)
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a job's estimate exceeds the limits of an admission policy.
+
+    Возникает, когда оценка задания превышает пределы политики допуска.
+    """
+
+    def __init__(self, estimate: CostEstimate) -> None:
+        """Initialize error.
+
+        Инициализировать ошибку.
+
+        Args:
+            estimate: Estimate of the rejected job
+                     Оценка отклонённого задания
+        """
+        self.estimate = estimate
+        super().__init__(
+            f"Calculation would take about {estimate.seconds:.3g} s and "
+            f"{estimate.peak_bytes} bytes at precision {estimate.precision}"
+        )
+
+
+class AdmissionPolicy:
+    """Limits on estimated time and memory, with optional precision downgrade.
+
+    Пределы оценённого времени и памяти с необязательным понижением точности.
+    """
+
+    def __init__(
+        self,
+        max_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        downgrade: bool = False,
+        min_precision: int = 1,
+    ) -> None:
+        """Initialize policy.
+
+        Инициализировать политику.
+
+        Args:
+            max_seconds: Largest estimated time admitted (None for no limit)
+                        Наибольшее допустимое оценённое время (None - без предела)
+            max_bytes: Largest estimated peak memory admitted (None for no limit)
+                      Наибольшая допустимая оценённая память (None - без предела)
+            downgrade: Lower the precision of costly jobs instead of rejecting
+                      Понижать точность дорогих заданий вместо отклонения
+            min_precision: Lowest precision a job may be downgraded to
+                          Наименьшая точность, до которой можно понизить задание
+        """
+        self.max_seconds = max_seconds
+        self.max_bytes = max_bytes
+        self.downgrade = downgrade
+        self.min_precision = min_precision
+
+    def allows(self, estimate: CostEstimate) -> bool:
+        """Check an estimate against the limits.
+
+        Проверить оценку по пределам.
+
+        Args:
+            estimate: Estimate to check
+                     Проверяемая оценка
+
+        Returns:
+            True if the estimate is within every limit
+            True, если оценка укладывается во все пределы
+        """
+        if self.max_seconds is not None and estimate.seconds > self.max_seconds:
+            return False
+        if self.max_bytes is not None and estimate.peak_bytes > self.max_bytes:
+            return False
+        return True
+
+    def admit(self, estimate_at: Callable[[int], CostEstimate], precision: int) -> int:
+        """Get the precision a job may run at.
+
+        Получить точность, с которой может выполняться задание.
+
+        Estimates grow with the precision, so a downgrade binary-searches
+        for the highest precision within the limits.
+
+        Args:
+            estimate_at: Function estimating the job at a given precision
+                        Функция, оценивающая задание при заданной точности
+            precision: Requested precision
+                      Запрошенная точность
+
+        Returns:
+            The requested precision, or a lower one when downgrading
+            Запрошенная точность или более низкая при понижении
+
+        Raises:
+            AdmissionRejectedError: If the job exceeds the limits and cannot
+                                    be downgraded to fit them
+                                   Если задание превышает пределы и его
+                                   нельзя понизить, чтобы уложиться в них
+        """
+        estimate = estimate_at(precision)
+        if self.allows(estimate):
+            return precision
+        lowest = min(self.min_precision, precision)
+        if not self.downgrade or not self.allows(estimate_at(lowest)):
+            raise AdmissionRejectedError(estimate)
+        low, high = lowest, precision - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.allows(estimate_at(middle)):
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+
+# Model shared by all calculators, updated by --calibrate
+default_cost_model = CostModel()
@@ -0,0 +1,230 @@
+"""Exact integer square roots with perfect-square detection.
+
+Точные целочисленные квадратные корни с распознаванием полных квадратов.
+"""
+
+import math
+from decimal import Decimal
+from typing import Optional, Tuple, Union
+
+from .constants import MAX_EXACT_COMPLEX_DIGITS
+from .fixed_point import (
+    EXACT_CONTEXT,
+    FixedPointRoot,
+    count_digits,
+    decimal_to_integer,
+    reduce_exact_root,
+)
+
+# Moduli of the quadratic-residue filters; together they reject about
+# 99.4% of non-squares before any square root is taken
+_FILTER_MODULI = (64, 63, 65, 11)
+_FILTER_PRODUCT = math.prod(_FILTER_MODULI)
+_DECIMAL_FILTER_PRODUCT = Decimal(_FILTER_PRODUCT)
+_QUADRATIC_RESIDUES = {
+    modulus: frozenset(k * k % modulus for k in range(modulus))
+    for modulus in _FILTER_MODULI
+}
+
+
+def passes_residue_filters(n: Union[int, Decimal]) -> bool:
+    """Check whether a non-negative integer can be a perfect square.
+
+    Проверить, может ли неотрицательное целое быть полным квадратом.
+
+    One reduction of ``n`` is followed by lookups in the quadratic residue
+    tables of a few small moduli, so the cost is linear in the size of
+    ``n`` and far below that of ``math.isqrt``. An integral Decimal is
+    reduced in its decimal form, without converting it to int.
+
+    Args:
+        n: Non-negative integer or integral Decimal
+          Неотрицательное целое или целочисленное Decimal
+
+    Returns:
+        False if ``n`` is certainly not a perfect square
+        False, если ``n`` заведомо не является полным квадратом
+    """
+    if isinstance(n, Decimal):
+        reduced = int(EXACT_CONTEXT.remainder(n, _DECIMAL_FILTER_PRODUCT))
+    else:
+        reduced = n % _FILTER_PRODUCT
+    return all(
+        reduced % modulus in _QUADRATIC_RESIDUES[modulus] for modulus in _FILTER_MODULI
+    )
+
+
+class IntegerSquareRoot:
+    """Floor square root of a non-negative integer and its remainder.
+
+    Целая часть квадратного корня неотрицательного целого и остаток.
+
+    The floor root is computed on first use; whether the value is a perfect
+    square is often known from the residue filters alone. A value given as
+    an integral Decimal is filtered in that form and only converted to int
+    when the root or the value itself is read.
+    """
+
+    def __init__(self, value: Union[int, Decimal]) -> None:
+        """Initialize integer square root.
+
+        Инициализировать целочисленный квадратный корень.
+
+        Args:
+            value: Non-negative integer or integral Decimal
+                  Неотрицательное целое или целочисленное Decimal
+        """
+        self._value = value
+        self._root: Optional[int] = None
+        self._is_perfect_square: Optional[bool] = (
+            None if passes_residue_filters(value) else False
+        )
+
+    @property
+    def value(self) -> int:
+        """The integer whose root is taken.
+
+        Целое, из которого извлекается корень.
+        """
+        if isinstance(self._value, Decimal):
+            self._value = decimal_to_integer(self._value)
+        return self._value
+
+    @property
+    def root(self) -> int:
+        """Floor of the square root.
+
+        Целая часть квадратного корня.
+        """
+        if self._root is None:
+            self._root = math.isqrt(self.value)
+        return self._root
+
+    @property
+    def remainder(self) -> int:
+        """Value minus the square of the floor root.
+
+        Значение минус квадрат целой части корня.
+        """
+        return self.value - self.root * self.root
+
+    @property
+    def is_perfect_square(self) -> bool:
+        """Whether the value is the square of an integer.
+
+        Является ли значение квадратом целого числа.
+        """
+        if self._is_perfect_square is None:
+            self._is_perfect_square = self.remainder == 0
+        return self._is_perfect_square
+
+    def __repr__(self) -> str:
+        return (
+            f"IntegerSquareRoot(value=<{count_digits(self.value)} digits>, "
+            f"is_perfect_square={self.is_perfect_square})"
+        )
+
+
+def square_fraction_root(numerator: int, denominator: int) -> Optional[Tuple[int, int]]:
+    """Find the exact root of a reduced fraction of two perfect squares.
+
+    Найти точный корень несократимой дроби из двух полных квадратов.
+
+    The square root of a fraction in lowest terms is rational only when
+    both terms are perfect squares. Both residue filters run before either
+    ``math.isqrt``, so most inputs are rejected almost for free.
+
+    Args:
+        numerator: Non-negative integer numerator
+                  Неотрицательный целый числитель
+        denominator: Positive integer denominator, coprime to the numerator
+                    Положительный целый знаменатель, взаимно простой с числителем
+
+    Returns:
+        Tuple (numerator root, denominator root), or None if the root is
+        irrational
+        Кортеж (корень числителя, корень знаменателя) или None, если корень
+        иррационален
+    """
+    if not (passes_residue_filters(numerator) and passes_residue_filters(denominator)):
+        return None
+    numerator_root = IntegerSquareRoot(numerator)
+    denominator_root = IntegerSquareRoot(denominator)
+    if numerator_root.is_perfect_square and denominator_root.is_perfect_square:
+        return numerator_root.root, denominator_root.root
+    return None
+
+
+def exact_complex_root(
+    real: Decimal, imag: Decimal
+) -> Optional[Tuple[Decimal, Decimal]]:
+    """Find the principal square root of a complex value when it is exact.
+
+    Найти главный квадратный корень комплексного значения, если он точный.
+
+    Both parts are scaled by the same even power of ten to a Gaussian
+    integer a + bi. Its root x + yi is rational only when the norm
+    a**2 + b**2 is a perfect square m**2 and both 2(m + a) = (2x)**2 and
+    2(m - a) = (2y)**2 are perfect squares, so x and y are integers or
+    halves of integers. Residue filters reject most inputs before any
+    ``math.isqrt`` runs.
+
+    Args:
+        real: Finite real part
+             Конечная действительная часть
+        imag: Finite imaginary part
+             Конечная мнимая часть
+
+    Returns:
+        Tuple (real_part, imaginary_part) of the exact root, or None if the
+        root is irrational or the parts span too many digits
+        Кортеж (действительная_часть, мнимая_часть) точного корня или None,
+        если корень иррационален или части занимают слишком много цифр
+    """
+    parts = [part for part in (real, imag) if part]
+    if not parts:
+        return Decimal(0), Decimal(0)
+
+    exponent = min(part.as_tuple().exponent for part in parts)
+    exponent -= exponent % 2
+    if max(part.adjusted() for part in parts) - exponent >= MAX_EXACT_COMPLEX_DIGITS:
+        return None
+
+    a = int(EXACT_CONTEXT.scaleb(real, -exponent))
+    b = int(EXACT_CONTEXT.scaleb(imag, -exponent))
+    norm_root = IntegerSquareRoot(a * a + b * b)
+    if not norm_root.is_perfect_square:
+        return None
+
+    twice_real = IntegerSquareRoot(2 * (norm_root.root + a))
+    twice_imag = IntegerSquareRoot(2 * (norm_root.root - a))
+    if not (twice_real.is_perfect_square and twice_imag.is_perfect_square):
+        return None
+
+    half = exponent // 2
+    return (
+        _half_integer(twice_real.root, half),
+        _half_integer(twice_imag.root, half).copy_sign(imag),
+    )
+
+
+def _half_integer(twice: int, exponent: int) -> Decimal:
+    """Build (twice / 2) * 10**exponent with as few digits as possible.
+
+    Построить (twice / 2) * 10**exponent с наименьшим числом цифр.
+
+    Args:
+        twice: Non-negative integer, twice the coefficient
+              Неотрицательное целое, удвоенный коэффициент
+        exponent: Power of ten of the coefficient
+                 Степень десяти коэффициента
+
+    Returns:
+        Exact Decimal value
+        Точное значение Decimal
+    """
+    if not twice:
+        return Decimal(0)
+    # Halving is multiplying by 5 one decimal place lower
+    root = FixedPointRoot(twice * 5, exponent - 1, True)
+    return reduce_exact_root(root, exponent).to_decimal()
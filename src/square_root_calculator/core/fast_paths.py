@@ -0,0 +1,136 @@
+"""Double-precision fast paths for low-precision square roots.
+
+Быстрые пути в двойной точности для квадратных корней низкой точности.
+"""
+
+import cmath
+import decimal
+from decimal import Decimal
+from typing import Optional, Tuple
+
+from .constants import COMPLEX_GUARD_DIGITS, FAST_PATH_MAX_PRECISION
+
+# Nonzero parts are kept this far inside the double range, so neither the
+# parts nor the root components come near overflow or subnormals
+_MAX_ABS_ADJUSTED = 150
+
+# cmath.sqrt is accurate to a few ulps per component and rounding the inputs
+# to doubles adds about one more; 2**-46 bounds the relative error with room
+# to spare
+_FLOAT_ERROR = 2.0**-46
+
+# Rounding contexts by precision, shared read-only between calls
+_CONTEXTS = {
+    precision: decimal.Context(prec=precision)
+    for precision in range(1, FAST_PATH_MAX_PRECISION + COMPLEX_GUARD_DIGITS + 1)
+}
+
+# Relative half-width of the error interval by precision: the double's
+# error or a few guard-digit ulps of the Decimal path, whichever is larger
+_MARGINS = {
+    precision: max(_FLOAT_ERROR, 10.0 ** (2 - precision - COMPLEX_GUARD_DIGITS))
+    for precision in range(1, FAST_PATH_MAX_PRECISION + 1)
+}
+
+
+def _fits_double(value: Decimal) -> bool:
+    """Check whether a part can be converted to a double without harm.
+
+    Проверить, можно ли без потерь диапазона преобразовать часть в double.
+
+    Args:
+        value: Finite Decimal part
+              Конечная часть Decimal
+
+    Returns:
+        True for zero and for magnitudes well inside the double range
+        True для нуля и для величин глубоко внутри диапазона double
+    """
+    return not value or abs(value.adjusted()) <= _MAX_ABS_ADJUSTED
+
+
+def _round_component(value: float, precision: int) -> Optional[Decimal]:
+    """Round a positive root component the way the Decimal path does.
+
+    Округлить положительную компоненту корня так же, как путь Decimal.
+
+    The Decimal path rounds a guard-digit result to ``precision`` digits,
+    and that result is itself within a few guard-digit ulps of the true
+    component. Both ends of an error interval covering the double and the
+    guard-digit value are rounded twice in the same way, so equal ends
+    prove the Decimal path's digits.
+
+    Args:
+        value: Positive component from ``cmath.sqrt``
+              Положительная компонента из ``cmath.sqrt``
+        precision: Number of significant digits
+                  Количество значащих цифр
+
+    Returns:
+        Component with the Decimal path's digits, or None when the interval
+        straddles a rounding boundary or the digits end in zero
+        Компонента с цифрами пути Decimal или None, если интервал
+        пересекает границу округления или цифры оканчиваются нулём
+    """
+    round_guard = _CONTEXTS[precision + COMPLEX_GUARD_DIGITS].plus
+    round_result = _CONTEXTS[precision].plus
+    margin = _MARGINS[precision]
+    # Decimal(float) is exact, so only the two roundings act on the bounds
+    low = round_result(round_guard(Decimal(value * (1 - margin))))
+    high = round_result(round_guard(Decimal(value * (1 + margin))))
+    # Exact Decimal intermediates drop trailing zeros, so such digits may
+    # be printed shorter on the Decimal path
+    if low != high or str(low).partition("E")[0].endswith("0"):
+        return None
+    return low
+
+
+def float_complex_sqrt(
+    real: Decimal, imag: Decimal, precision: int
+) -> Optional[Tuple[Decimal, Decimal]]:
+    """Compute a low-precision complex square root with ``cmath.sqrt``.
+
+    Вычислить комплексный квадратный корень низкой точности через ``cmath.sqrt``.
+
+    Each component is accepted only if both ends of its error interval
+    round to the same digits, so the result matches the Decimal path digit
+    for digit, zero components and their signs included. Otherwise the
+    caller falls back to Decimal arithmetic.
+
+    Args:
+        real: Finite real part, not both parts zero
+             Конечная действительная часть; обе части не равны нулю
+        imag: Finite imaginary part
+             Конечная мнимая часть
+        precision: Number of significant digits
+                  Количество значащих цифр
+
+    Returns:
+        Tuple (real_part, imaginary_part) of the principal root, or None if
+        the fast path does not apply or cannot prove the rounding
+        Кортеж (действительная_часть, мнимая_часть) главного корня или None,
+        если быстрый путь неприменим или не может доказать округление
+    """
+    if precision > FAST_PATH_MAX_PRECISION:
+        return None
+    if not (_fits_double(real) and _fits_double(imag)):
+        return None
+
+    root = cmath.sqrt(complex(float(real), float(imag)))
+    if not imag:
+        # One component is exactly zero, as on the Decimal path
+        if real.is_signed():
+            root_real, root_imag = Decimal(0), _round_component(
+                abs(root.imag), precision
+            )
+        else:
+            root_real, root_imag = _round_component(abs(root.real), precision), Decimal(
+                0
+            )
+    else:
+        root_real = _round_component(abs(root.real), precision)
+        root_imag = _round_component(abs(root.imag), precision)
+
+    if root_real is None or root_imag is None:
+        return None
+    return root_real, root_imag.copy_sign(imag)
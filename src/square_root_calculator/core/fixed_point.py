@@ -0,0 +1,478 @@
+"""Fixed-point square root engine built on integer square roots.
+
+Движок квадратного корня с фиксированной точкой на основе целочисленного корня.
+"""
+
+import decimal
+import math
+from decimal import Decimal
+from typing import Callable, Iterator, Optional, Tuple
+
+# Context wide enough to shift and convert arbitrarily large values exactly
+EXACT_CONTEXT = decimal.Context(
+    prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+)
+
+_LOG10_2 = 0.30102999566398120
+
+# Below these sizes int <-> Decimal conversions are done directly
+_CONVERSION_BASE_BITS = 1 << 13
+_CONVERSION_BASE_DIGITS = 2500
+
+
+def count_digits(n: int) -> int:
+    """Count decimal digits of a non-negative integer without str().
+
+    Подсчитать десятичные цифры неотрицательного целого числа без str().
+
+    Args:
+        n: Non-negative integer
+          Неотрицательное целое число
+
+    Returns:
+        Number of decimal digits (1 for zero)
+        Количество десятичных цифр (1 для нуля)
+    """
+    if n < 10:
+        return 1
+    digits = int(n.bit_length() * _LOG10_2)
+    while 10**digits > n:
+        digits -= 1
+    while 10 ** (digits + 1) <= n:
+        digits += 1
+    return digits + 1
+
+
+def integer_to_str(n: int) -> str:
+    """Convert a non-negative integer of any size to its decimal digits.
+
+    Преобразовать неотрицательное целое любого размера в десятичные цифры.
+
+    Unlike ``str(n)`` this is not limited by ``sys.get_int_max_str_digits``.
+
+    Args:
+        n: Non-negative integer
+          Неотрицательное целое число
+
+    Returns:
+        Decimal digits of ``n``
+        Десятичные цифры ``n``
+    """
+    return str(integer_to_decimal(n))
+
+
+def integer_to_decimal(n: int) -> Decimal:
+    """Convert an integer of any size to an exact Decimal.
+
+    Преобразовать целое любого размера в точное Decimal.
+
+    ``Decimal(n)`` converts in time quadratic in the number of digits;
+    here ``n`` is split into binary halves that are converted recursively
+    and joined with the fast multiplication of the decimal module.
+
+    Args:
+        n: Integer value
+          Целое значение
+
+    Returns:
+        Decimal equal to ``n`` with exponent 0
+        Decimal, равное ``n``, с показателем 0
+    """
+    if n < 0:
+        return integer_to_decimal(-n).copy_negate()
+    powers = {}
+
+    def power(bits: int) -> Decimal:
+        if bits not in powers:
+            if bits <= _CONVERSION_BASE_BITS:
+                powers[bits] = Decimal(1 << bits)
+            else:
+                half = power(bits >> 1)
+                powers[bits] = EXACT_CONTEXT.multiply(half, half)
+        return powers[bits]
+
+    def convert(value: int, bits: int) -> Decimal:
+        if bits <= _CONVERSION_BASE_BITS:
+            return Decimal(value)
+        bits >>= 1
+        high = value >> bits
+        low = value - (high << bits)
+        return EXACT_CONTEXT.fma(convert(high, bits), power(bits), convert(low, bits))
+
+    bits = _CONVERSION_BASE_BITS
+    while bits < n.bit_length():
+        bits <<= 1
+    return convert(n, bits)
+
+
+def decimal_to_integer(num: Decimal) -> int:
+    """Convert an integral Decimal of any size to int.
+
+    Преобразовать целочисленное Decimal любого размера в int.
+
+    ``int(num)`` converts in time quadratic in the number of digits; here
+    the digits are split into decimal halves that are converted recursively
+    and joined with one multiplication by a power of ten.
+
+    Args:
+        num: Finite Decimal with an integral value
+            Конечное Decimal с целым значением
+
+    Returns:
+        Integer equal to ``num``
+        Целое, равное ``num``
+    """
+    if num.is_signed():
+        return -decimal_to_integer(num.copy_abs())
+    powers = {}
+
+    def convert(value: Decimal, digits: int) -> int:
+        if digits <= _CONVERSION_BASE_DIGITS:
+            return int(value)
+        digits >>= 1
+        high = EXACT_CONTEXT.scaleb(value, -digits).to_integral_value(
+            rounding=decimal.ROUND_DOWN, context=EXACT_CONTEXT
+        )
+        low = EXACT_CONTEXT.subtract(value, EXACT_CONTEXT.scaleb(high, digits))
+        if digits not in powers:
+            powers[digits] = 10**digits
+        return convert(high, digits) * powers[digits] + convert(low, digits)
+
+    digits = _CONVERSION_BASE_DIGITS
+    while digits <= num.adjusted():
+        digits <<= 1
+    return convert(num, digits)
+
+
+def decimal_to_integer_parts(num: Decimal) -> Tuple[int, int]:
+    """Split a finite Decimal into an integer coefficient and exponent.
+
+    Разделить конечное Decimal на целый коэффициент и показатель степени.
+
+    Args:
+        num: Finite Decimal value
+            Конечное значение Decimal
+
+    Returns:
+        Tuple (coefficient, exponent) with value = coefficient * 10**exponent
+        Кортеж (коэффициент, показатель) со значением коэффициент * 10**показатель
+    """
+    exponent = num.as_tuple().exponent
+    coefficient = decimal_to_integer(EXACT_CONTEXT.scaleb(num.copy_abs(), -exponent))
+    if num.is_signed():
+        coefficient = -coefficient
+    return coefficient, exponent
+
+
+def decimal_exponent(num: Decimal) -> int:
+    """Get the exponent of a finite Decimal without building its digit tuple.
+
+    Получить показатель конечного Decimal, не строя кортеж его цифр.
+
+    Args:
+        num: Finite Decimal value
+            Конечное значение Decimal
+
+    Returns:
+        Exponent of the last coefficient digit
+        Показатель последней цифры коэффициента
+    """
+    # num - num is an exact zero that keeps the exponent of num
+    return EXACT_CONTEXT.subtract(num, num).as_tuple().exponent
+
+
+def isqrt_rem(n: int) -> Tuple[int, int]:
+    """Floor square root and remainder of a non-negative integer.
+
+    Целая часть квадратного корня и остаток неотрицательного целого.
+
+    Args:
+        n: Non-negative integer
+          Неотрицательное целое число
+
+    Returns:
+        Tuple (root, n - root**2) computed with ``math.isqrt``
+        Кортеж (корень, n - корень**2), вычисленный через ``math.isqrt``
+    """
+    root = math.isqrt(n)
+    return root, n - root * root
+
+
+class FixedPointRoot:
+    """Square root stored as an integer mantissa and a decimal exponent.
+
+    Квадратный корень, хранимый как целая мантисса и десятичный показатель.
+    """
+
+    def __init__(self, mantissa: int, exponent: int, is_exact: bool) -> None:
+        """Initialize fixed-point root.
+
+        Инициализировать корень с фиксированной точкой.
+
+        Args:
+            mantissa: Integer digits of the root
+                     Целые цифры корня
+            exponent: Power of ten applied to the mantissa
+                     Степень десяти, применяемая к мантиссе
+            is_exact: Whether the root is exact (no rounding happened)
+                     Является ли корень точным (без округления)
+        """
+        self.mantissa = mantissa
+        self.exponent = exponent
+        self.is_exact = is_exact
+
+    def to_decimal(self) -> Decimal:
+        """Convert the root to a Decimal.
+
+        Преобразовать корень в Decimal.
+
+        Returns:
+            Root as Decimal with the same digits and exponent
+            Корень как Decimal с теми же цифрами и показателем
+        """
+        return EXACT_CONTEXT.scaleb(integer_to_decimal(self.mantissa), self.exponent)
+
+    def __repr__(self) -> str:
+        return (
+            f"FixedPointRoot(mantissa=<{count_digits(self.mantissa)} digits>, "
+            f"exponent={self.exponent}, is_exact={self.is_exact})"
+        )
+
+
+def round_floor_root(
+    root: int, exponent: int, precision: int, is_exact: bool
+) -> FixedPointRoot:
+    """Round a floor root to ``precision`` significant digits (half-even).
+
+    Округлить корень с отбрасыванием до ``precision`` значащих цифр (до чётного).
+
+    Args:
+        root: Floor of the true root scaled by 10**-exponent
+             Целая часть истинного корня, умноженного на 10**-exponent
+        exponent: Power of ten of the last digit of ``root``
+                 Степень десяти последней цифры ``root``
+        precision: Number of significant digits to keep
+                  Количество сохраняемых значащих цифр
+        is_exact: Whether ``root`` equals the true root exactly
+                 Равен ли ``root`` истинному корню точно
+
+    Returns:
+        Correctly rounded FixedPointRoot
+        Корректно округлённый FixedPointRoot
+    """
+    excess = count_digits(root) - precision
+    if excess <= 0:
+        return FixedPointRoot(root, exponent, is_exact)
+
+    scale = 10**excess
+    mantissa, tail = divmod(root, scale)
+    half = scale // 2
+    # A non-exact root lies strictly above ``root``, so an exact half tail
+    # only counts as a tie when nothing was discarded before it
+    if tail > half or (tail == half and (not is_exact or mantissa % 2 == 1)):
+        mantissa += 1
+        if mantissa == 10**precision:
+            mantissa //= 10
+            excess += 1
+    return FixedPointRoot(mantissa, exponent + excess, is_exact and tail == 0)
+
+
+def reduce_exact_root(root: FixedPointRoot, ideal_exponent: int) -> FixedPointRoot:
+    """Strip trailing zeros of an exact root toward the ideal exponent.
+
+    Убрать конечные нули точного корня до идеального показателя.
+
+    Mirrors ``Decimal.sqrt``, which reports exact results with the smallest
+    number of digits that keeps the exponent at or above ``ideal_exponent``.
+
+    Args:
+        root: Root to reduce
+             Корень для сокращения
+        ideal_exponent: Exponent the exact result should aim for
+                       Показатель, к которому стремится точный результат
+
+    Returns:
+        Reduced FixedPointRoot
+        Сокращённый FixedPointRoot
+    """
+    if not root.is_exact:
+        return root
+    mantissa, exponent = root.mantissa, root.exponent
+    if mantissa == 0:
+        return FixedPointRoot(0, ideal_exponent, True)
+    if exponent >= ideal_exponent:
+        return root
+    # One count and one division; stripping a digit at a time is quadratic
+    digits = integer_to_str(mantissa)
+    zeros = min(len(digits) - len(digits.rstrip("0")), ideal_exponent - exponent)
+    return FixedPointRoot(mantissa // 10**zeros, exponent + zeros, True)
+
+
+def fixed_point_sqrt(
+    coefficient: int,
+    exponent: int,
+    precision: int,
+    sqrtrem: Callable[[int], Tuple[int, int]] = isqrt_rem,
+    ideal_exponent: Optional[int] = None,
+) -> FixedPointRoot:
+    """Compute sqrt(coefficient * 10**exponent) with an integer square root.
+
+    Вычислить sqrt(coefficient * 10**exponent) с помощью целочисленного корня.
+
+    The input is scaled to an integer with at least ``2 * precision + 2``
+    digits, so the integer root carries a guard digit for correct rounding.
+    Digits of the input below that scale are dropped, which keeps the cost
+    bound to the requested precision rather than to the input length.
+
+    Args:
+        coefficient: Non-negative integer coefficient of the input
+                    Неотрицательный целый коэффициент входного значения
+        exponent: Power of ten of the input
+                 Степень десяти входного значения
+        precision: Number of significant digits of the result
+                  Количество значащих цифр результата
+        sqrtrem: Integer square root with remainder (default: ``math.isqrt``)
+                Целочисленный корень с остатком (по умолчанию: ``math.isqrt``)
+        ideal_exponent: Exponent exact roots are reduced toward
+                       (default: ``exponent // 2``)
+                       Показатель, к которому сокращаются точные корни
+                       (по умолчанию: ``exponent // 2``)
+
+    Returns:
+        FixedPointRoot rounded to ``precision`` digits, half-even
+        FixedPointRoot, округлённый до ``precision`` цифр до чётного
+    """
+    if ideal_exponent is None:
+        ideal_exponent = exponent // 2
+    if coefficient == 0:
+        return FixedPointRoot(0, ideal_exponent, True)
+
+    # Root exponent chosen so the scaled integer has 2*precision+2 digits
+    root_exponent = (count_digits(coefficient) + exponent - 2 * precision - 2) // 2
+    shift = exponent - 2 * root_exponent
+    if shift >= 0:
+        scaled = coefficient * 10**shift
+        truncated = False
+    else:
+        scaled, dropped = divmod(coefficient, 10**-shift)
+        truncated = dropped != 0
+
+    root, remainder = sqrtrem(scaled)
+    is_exact = not truncated and remainder == 0
+    rounded = round_floor_root(root, root_exponent, precision, is_exact)
+    return reduce_exact_root(rounded, ideal_exponent)
+
+
+def rational_sqrt(numerator: int, denominator: int, precision: int) -> FixedPointRoot:
+    """Compute sqrt(numerator / denominator) with one ``math.isqrt``.
+
+    Вычислить sqrt(numerator / denominator) одним вызовом ``math.isqrt``.
+
+    The fraction is scaled by an even power of ten and floor-divided once,
+    then its integer root is rounded like in ``fixed_point_sqrt``. Since
+    floor(sqrt(floor(x))) equals floor(sqrt(x)), the division loses
+    nothing, and the work depends on the sizes of the two terms and the
+    precision, never on a decimal expansion of the quotient.
+
+    Args:
+        numerator: Non-negative integer numerator
+                  Неотрицательный целый числитель
+        denominator: Positive integer denominator
+                    Положительный целый знаменатель
+        precision: Number of significant digits of the result
+                  Количество значащих цифр результата
+
+    Returns:
+        FixedPointRoot rounded to ``precision`` digits, half-even
+        FixedPointRoot, округлённый до ``precision`` цифр до чётного
+    """
+    if numerator == 0:
+        return FixedPointRoot(0, 0, True)
+
+    # The quotient is at least 10**(digits difference - 1), so this root
+    # exponent leaves 2*precision+2 digits in the scaled integer
+    root_exponent = (
+        count_digits(numerator) - count_digits(denominator) - 2 * precision - 2
+    ) // 2
+    shift = -2 * root_exponent
+    if shift >= 0:
+        scaled, dropped = divmod(numerator * 10**shift, denominator)
+    else:
+        scaled, dropped = divmod(numerator, denominator * 10**-shift)
+
+    root = math.isqrt(scaled)
+    is_exact = dropped == 0 and root * root == scaled
+    rounded = round_floor_root(root, root_exponent, precision, is_exact)
+    return reduce_exact_root(rounded, 0)
+
+
+def iter_sqrt_digits(
+    coefficient: int, exponent: int, decimal_places: int, chunk_size: int
+) -> Iterator[str]:
+    """Yield the digits of sqrt(coefficient * 10**exponent) block by block.
+
+    Выдавать цифры sqrt(coefficient * 10**exponent) блок за блоком.
+
+    Uses the schoolbook digit-by-digit square root with ``chunk_size``
+    digits per step: the next block ``t`` is the largest value with
+    ``(2 * root * 10**chunk + t) * t <= remainder``. Every yielded digit is
+    final (the expansion is truncated, not rounded); the only state kept is
+    the partial root, its remainder and the unread input digits.
+
+    Args:
+        coefficient: Non-negative integer coefficient of the input
+                    Неотрицательный целый коэффициент входного значения
+        exponent: Power of ten of the input
+                 Степень десяти входного значения
+        decimal_places: Number of fractional digits to produce
+                       Количество генерируемых дробных цифр
+        chunk_size: Maximum number of digits per yielded string
+                   Максимальное количество цифр в одной выдаваемой строке
+
+    Yields:
+        Digit strings; the first fractional block starts with "."
+        Строки цифр; первый дробный блок начинается с "."
+    """
+    if exponent >= 0:
+        integer, fraction, fraction_digits = coefficient * 10**exponent, 0, 0
+    else:
+        integer, fraction = divmod(coefficient, 10**-exponent)
+        fraction_digits = -exponent
+
+    root = math.isqrt(integer)
+    remainder = integer - root * root
+    integer_digits = integer_to_str(root)
+    for start in range(0, len(integer_digits), chunk_size):
+        yield integer_digits[start : start + chunk_size]
+
+    produced = 0
+    while produced < decimal_places and (remainder or fraction):
+        block = min(chunk_size, decimal_places - produced)
+
+        # Bring down the next 2 * block input digits (zeros once exhausted)
+        if fraction_digits > 2 * block:
+            fraction_digits -= 2 * block
+            pairs, fraction = divmod(fraction, 10**fraction_digits)
+        else:
+            pairs = fraction * 10 ** (2 * block - fraction_digits)
+            fraction, fraction_digits = 0, 0
+        remainder = remainder * 10 ** (2 * block) + pairs
+
+        shifted = root * 10**block
+        if root >= 10**block:
+            # The t**2 term is below 2 * shifted, so the estimate is at most
+            # one or two too large
+            digit_block = remainder // (2 * shifted)
+            while (2 * shifted + digit_block) * digit_block > remainder:
+                digit_block -= 1
+        else:
+            digit_block = math.isqrt(shifted * shifted + remainder) - shifted
+
+        remainder -= (2 * shifted + digit_block) * digit_block
+        root = shifted + digit_block
+
+        digits = integer_to_str(digit_block).zfill(block)
+        if not remainder and not fraction:
+            digits = digits.rstrip("0")
+        yield ("." if produced == 0 else "") + digits
+        produced += block
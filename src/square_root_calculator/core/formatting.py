@@ -0,0 +1,74 @@
+"""Decimal-native formatting of calculation results.
+
+Форматирование результатов вычислений без перехода к float.
+"""
+
+import decimal
+from decimal import Decimal
+
+from .fixed_point import EXACT_CONTEXT, decimal_exponent
+
+
+def format_scientific(value: Decimal, fraction_digits: int) -> str:
+    """Format a finite Decimal in scientific notation like ``"{:.Ne}"``.
+
+    Форматировать конечное Decimal в научной нотации как ``"{:.Ne}"``.
+
+    The mantissa is rounded half-even from the digit tuple and the exponent
+    comes from ``adjusted()``, so any magnitude and any number of digits
+    work without a float round-trip.
+
+    Args:
+        value: Finite Decimal value
+              Конечное значение Decimal
+        fraction_digits: Number of mantissa digits after the decimal point
+                        Количество цифр мантиссы после десятичной точки
+
+    Returns:
+        String such as "1.4142e+00" or "3.1623e+500"
+        Строка вида "1.4142e+00" или "3.1623e+500"
+    """
+    sign = "-" if value.is_signed() else ""
+    if not value:
+        coefficient, exponent = "0", 0
+    else:
+        context = decimal.Context(
+            prec=fraction_digits + 1, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+        )
+        rounded = context.plus(value)
+        coefficient = "".join(map(str, rounded.as_tuple().digits))
+        exponent = rounded.adjusted()
+
+    coefficient = coefficient.ljust(fraction_digits + 1, "0")
+    mantissa = coefficient[0]
+    if fraction_digits > 0:
+        mantissa += "." + coefficient[1:]
+    return f"{sign}{mantissa}e{exponent:+03d}"
+
+
+def format_decimal(value: Decimal, max_places: int, positional: bool = False) -> str:
+    """Format a finite Decimal with at most a number of decimal places.
+
+    Форматировать конечное Decimal не более чем с заданным числом знаков
+    после запятой.
+
+    Extra places are rounded half-even, not cut off. Without ``positional``
+    values that ``str`` writes with an exponent are returned unchanged.
+
+    Args:
+        value: Finite Decimal value
+              Конечное значение Decimal
+        max_places: Maximum number of digits after the decimal point
+                   Максимальное количество цифр после десятичной точки
+        positional: Always write the value without an exponent
+                   Всегда записывать значение без экспоненты
+
+    Returns:
+        String such as "1.4142" or, when positional, "0.0000001"
+        Строка вида "1.4142" или, при positional, "0.0000001"
+    """
+    if not positional and "E" in str(value):
+        return str(value)
+    if decimal_exponent(value) < -max_places:
+        value = EXACT_CONTEXT.quantize(value, Decimal((0, (1,), -max_places)))
+    return format(value, "f") if positional else str(value)
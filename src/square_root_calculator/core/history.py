@@ -22,6 +22,7 @@ class HistoryEntry:
         is_complex: bool = False,
         real_part: Optional[str] = None,
         imag_part: Optional[str] = None,
+        is_exact: bool = False,
     ) -> None:
         """Initialize history entry.
 
@@ -42,6 +43,8 @@ class HistoryEntry:
                       Действительная часть для комплексных чисел
             imag_part: Imaginary part for complex numbers
                       Мнимая часть для комплексных чисел
+            is_exact: Whether the result is exact rather than rounded
+                     Является ли результат точным, а не округлённым
         """
         self.input_value = input_value
         self.result_text = result_text
@@ -50,6 +53,7 @@ class HistoryEntry:
         self.is_complex = is_complex
         self.real_part = real_part
         self.imag_part = imag_part
+        self.is_exact = is_exact
 
     def to_dict(self) -> dict:
         """Convert to dictionary.
@@ -105,6 +109,7 @@ class HistoryManager:
         is_complex: bool = False,
         real_part: Optional[str] = None,
         imag_part: Optional[str] = None,
+        is_exact: bool = False,
     ) -> None:
         """Add a new entry to history.
 
@@ -123,6 +128,8 @@ class HistoryManager:
                       Действительная часть для комплексных чисел
             imag_part: Imaginary part for complex numbers
                       Мнимая часть для комплексных чисел
+            is_exact: Whether the result is exact rather than rounded
+                     Является ли результат точным, а не округлённым
         """
         entry = HistoryEntry(
             input_value,
@@ -131,6 +138,7 @@ class HistoryManager:
             is_complex=is_complex,
             real_part=real_part,
             imag_part=imag_part,
+            is_exact=is_exact,
         )
         self.entries.insert(0, entry)  # Add to beginning
 
@@ -0,0 +1,197 @@
+"""Working precision of roots wanted to a number of decimal places.
+
+Рабочая точность корней, требуемых с заданным числом знаков после запятой.
+
+A decimal context counts significant digits, so N places of a root need
+as many significant digits as the root has integer digits, plus N. The
+exponent of a real root follows exactly from the input's, which makes
+one root at that precision correctly rounded to N places with no guard
+digits; complex parts are only bounded and carry guard digits instead.
+"""
+
+from decimal import Decimal
+from fractions import Fraction
+from typing import Optional, Union
+
+from .constants import MAX_PLACES_INTEGER_DIGITS
+from .fixed_point import EXACT_CONTEXT, count_digits
+
+
+def root_adjusted(adjusted: int) -> int:
+    """Get the exponent of the leading digit of a square root.
+
+    Получить показатель старшей цифры квадратного корня.
+
+    For x = m * 10**a with 1 <= m < 10, sqrt(x) is sqrt(m) * 10**(a/2) or
+    sqrt(10m) * 10**((a-1)/2), both with a leading digit at floor(a/2).
+
+    Args:
+        adjusted: Exponent of the leading digit of a positive input
+                 Показатель старшей цифры положительного входа
+
+    Returns:
+        Exponent of the leading digit of the root
+        Показатель старшей цифры корня
+    """
+    return adjusted // 2
+
+
+def fraction_adjusted(numerator: int, denominator: int) -> int:
+    """Get the exponent of the leading digit of a positive fraction.
+
+    Получить показатель старшей цифры положительной дроби.
+
+    Args:
+        numerator: Positive numerator
+                  Положительный числитель
+        denominator: Positive denominator
+                    Положительный знаменатель
+
+    Returns:
+        floor(log10(numerator / denominator))
+        floor(log10(numerator / denominator))
+    """
+    adjusted = count_digits(numerator) - count_digits(denominator)
+    if adjusted >= 0:
+        below = numerator < denominator * 10**adjusted
+    else:
+        below = numerator * 10**-adjusted < denominator
+    return adjusted - 1 if below else adjusted
+
+
+def real_significant_digits(adjusted: int, places: int) -> int:
+    """Get the significant digits giving a real root to a number of places.
+
+    Получить число значащих цифр, дающее действительный корень с заданным
+    числом знаков после запятой.
+
+    Rounded half-even to this many digits, the root is the correctly
+    rounded root to ``places`` places. A result below 1 means the root is
+    under one unit of the last place; see ``round_small_root``.
+
+    Args:
+        adjusted: Exponent of the leading digit of the positive input
+                 Показатель старшей цифры положительного входа
+        places: Decimal places wanted
+               Требуемое число знаков после запятой
+
+    Returns:
+        Number of significant digits, possibly zero or negative
+        Количество значащих цифр, возможно нулевое или отрицательное
+    """
+    return root_adjusted(adjusted) + 1 + places
+
+
+def fits_places(significant: int, places: int, guard: int = 0) -> bool:
+    """Check whether a planned root is short enough to write to places.
+
+    Проверить, достаточно ли короток запланированный корень для записи
+    со знаками после запятой.
+
+    Args:
+        significant: Planned significant digits
+                    Запланированные значащие цифры
+        places: Decimal places wanted
+               Требуемое число знаков после запятой
+        guard: Guard digits included in ``significant``
+              Защитные цифры, входящие в ``significant``
+
+    Returns:
+        True if the root has at most MAX_PLACES_INTEGER_DIGITS integer digits
+        True, если у корня не больше MAX_PLACES_INTEGER_DIGITS целых цифр
+    """
+    return significant - places - guard <= MAX_PLACES_INTEGER_DIGITS
+
+
+def complex_significant_digits(
+    real: Decimal, imag: Decimal, places: int, guard: int
+) -> int:
+    """Get the significant digits giving both parts of a complex root.
+
+    Получить число значащих цифр для обеих частей комплексного корня.
+
+    Both parts of sqrt(a + bi) are at most sqrt(|a + bi|), and the modulus
+    has its leading digit at most one place above the larger part's.
+
+    Args:
+        real: Real part of the input
+             Действительная часть входа
+        imag: Imaginary part of the input
+             Мнимая часть входа
+        places: Decimal places wanted
+               Требуемое число знаков после запятой
+        guard: Extra digits deciding the final rounding
+              Дополнительные цифры, решающие окончательное округление
+
+    Returns:
+        Number of significant digits, at least 1
+        Количество значащих цифр, не меньше 1
+    """
+    largest = max(part.adjusted() for part in (real, imag) if part)
+    return max(root_adjusted(largest + 1) + 1 + places + guard, 1)
+
+
+def round_to_places(
+    value: Decimal, places: int, tolerance: Decimal = Decimal(0)
+) -> Optional[Decimal]:
+    """Round a value known to within a tolerance to a number of places.
+
+    Округлить значение, известное с заданной погрешностью, до числа знаков.
+
+    Rounding is monotonic, so when both ends of [value - tolerance,
+    value + tolerance] round alike, so does the true value.
+
+    Args:
+        value: Approximation of the true value
+              Приближение истинного значения
+        places: Decimal places of the result
+               Число знаков после запятой результата
+        tolerance: Largest distance to the true value
+                  Наибольшее расстояние до истинного значения
+
+    Returns:
+        Value rounded half-even to ``places`` places, or None if the
+        tolerance straddles a rounding boundary
+        Значение, округлённое до чётного до ``places`` знаков, или None,
+        если погрешность пересекает границу округления
+    """
+    quantum = Decimal((0, (1,), -places))
+    rounded = EXACT_CONTEXT.quantize(value, quantum)
+    if tolerance:
+        lower = EXACT_CONTEXT.quantize(
+            EXACT_CONTEXT.subtract(value, tolerance), quantum
+        )
+        upper = EXACT_CONTEXT.quantize(EXACT_CONTEXT.add(value, tolerance), quantum)
+        if lower != upper:
+            return None
+    return rounded
+
+
+def round_small_root(
+    value: Union[Decimal, Fraction], places: int, significant: int
+) -> Decimal:
+    """Round a root below one unit of the last place.
+
+    Округлить корень, меньший единицы последнего знака.
+
+    With no significant digit to compute, the root rounds either to zero
+    or to one unit of the last place, decided by comparing the input with
+    the square of half a unit.
+
+    Args:
+        value: Positive input, compared exactly
+              Положительный вход, сравниваемый точно
+        places: Decimal places of the result
+               Число знаков после запятой результата
+        significant: Result of ``real_significant_digits``, at most 0
+                    Результат ``real_significant_digits``, не больше 0
+
+    Returns:
+        Zero or one unit of the last place, with ``places`` places
+        Ноль или единица последнего знака с ``places`` знаками
+    """
+    # Only a root one digit below the last place can reach half a unit;
+    # an exact half is a tie, which rounds to the even zero
+    if significant == 0 and value > Fraction(1, 4 * 10 ** (2 * places)):
+        return Decimal((0, (1,), -places))
+    return Decimal((0, (0,), -places))
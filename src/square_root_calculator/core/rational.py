@@ -0,0 +1,256 @@
+"""Rational approximations of exact decimal values by continued fractions.
+
+Рациональные приближения точных десятичных значений цепными дробями.
+"""
+
+from decimal import Decimal
+from fractions import Fraction
+from typing import Iterator, List, Optional, Tuple, Union
+
+from .fixed_point import EXACT_CONTEXT, decimal_to_integer_parts
+
+
+class ContinuedFraction:
+    """Lazily expanded continued fraction of a finite decimal value.
+
+    Лениво раскрываемая цепная дробь конечного десятичного значения.
+
+    The value is taken exactly (all of its digits), and partial quotients
+    and convergents are kept as they are found, so asking for a tighter
+    bound continues the expansion instead of restarting it. Errors of
+    approximations are compared in integers, so the long exact value only
+    becomes a Fraction when ``value`` is read.
+    """
+
+    def __init__(self, value: Union[Decimal, int, Fraction]) -> None:
+        """Initialize continued fraction.
+
+        Инициализировать цепную дробь.
+
+        Args:
+            value: Finite value to expand
+                  Конечное значение для разложения
+
+        Raises:
+            ValueError: If the value is not finite
+                       Если значение не является конечным
+        """
+        if isinstance(value, Decimal):
+            numerator, denominator = _decimal_ratio(value)
+        else:
+            numerator, denominator = Fraction(value).as_integer_ratio()
+        self._ratio = (numerator, denominator)
+        self._value: Optional[Fraction] = None
+        self.quotients: List[int] = []
+        self.convergents: List[Tuple[int, int]] = []
+        # Euclid state: the remaining tail equals numerator / denominator
+        self._numerator = numerator
+        self._denominator = denominator
+
+    @property
+    def value(self) -> Fraction:
+        """The exact value being expanded.
+
+        Точное раскладываемое значение.
+        """
+        if self._value is None:
+            self._value = Fraction(*self._ratio)
+        return self._value
+
+    def is_within(
+        self, approximation: Fraction, max_error: Union[Decimal, Fraction, int, float]
+    ) -> bool:
+        """Check whether an approximation is within a distance of the value.
+
+        Проверить, лежит ли приближение в пределах расстояния от значения.
+
+        Args:
+            approximation: Rational approximation
+                          Рациональное приближение
+            max_error: Largest allowed absolute error
+                      Наибольшая допустимая абсолютная погрешность
+
+        Returns:
+            True if the absolute error does not exceed ``max_error``
+            True, если абсолютная погрешность не превышает ``max_error``
+        """
+        bound = Fraction(max_error)
+        # |p/q - a/b| <= m/n  <=>  |p*b - a*q| * n <= m * q * b
+        return (
+            self._gap(approximation) * bound.denominator
+            <= bound.numerator * self._ratio[1] * approximation.denominator
+        )
+
+    def _gap(self, approximation: Fraction) -> int:
+        """Numerator of the error of an approximation over q * its denominator.
+
+        Числитель погрешности приближения над q * его знаменатель.
+
+        Args:
+            approximation: Rational approximation a/b of the value p/q
+                          Рациональное приближение a/b значения p/q
+
+        Returns:
+            |p*b - a*q|, the error times q*b
+            |p*b - a*q|, погрешность, умноженная на q*b
+        """
+        numerator, denominator = self._ratio
+        return abs(
+            numerator * approximation.denominator
+            - approximation.numerator * denominator
+        )
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether all partial quotients have been found.
+
+        Найдены ли все неполные частные.
+        """
+        return self._denominator == 0
+
+    def _extend(self) -> bool:
+        """Find the next partial quotient and convergent.
+
+        Найти следующее неполное частное и подходящую дробь.
+
+        Returns:
+            False if the expansion is already complete
+            False, если разложение уже завершено
+        """
+        if self.is_complete:
+            return False
+
+        quotient, remainder = divmod(self._numerator, self._denominator)
+        self._numerator, self._denominator = self._denominator, remainder
+
+        if len(self.convergents) >= 2:
+            (h0, k0), (h1, k1) = self.convergents[-2:]
+        elif self.convergents:
+            (h0, k0), (h1, k1) = (1, 0), self.convergents[-1]
+        else:
+            (h0, k0), (h1, k1) = (0, 1), (1, 0)
+        self.quotients.append(quotient)
+        self.convergents.append((quotient * h1 + h0, quotient * k1 + k0))
+        return True
+
+    def iter_convergents(self) -> Iterator[Fraction]:
+        """Yield the convergents in order, expanding as needed.
+
+        Выдавать подходящие дроби по порядку, раскрывая дробь по мере надобности.
+
+        Yields:
+            Successive convergents, ending with the value itself
+            Последовательные подходящие дроби, заканчивая самим значением
+        """
+        index = 0
+        while index < len(self.convergents) or self._extend():
+            yield Fraction(*self.convergents[index])
+            index += 1
+
+    def best_approximation(
+        self,
+        max_denominator: Optional[int] = None,
+        max_error: Optional[Union[Decimal, Fraction, int]] = None,
+    ) -> Fraction:
+        """Find the best rational approximation within the given bounds.
+
+        Найти наилучшее рациональное приближение в заданных границах.
+
+        With ``max_denominator`` the result is the closest fraction whose
+        denominator does not exceed the bound, semiconvergents included.
+        With ``max_error`` it is the first convergent (the one with the
+        smallest denominator) within that distance of the value. When both
+        are given the denominator bound wins.
+
+        Args:
+            max_denominator: Largest allowed denominator
+                            Наибольший допустимый знаменатель
+            max_error: Largest allowed absolute error
+                      Наибольшая допустимая абсолютная погрешность
+
+        Returns:
+            Best approximation (the value itself when no bound is given)
+            Наилучшее приближение (само значение, если границы не заданы)
+
+        Raises:
+            ValueError: If max_denominator is less than 1 or max_error is negative
+                       Если max_denominator меньше 1 или max_error отрицательна
+        """
+        if max_denominator is not None and max_denominator < 1:
+            raise ValueError("max_denominator must be at least 1")
+        if max_error is not None and max_error < 0:
+            raise ValueError("max_error must not be negative")
+
+        best = None
+        for index, convergent in enumerate(self.iter_convergents()):
+            if max_denominator is not None and convergent.denominator > max_denominator:
+                return self._best_semiconvergent(index, max_denominator)
+            best = convergent
+            if max_error is not None and self.is_within(best, max_error):
+                break
+        return best
+
+    def _best_semiconvergent(self, index: int, max_denominator: int) -> Fraction:
+        """Choose between the last convergent and the largest semiconvergent.
+
+        Выбрать между последней подходящей дробью и наибольшей промежуточной.
+
+        Args:
+            index: Index of the first convergent above the denominator bound
+                  Индекс первой подходящей дроби, превышающей границу знаменателя
+            max_denominator: Largest allowed denominator
+                            Наибольший допустимый знаменатель
+
+        Returns:
+            Closest fraction with denominator at most ``max_denominator``
+            Ближайшая дробь со знаменателем не больше ``max_denominator``
+        """
+        h1, k1 = self.convergents[index - 1]
+        h0, k0 = self.convergents[index - 2] if index >= 2 else (1, 0)
+        steps = (max_denominator - k0) // k1
+        semiconvergent = Fraction(h0 + steps * h1, k0 + steps * k1)
+        convergent = Fraction(h1, k1)
+        # Errors gap/(q*k) compare as gap*k' across; on a tie the convergent
+        # wins, it has the smaller denominator
+        if (
+            self._gap(semiconvergent) * k1
+            < self._gap(convergent) * semiconvergent.denominator
+        ):
+            return semiconvergent
+        return convergent
+
+
+def _decimal_ratio(value: Decimal) -> Tuple[int, int]:
+    """Get a finite Decimal as a fraction in lowest terms without a gcd.
+
+    Получить конечное Decimal как несократимую дробь без НОД.
+
+    The denominator is a power of ten, so only its factors 2 and 5 can be
+    shared with the coefficient, and after trailing zeros are dropped the
+    coefficient has at most one of them.
+
+    Args:
+        value: Finite Decimal value
+              Конечное значение Decimal
+
+    Returns:
+        Tuple (numerator, denominator) in lowest terms
+        Кортеж (числитель, знаменатель) в несократимом виде
+
+    Raises:
+        ValueError: If the value is not finite
+                   Если значение не является конечным
+    """
+    if not value.is_finite():
+        raise ValueError(f"Cannot expand a non-finite value: {value}")
+    numerator, exponent = decimal_to_integer_parts(EXACT_CONTEXT.normalize(value))
+    if exponent >= 0:
+        return numerator * 10**exponent, 1
+    places = -exponent
+    twos = min((numerator & -numerator).bit_length() - 1, places)
+    numerator >>= twos
+    fives = 0
+    while not twos and fives < places and numerator % 5 == 0:
+        numerator //= 5
+        fives += 1
+    return numerator, 2 ** (places - twos) * 5 ** (places - fives)
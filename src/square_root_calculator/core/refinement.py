@@ -0,0 +1,200 @@
+"""Newton refinement of square roots from lower-precision seeds.
+
+Уточнение квадратных корней методом Ньютона от начальных значений меньшей точности.
+"""
+
+import decimal
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+from .cancellation import checkpoint
+from .constants import REFINEMENT_GUARD_DIGITS
+from .fixed_point import EXACT_CONTEXT, decimal_exponent
+
+
+def precision_schedule(seed_digits: int, target: int) -> List[int]:
+    """Plan the working precisions of precision-doubling Newton steps.
+
+    Спланировать рабочие точности шагов Ньютона с удвоением точности.
+
+    Args:
+        seed_digits: Number of correct digits in the seed
+                    Количество верных цифр начального значения
+        target: Precision the last step must reach
+               Точность, которую должен достичь последний шаг
+
+    Returns:
+        Increasing list of step precisions ending with ``target``
+        Возрастающий список точностей шагов, заканчивающийся ``target``
+    """
+    schedule = [target]
+    while schedule[-1] > 2 * seed_digits:
+        schedule.append(schedule[-1] // 2 + 1)
+    schedule.reverse()
+    return schedule
+
+
+def newton_sqrt(num: Decimal, seed: Decimal, precision: int) -> Decimal:
+    """Refine a positive seed of sqrt(num) to ``precision`` digits.
+
+    Уточнить положительное начальное значение sqrt(num) до ``precision`` цифр.
+
+    Each step x = (x + num / x) / 2 runs at roughly twice the precision of
+    the previous one, so the last step dominates the cost. A monitored
+    calculation can stop before each step, and the share of the summed step
+    precisions done so far is reported as progress.
+
+    Args:
+        num: Positive value to take the square root of
+            Положительное значение для извлечения корня
+        seed: Positive approximation of the root
+             Положительное приближение корня
+        precision: Working precision of the last step
+                  Рабочая точность последнего шага
+
+    Returns:
+        Approximation of the root good to about ``precision`` digits
+        Приближение корня примерно с ``precision`` верными цифрами
+    """
+    # Digits of num past the last step move the root by less than its last
+    # digit but would make every division as long as num
+    num = decimal.Context(
+        prec=precision + 2, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+    ).plus(num)
+    seed_digits = max(len(seed.as_tuple().digits) - 1, 1)
+    root = seed
+    schedule = precision_schedule(seed_digits, precision)
+    total = sum(schedule)
+    done = 0
+    for step_precision in schedule:
+        checkpoint(done / total)
+        context = decimal.Context(prec=step_precision)
+        root = context.multiply(
+            context.add(root, context.divide(num, root)), Decimal("0.5")
+        )
+        done += step_precision
+    checkpoint(1.0)
+    return root
+
+
+def refine_real_root(num: Decimal, seed: Decimal, precision: int) -> Optional[Decimal]:
+    """Compute the correctly rounded sqrt(num) from a lower-precision seed.
+
+    Вычислить корректно округлённый sqrt(num) от начального значения меньшей точности.
+
+    The refined root is rounded half-even and then checked against ``num``
+    with exact squares of the rounding interval bounds, so the result is
+    digit for digit what ``Decimal.sqrt`` would return.
+
+    Args:
+        num: Positive value to take the square root of
+            Положительное значение для извлечения корня
+        seed: Positive approximation of the root
+             Положительное приближение корня
+        precision: Number of significant digits of the result
+                  Количество значащих цифр результата
+
+    Returns:
+        Correctly rounded root, or None if the check could not confirm it
+        Корректно округлённый корень или None, если проверка его не подтвердила
+    """
+    approx = newton_sqrt(num, seed, precision + REFINEMENT_GUARD_DIGITS)
+    candidate = decimal.Context(prec=precision).plus(approx)
+
+    if EXACT_CONTEXT.multiply(candidate, candidate) == num:
+        # Like Decimal.sqrt, write the exact root with ``precision`` digits and
+        # strip trailing zeros while the exponent stays below the ideal one;
+        # the resulting exponent follows from the last nonzero digit directly
+        full_exponent = candidate.adjusted() - precision + 1
+        last_nonzero = decimal_exponent(EXACT_CONTEXT.normalize(candidate))
+        ideal_exponent = decimal_exponent(num) // 2
+        exponent = max(full_exponent, min(last_nonzero, ideal_exponent))
+        return EXACT_CONTEXT.quantize(candidate, Decimal((0, (1,), exponent)))
+
+    lower, upper = _rounding_bounds(candidate, precision)
+    if (
+        EXACT_CONTEXT.multiply(lower, lower)
+        < num
+        < EXACT_CONTEXT.multiply(upper, upper)
+    ):
+        return candidate
+    return None
+
+
+def refine_fraction_root(
+    numerator: Decimal, denominator: Decimal, seed: Decimal, precision: int
+) -> Optional[Decimal]:
+    """Compute the correctly rounded sqrt(numerator / denominator) from a seed.
+
+    Вычислить корректно округлённый sqrt(numerator / denominator) от
+    начального значения.
+
+    The quotient is only formed at the working precision and refined in
+    Newton steps; the rounded root is then checked with exact products
+    against both terms, so no step handles the full terms except two
+    multiplications. The root must not be exact, which holds unless both
+    terms of the reduced fraction are perfect squares.
+
+    Args:
+        numerator: Positive integral numerator
+                  Положительный целый числитель
+        denominator: Positive integral denominator
+                    Положительный целый знаменатель
+        seed: Positive approximation of the root
+             Положительное приближение корня
+        precision: Number of significant digits of the result
+                  Количество значащих цифр результата
+
+    Returns:
+        Root rounded half-even, or None if the check could not confirm it
+        Корень, округлённый половина-к-чётному, или None, если проверка его
+        не подтвердила
+    """
+    working = precision + REFINEMENT_GUARD_DIGITS
+    context = decimal.Context(
+        prec=working + 2, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+    )
+    checkpoint()
+    quotient = context.divide(context.plus(numerator), context.plus(denominator))
+    approx = newton_sqrt(quotient, seed, working)
+    candidate = decimal.Context(
+        prec=precision, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+    ).plus(approx)
+
+    lower, upper = _rounding_bounds(candidate, precision)
+    checkpoint()
+    if (
+        EXACT_CONTEXT.multiply(EXACT_CONTEXT.multiply(lower, lower), denominator)
+        < numerator
+        < EXACT_CONTEXT.multiply(EXACT_CONTEXT.multiply(upper, upper), denominator)
+    ):
+        return candidate
+    return None
+
+
+def _rounding_bounds(candidate: Decimal, precision: int) -> Tuple[Decimal, Decimal]:
+    """Get the bounds of the values that round half-even to a candidate.
+
+    Получить границы значений, округляемых половина-к-чётному до кандидата.
+
+    Args:
+        candidate: Positive value with at most ``precision`` digits
+                  Положительное значение не более чем из ``precision`` цифр
+        precision: Number of significant digits
+                  Количество значащих цифр
+
+    Returns:
+        Tuple (lower, upper) of the rounding interval bounds
+        Кортеж (нижняя, верхняя) границ интервала округления
+    """
+    # Half-ulp bounds of the rounding interval; just below a power of ten
+    # the spacing of the next lower digit string is ten times smaller
+    half_ulp = Decimal((0, (5,), candidate.adjusted() - precision))
+    lower_half_ulp = half_ulp
+    # Comparing values avoids converting the whole coefficient to an int
+    if candidate == Decimal((0, (1,), candidate.adjusted())):
+        lower_half_ulp = half_ulp.scaleb(-1)
+    return (
+        EXACT_CONTEXT.subtract(candidate, lower_half_ulp),
+        EXACT_CONTEXT.add(candidate, half_ulp),
+    )
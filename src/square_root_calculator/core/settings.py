@@ -11,6 +11,18 @@ from pathlib import Path
 from typing import Any, Dict
 
 
+def settings_directory() -> Path:
+    """Get the directory holding settings.json and other per-user files.
+
+    Получить каталог с settings.json и другими файлами пользователя.
+
+    Returns:
+        Path of the settings directory
+        Путь к каталогу настроек
+    """
+    return Path.home() / ".square_root_calculator"
+
+
 class Settings:
     """Manages application settings with persistence.
 
@@ -31,7 +43,7 @@ class Settings:
 
         Инициализировать менеджер настроек.
         """
-        self.settings_file = Path.home() / ".square_root_calculator" / "settings.json"
+        self.settings_file = settings_directory() / "settings.json"
         self.settings = self.DEFAULT_SETTINGS.copy()
         self.load()
 
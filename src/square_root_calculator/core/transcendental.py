@@ -0,0 +1,410 @@
+"""Arbitrary-precision pi, arctangent and complex modulus.
+
+Число пи, арктангенс и модуль комплексного числа произвольной точности.
+"""
+
+import decimal
+import math
+import threading
+from decimal import Decimal
+from typing import Optional, Tuple
+
+from .backends import default_registry
+from .cancellation import checkpoint
+from .constants import (
+    REFINEMENT_MIN_PRECISION,
+    TRANSCENDENTAL_GUARD_DIGITS,
+)
+from .fixed_point import (
+    EXACT_CONTEXT,
+    decimal_exponent,
+    decimal_to_integer,
+    integer_to_decimal,
+)
+from .refinement import refine_real_root
+
+# Chudnovsky series constants
+_CHUDNOVSKY_C3_OVER_24 = 640320**3 // 24
+_CHUDNOVSKY_DIGITS_PER_TERM = 14
+
+# Fractional digits of the first bit-burst piece of an arctangent argument
+_ATAN_FIRST_PIECE_DIGITS = 8
+
+_ONE = Decimal(1)
+
+# Most precise pi computed so far, rounded down for lower precisions
+_pi_cache = Decimal(0)
+_pi_precision = 0
+_pi_lock = threading.Lock()
+
+
+def _chudnovsky_split(a: int, b: int) -> Tuple[int, int, int]:
+    """Binary splitting of the Chudnovsky series terms a..b-1.
+
+    Двоичное разбиение членов ряда Чудновских a..b-1.
+
+    Args:
+        a: First term index
+          Индекс первого члена
+        b: Index after the last term
+          Индекс после последнего члена
+
+    Returns:
+        Tuple (P, Q, T) of the partial products and sum
+        Кортеж (P, Q, T) частичных произведений и суммы
+    """
+    if b - a == 1:
+        if a == 0:
+            p = q = 1
+        else:
+            p = (6 * a - 5) * (2 * a - 1) * (6 * a - 1)
+            q = a * a * a * _CHUDNOVSKY_C3_OVER_24
+        t = p * (13591409 + 545140134 * a)
+        return p, q, -t if a % 2 else t
+
+    middle = (a + b) // 2
+    p1, q1, t1 = _chudnovsky_split(a, middle)
+    p2, q2, t2 = _chudnovsky_split(middle, b)
+    return p1 * p2, q1 * q2, q2 * t1 + p1 * t2
+
+
+def _compute_pi(digits: int) -> Decimal:
+    """Compute pi to ``digits`` digits after the point with integer arithmetic.
+
+    Вычислить пи с ``digits`` знаками после точки в целочисленной арифметике.
+
+    Args:
+        digits: Number of fractional digits
+               Количество дробных цифр
+
+    Returns:
+        Pi truncated to ``digits`` fractional digits
+        Пи, усечённое до ``digits`` дробных цифр
+    """
+    terms = digits // _CHUDNOVSKY_DIGITS_PER_TERM + 2
+    _, q, t = _chudnovsky_split(0, terms)
+    root = math.isqrt(10005 * 10 ** (2 * digits))
+    scaled = q * 426880 * root // t
+    return EXACT_CONTEXT.scaleb(integer_to_decimal(scaled), -digits)
+
+
+def pi(precision: int) -> Decimal:
+    """Get pi rounded to ``precision`` significant digits.
+
+    Получить пи, округлённое до ``precision`` значащих цифр.
+
+    The most precise value computed so far is kept, so lower precisions
+    are only a rounding away and higher ones recompute once.
+
+    Args:
+        precision: Number of significant digits
+                  Количество значащих цифр
+
+    Returns:
+        Pi as Decimal
+        Пи как Decimal
+    """
+    global _pi_cache, _pi_precision
+
+    with _pi_lock:
+        if _pi_precision < precision:
+            _pi_cache = _compute_pi(precision + TRANSCENDENTAL_GUARD_DIGITS)
+            _pi_precision = precision
+        cached = _pi_cache
+    return decimal.Context(prec=precision).plus(cached)
+
+
+def modulus(
+    real: Decimal, imag: Decimal, precision: int, seed: Optional[Decimal] = None
+) -> Decimal:
+    """Compute |real + imag*i| to ``precision`` digits at any magnitude.
+
+    Вычислить |real + imag*i| с ``precision`` цифрами при любой величине частей.
+
+    The result is correctly rounded: the sum of squares is exact and only
+    its root is rounded. A part whose exponent is more than half the
+    precision below the other one changes the modulus by less than half an
+    ulp, so a larger part of at most ``precision`` digits is the answer.
+    Otherwise both parts are scaled to about one before squaring, so the
+    exponent range is never exceeded. A part far below every digit of the
+    other one only decides on which side of it the modulus lies, so a short
+    stand-in keeps the squares short. The root is refined from a seed when
+    one is given and taken by the fastest backend otherwise.
+
+    Args:
+        real: Real part
+             Действительная часть
+        imag: Imaginary part
+             Мнимая часть
+        precision: Number of significant digits
+                  Количество значащих цифр
+        seed: Optional lower-precision approximation of the modulus
+             Необязательное приближение модуля меньшей точности
+
+    Returns:
+        Modulus as Decimal
+        Модуль как Decimal
+    """
+    context = decimal.Context(
+        prec=precision, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+    )
+    if not imag:
+        return context.plus(real.copy_abs())
+    if not real:
+        return context.plus(imag.copy_abs())
+
+    large, small = sorted((real, imag), key=Decimal.adjusted, reverse=True)
+    scale = large.adjusted()
+    gap = scale - small.adjusted()
+    large_digits = scale - decimal_exponent(large) + 1
+    if gap > precision // 2 + 2 and large_digits <= precision:
+        return context.plus(large.copy_abs())
+
+    digits = max(large_digits, precision)
+    if gap > digits + 2:
+        # Neither the part nor the stand-in moves the modulus across a
+        # rounding boundary above the larger part
+        small = Decimal((0, (1,), scale - digits - 3))
+
+    scaled_large = EXACT_CONTEXT.scaleb(large, -scale)
+    scaled_small = EXACT_CONTEXT.scaleb(small, -scale)
+    squares = EXACT_CONTEXT.fma(
+        scaled_large, scaled_large, EXACT_CONTEXT.multiply(scaled_small, scaled_small)
+    )
+
+    root = None
+    if (
+        seed is not None
+        and precision >= REFINEMENT_MIN_PRECISION
+        and seed.is_finite()
+        and seed > 0
+    ):
+        root = refine_real_root(squares, EXACT_CONTEXT.scaleb(seed, -scale), precision)
+    if root is None:
+        root = default_registry.select(squares, precision).sqrt(squares, context)
+    return context.scaleb(root, scale)
+
+
+def _atan_split(
+    p: int, digits: int, a: int, b: int
+) -> Tuple[Decimal, Decimal, Decimal]:
+    """Binary splitting of the arctan(p/q) series terms a..b-1, q = 10**digits.
+
+    Двоичное разбиение членов ряда arctan(p/q) a..b-1, q = 10**digits.
+
+    Term k of the series is (-1)**k * (p/q)**(2k+1) / (2k+1); the ratio of
+    term j to term j-1 is -p**2 * (2j-1) / (q**2 * (2j+1)). The products are
+    exact Decimals, whose large multiplications are much faster than those
+    of Python ints, and the powers of q only move their exponents.
+
+    Args:
+        p: Numerator of the argument
+          Числитель аргумента
+        digits: Number of fractional digits of the argument
+               Количество дробных цифр аргумента
+        a: First term index
+          Индекс первого члена
+        b: Index after the last term
+          Индекс после последнего члена
+
+    Returns:
+        Tuple (P, Q, T) with the series sum equal to p * T / (q * Q)
+        Кортеж (P, Q, T), где сумма ряда равна p * T / (q * Q)
+    """
+    if b - a == 1:
+        if a == 0:
+            return _ONE, _ONE, _ONE
+        numerator = Decimal(-p * p * (2 * a - 1))
+        denominator = EXACT_CONTEXT.scaleb(Decimal(2 * a + 1), 2 * digits)
+        return numerator, denominator, numerator
+
+    middle = (a + b) // 2
+    p1, q1, t1 = _atan_split(p, digits, a, middle)
+    p2, q2, t2 = _atan_split(p, digits, middle, b)
+    multiply = EXACT_CONTEXT.multiply
+    return (
+        multiply(p1, p2),
+        multiply(q1, q2),
+        EXACT_CONTEXT.fma(q2, t1, multiply(p1, t2)),
+    )
+
+
+def _atan_rational(p: int, digits: int, context: decimal.Context) -> Decimal:
+    """Compute arctan(p / 10**digits) for 0 < p / 10**digits < 1.
+
+    Вычислить arctan(p / 10**digits) для 0 < p / 10**digits < 1.
+
+    Args:
+        p: Numerator of the argument
+          Числитель аргумента
+        digits: Number of fractional digits of the argument
+               Количество дробных цифр аргумента
+        context: Working context; its precision sets the number of terms
+                Рабочий контекст; его точность задаёт количество членов
+
+    Returns:
+        Arctangent in radians
+        Арктангенс в радианах
+    """
+    # Each term gains 2 * log10(q / p) digits
+    gain = 2 * (digits - math.log10(p))
+    terms = int(context.prec / gain) + 2
+    _, big_q, big_t = _atan_split(p, digits, 0, terms)
+    # Rounding the operands first keeps the division at working size
+    rounding = decimal.Context(
+        prec=context.prec, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+    )
+    numerator = rounding.multiply(Decimal(p), rounding.plus(big_t))
+    denominator = EXACT_CONTEXT.scaleb(rounding.plus(big_q), digits)
+    return rounding.divide(numerator, denominator)
+
+
+def atan(x: Decimal, precision: int) -> Decimal:
+    """Compute arctan(x) to ``precision`` significant digits.
+
+    Вычислить arctan(x) с ``precision`` значащими цифрами.
+
+    Arguments above one are mapped to pi/2 - atan(1/x), and the rest are
+    halved twice with x / (1 + sqrt(1 + x**2)). The reduced argument is
+    then split bit-burst style into pieces r with twice as many digits each:
+    atan(r) comes from a binary-splitting series on integers, and the
+    remainder becomes (x - r) / (1 + x * r), which is smaller than the next
+    piece. Once it is below half the working precision, atan equals it.
+
+    Args:
+        x: Argument
+          Аргумент
+        precision: Number of significant digits
+                  Количество значащих цифр
+
+    Returns:
+        Arctangent in radians
+        Арктангенс в радианах
+    """
+    if x.is_signed():
+        return atan(x.copy_abs(), precision).copy_negate()
+    if not x:
+        return Decimal(0)
+
+    working = precision + TRANSCENDENTAL_GUARD_DIGITS
+    context = decimal.Context(
+        prec=working, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+    )
+    result_context = decimal.Context(
+        prec=precision, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+    )
+
+    if x > 1:
+        half_pi = context.multiply(pi(working), Decimal("0.5"))
+        result = context.subtract(half_pi, atan(context.divide(1, x), working))
+        return result_context.plus(result)
+
+    halvings = 2
+    for _ in range(halvings):
+        hypotenuse = context.fma(x, x, 1)
+        hypotenuse = default_registry.select(hypotenuse, working).sqrt(
+            hypotenuse, context
+        )
+        x = context.divide(x, context.add(1, hypotenuse))
+
+    total = Decimal(0)
+    digits = _ATAN_FIRST_PIECE_DIGITS
+    # Relative to the result, the remainder is negligible below 10**-(working/2)
+    while x.adjusted() >= -(working // 2) - 1:
+        checkpoint()
+        piece = decimal_to_integer(
+            EXACT_CONTEXT.scaleb(x, digits).to_integral_value(decimal.ROUND_DOWN)
+        )
+        if piece:
+            total = context.add(total, _atan_rational(piece, digits, context))
+            r = EXACT_CONTEXT.scaleb(integer_to_decimal(piece), -digits)
+            x = context.divide(context.subtract(x, r), context.fma(x, r, 1))
+        digits *= 2
+    total = context.add(total, x)
+
+    return result_context.plus(context.multiply(total, 2**halvings))
+
+
+def atan2(y: Decimal, x: Decimal, precision: int) -> Decimal:
+    """Compute the angle of the point (x, y) like ``math.atan2``.
+
+    Вычислить угол точки (x, y) так же, как ``math.atan2``.
+
+    Args:
+        y: Ordinate (imaginary part)
+          Ордината (мнимая часть)
+        x: Abscissa (real part)
+          Абсцисса (действительная часть)
+        precision: Number of significant digits
+                  Количество значащих цифр
+
+    Returns:
+        Angle in radians in [-pi, pi]
+        Угол в радианах в диапазоне [-pi, pi]
+    """
+    # Parts of roots of huge or tiny inputs may leave the default exponent
+    # range, and so may their ratio
+    context = decimal.Context(
+        prec=precision + TRANSCENDENTAL_GUARD_DIGITS,
+        Emax=decimal.MAX_EMAX,
+        Emin=decimal.MIN_EMIN,
+    )
+    result_context = decimal.Context(
+        prec=precision, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN
+    )
+
+    if not x:
+        if not y:
+            return Decimal(0)
+        half_pi = context.multiply(pi(context.prec), Decimal("0.5"))
+        return result_context.plus(half_pi.copy_sign(y))
+
+    angle = atan(context.divide(y, x).copy_abs(), context.prec)
+    if x.is_signed():
+        angle = context.subtract(pi(context.prec), angle)
+    if y.is_signed():
+        angle = angle.copy_negate()
+    return result_context.plus(angle)
+
+
+def root_angle(
+    real: Decimal, imag: Decimal, magnitude: Decimal, precision: int
+) -> Decimal:
+    """Compute the angle of the principal sqrt(real + imag*i).
+
+    Вычислить угол главного значения sqrt(real + imag*i).
+
+    The angle is half the argument of the input, and tan(arg / 2) equals
+    both imag / (|z| + real) and (|z| - real) / imag. The form whose sum
+    does not cancel is used, so only a root on or near the imaginary axis
+    needs pi.
+
+    Args:
+        real: Real part of the input
+             Действительная часть входа
+        imag: Imaginary part of the input
+             Мнимая часть входа
+        magnitude: |real + imag*i| to at least ``precision`` digits
+                  |real + imag*i| не менее чем с ``precision`` цифрами
+        precision: Number of significant digits
+                  Количество значащих цифр
+
+    Returns:
+        Angle in radians in (-pi/2, pi/2]
+        Угол в радианах в диапазоне (-pi/2, pi/2]
+    """
+    context = decimal.Context(
+        prec=precision + TRANSCENDENTAL_GUARD_DIGITS,
+        Emax=decimal.MAX_EMAX,
+        Emin=decimal.MIN_EMIN,
+    )
+    if not imag:
+        if real >= 0:
+            return Decimal(0)
+        half_pi = context.multiply(pi(context.prec), Decimal("0.5"))
+        return decimal.Context(prec=precision).plus(half_pi)
+    if real.is_signed():
+        tangent = context.divide(context.subtract(magnitude, real), imag)
+    else:
+        tangent = context.divide(imag, context.add(magnitude, real))
+    return atan(tangent, precision)
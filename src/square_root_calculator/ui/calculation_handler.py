@@ -65,8 +65,12 @@ class CalculationHandler:
         imag_str = imag_text or "0"
 
         # Normalize inputs
-        real_str = self.input_validator.normalize_number_input(real_str)
-        imag_str = self.input_validator.normalize_number_input(imag_str)
+        real_str = self.input_validator.normalize_number_input(
+            real_str, allow_fraction=False
+        )
+        imag_str = self.input_validator.normalize_number_input(
+            imag_str, allow_fraction=False
+        )
 
         return self.calculator.calculate(None, real_str, imag_str)
 
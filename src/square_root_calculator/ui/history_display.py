@@ -54,34 +54,17 @@ class HistoryDisplayManager:
         input_str = input_str.replace("i", "")
 
         # Handle different complex number formats
-        # Format: "a+bi", "-a+bi", "a-bi", "-a-bi", "bi", "-bi"
-
-        # Count minus signs to determine format
-        minus_count = input_str.count("-")
-        has_plus = "+" in input_str
-
-        if has_plus:
-            # Format: "a+bi" or "-a+bi"
-            parts = input_str.split("+")
-            real_part = parts[0] if parts[0] else "0"
-            imag_part = parts[1] if len(parts) > 1 else "0"
-        elif minus_count == 1 and not input_str.startswith("-"):
-            # Format: "a-bi" (minus not at start)
-            parts = input_str.split("-")
-            real_part = parts[0] if parts[0] else "0"
-            imag_part = "-" + parts[1] if len(parts) > 1 else "0"
-        elif minus_count == 2 and input_str.startswith("-"):
-            # Format: "-a-bi" (both negative)
-            temp = input_str[1:]  # Remove leading minus
-            parts = temp.split("-")
-            real_part = "-" + parts[0] if parts[0] else "0"
-            imag_part = "-" + parts[1] if len(parts) > 1 else "0"
-        elif minus_count == 1 and input_str.startswith("-"):
-            # Format: "-bi" (just negative imaginary)
-            real_part = "0"
-            imag_part = input_str
+        # Format: "a+bi", "-a+bi", "a-bi", "-a-bi", "bi", "-bi", "1e-5+2E+3i"
+
+        # The imaginary part starts at the last sign that is neither leading
+        # nor the sign of an exponent
+        for index in range(len(input_str) - 1, 0, -1):
+            if input_str[index] in "+-" and input_str[index - 1] not in "eE":
+                real_part = input_str[:index]
+                imag_part = input_str[index:].lstrip("+")
+                break
         else:
-            # Just imaginary part without sign
+            # Just imaginary part, with or without sign
             real_part = "0"
             imag_part = input_str
 
@@ -112,6 +95,7 @@ class HistoryDisplayManager:
             is_complex=result.is_complex,
             real_part=real_part,
             imag_part=imag_part,
+            is_exact=result.is_exact,
         )
         self.update_display()
 
@@ -129,7 +113,8 @@ class HistoryDisplayManager:
             result_display = entry.result_text[:MAX_RESULT_DISPLAY_LENGTH]
             if len(entry.result_text) > MAX_RESULT_DISPLAY_LENGTH:
                 result_display += "..."
-            item_text = f"√({entry.input_value}) ≈ {result_display}"
+            relation = "=" if entry.is_exact else "≈"
+            item_text = f"√({entry.input_value}) {relation} {result_display}"
 
             item = QListWidgetItem(item_text)
             item.setData(1, entry)  # Store entry object for later retrieval
@@ -21,13 +21,15 @@ class InputValidator:
         """
         self.translator = translator
 
-    def normalize_number_input(self, text: str) -> str:
+    def normalize_number_input(self, text: str, allow_fraction: bool = True) -> str:
         """Normalize number input by replacing comma with dot and validating.
 
         Нормализовать числовой ввод, заменяя запятую на точку и проверяя.
 
         Args:
             text: Input text to normalize
+            allow_fraction: Whether a '/' fraction bar is accepted; only real
+                            mode parses fractions
 
         Returns:
             Normalized number string
@@ -39,13 +41,20 @@ class InputValidator:
             return text
 
         # Check for invalid characters before normalization
-        # Allow: digits, comma OR dot, minus, plus, 'i' character, whitespace
-        if not re.match(r"^[0-9.,\-+i\s]+$", text):
+        # Allow: digits, comma OR dot, minus, plus, 'e'/'E' exponent,
+        # '/' fraction bar, 'i' character, whitespace
+        if not re.match(r"^[0-9.,\-+eEi/\s]+$", text):
             raise InvalidInputError(
                 self.translator.get("invalid_input")
                 + ": "
                 + self.translator.get("text_instead_of_numbers")
             )
+        if not allow_fraction and "/" in text:
+            raise InvalidInputError(
+                self.translator.get("invalid_input")
+                + ": "
+                + self.translator.get("fractions_real_only")
+            )
 
         # Replace comma with dot for decimal separator
         normalized = text.replace(",", ".")
@@ -70,8 +79,8 @@ class InputValidator:
         if "i" in normalized:
             # Remove 'i' and split by + or - (keeping the sign)
             temp = normalized.replace("i", "")
-            # Split but keep delimiters
-            parts = re.split(r"(\+|\-)", temp)
+            # Split but keep delimiters; a sign after 'e' belongs to the exponent
+            parts = re.split(r"(?<![eE])(\+|\-)", temp)
             # Reconstruct parts and check each number component
             current = ""
             for i, part in enumerate(parts):
@@ -90,8 +99,8 @@ class InputValidator:
                             + ": Multiple decimal separators"
                         )
         else:
-            # Simple number - just check for multiple dots
-            if normalized.strip().count(".") > 1:
+            # Simple number or fraction - check each term for multiple dots
+            if any(term.count(".") > 1 for term in normalized.split("/")):
                 raise InvalidInputError(
                     self.translator.get("invalid_input")
                     + ": Multiple decimal separators"
@@ -3,6 +3,7 @@
 Главное окно GUI для Калькулятора квадратного корня.
 """
 
+import argparse
 import sys
 from PyQt6.QtWidgets import (
     QApplication,
@@ -21,6 +22,8 @@ from ..core.calculator import (
     PrecisionError,
     CalculationResult,
 )
+from ..core.cache import ResultCache
+from ..core.calibration import load_calibration, run_calibration
 from ..core.history import HistoryManager
 from ..core.update_checker import UpdateChecker
 from ..core.settings import Settings
@@ -53,7 +56,9 @@ class MainWindow(QMainWindow):
         lang = self.settings.get("language", "en")
         precision = self.settings.get("precision", 4)
 
-        self.calculator = SquareRootCalculator(precision=precision)
+        self.calculator = SquareRootCalculator(
+            precision=precision, cache=ResultCache(), decimal_places=True
+        )
         self.translator = Translator(lang)
         self.history = HistoryManager()
         self.update_checker = UpdateChecker(
@@ -516,9 +521,38 @@ class MainWindow(QMainWindow):
         )
 
 
+def parse_arguments(argv):
+    """Parse the command line options of the application.
+
+    Разобрать параметры командной строки приложения.
+
+    Args:
+        argv: Command line arguments without the program name
+             Аргументы командной строки без имени программы
+
+    Returns:
+        Tuple (options, arguments left for Qt)
+        Кортеж (параметры, аргументы, оставленные для Qt)
+    """
+    parser = argparse.ArgumentParser(prog="square-root-calculator")
+    parser.add_argument(
+        "--calibrate",
+        action="store_true",
+        help="benchmark the square root engines on this machine and save "
+        "the crossover points next to settings.json",
+    )
+    return parser.parse_known_args(argv)
+
+
 def main():
     """Main entry point for the application."""
-    app = QApplication(sys.argv)
+    options, qt_arguments = parse_arguments(sys.argv[1:])
+    if options.calibrate:
+        # Runs in the console, before any window exists
+        sys.exit(run_calibration())
+
+    load_calibration()
+    app = QApplication(sys.argv[:1] + qt_arguments)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -80,20 +80,26 @@ class ResultFormatter:
             output += self._format_root_line(
                 result.input_value,
                 formatted_roots[0],
-                is_positive=True
+                is_positive=True,
+                is_exact=result.is_exact
             )
 
             if show_negative and len(formatted_roots) >= 2:
                 output += self._format_root_line(
                     result.input_value,
                     formatted_roots[1],
-                    is_positive=False
+                    is_positive=False,
+                    is_exact=result.is_exact
                 )
 
         return output
 
     def _format_root_line(
-        self, input_value: str, root_value: str, is_positive: bool
+        self,
+        input_value: str,
+        root_value: str,
+        is_positive: bool,
+        is_exact: bool = False
     ) -> str:
         """Format a single root line.
 
@@ -103,6 +109,7 @@ class ResultFormatter:
             input_value: Original input value
             root_value: Formatted root value
             is_positive: Whether this is the positive root
+            is_exact: Whether the root is exact rather than rounded
 
         Returns:
             HTML string for root line
@@ -110,10 +117,11 @@ class ResultFormatter:
         label_key = 'root_positive' if is_positive else 'root_negative'
         sign = '+' if is_positive else '-'
         label = self.translator.get(label_key)
+        marker = f" {self.translator.get('exact_marker')}" if is_exact else ""
 
         return (
             f"<p style='margin: 3px 0 3px 20px; color: #0066cc;'>"
-            f"<b>{label}</b> {sign}√({input_value}) = {root_value}</p>"
+            f"<b>{label}</b> {sign}√({input_value}) = {root_value}{marker}</p>"
         )
 
     def _format_representations_section(
@@ -184,6 +192,7 @@ class ResultFormatter:
 
         repr_types = [
             ('decimal', 'decimal_repr'),
+            ('integer', 'integer_repr'),
             ('scientific', 'scientific_repr'),
             ('fraction', 'fraction_repr'),
         ]
@@ -0,0 +1,142 @@
+"""Tests for the square root backend registry."""
+
+import decimal
+import pytest  # noqa: F401
+from decimal import Decimal
+from square_root_calculator.core.backends import (
+    BackendRegistry,
+    DecimalBackend,
+    IntegerBackend,
+    NewtonBackend,
+    default_registry,
+)
+from square_root_calculator.core.calculator import SquareRootCalculator
+from square_root_calculator.core.fixed_point import isqrt_rem
+
+_VALUES = ["2", "16", "0.0004", "1E+4", "123456789.987654321", "0.00", "3E-777"]
+
+
+class TestBackendRegistry:
+    """Test BackendRegistry class."""
+
+    def test_standard_backends_registered(self):
+        """Test that the standard library backends are always available."""
+        names = default_registry.available()
+        assert "decimal" in names
+        assert "isqrt" in names
+        assert "newton" in names
+
+    @pytest.mark.parametrize("precision", [5, 50, 250])
+    def test_backends_agree(self, precision):
+        """Test that every available backend gives the same digits."""
+        context = decimal.Context(prec=precision)
+        for value in _VALUES:
+            num = Decimal(value)
+            expected = context.sqrt(num)
+            for name in default_registry.available():
+                root = default_registry.get(name).sqrt(num, context)
+                assert str(root) == str(expected), (name, value)
+
+    def test_unknown_backend_raises_error(self):
+        """Test that looking up an unknown backend fails."""
+        with pytest.raises(ValueError):
+            default_registry.get("abacus")
+
+    def test_select_by_precision_band(self):
+        """Test that selection follows the crossovers."""
+        registry = BackendRegistry(short_input_band=(100, 1000))
+        registry.register(IntegerBackend("isqrt", isqrt_rem))
+        num = Decimal(2)
+        assert registry.select(num, 99).name == "decimal"
+        assert registry.select(num, 100).name == "isqrt"
+        assert registry.select(num, 1000).name == "decimal"
+
+    def test_select_newton_above_band(self):
+        """Test that Newton steps take over above the band when registered."""
+        registry = BackendRegistry(short_input_band=(100, 1000))
+        registry.register(IntegerBackend("isqrt", isqrt_rem))
+        registry.register(NewtonBackend())
+        assert registry.high_precision_backend().name == "newton"
+        assert registry.select(Decimal(2), 999).name == "isqrt"
+        assert registry.select(Decimal(2), 1000).name == "newton"
+
+    def test_newton_high_precision(self):
+        """Test Newton roots against Decimal.sqrt, including exact roots."""
+        context = decimal.Context(prec=3000)
+        backend = default_registry.get("newton")
+        for value in ["2", "4" + "0" * 3000, "1.44E-10", "7" * 9000, "0.0400"]:
+            num = Decimal(value)
+            assert str(backend.sqrt(num, context)) == str(context.sqrt(num))
+
+    def test_long_inputs_agree(self):
+        """Test that inputs cut before the integer root round correctly."""
+        context = decimal.Context(prec=20)
+        backend = default_registry.get("isqrt")
+        for value in [
+            "7" * 3000,
+            "4" + "0" * 3000,
+            "4" + "0" * 3000 + "1",
+            "0." + "5" * 99,
+        ]:
+            num = Decimal(value)
+            assert str(backend.sqrt(num, context)) == str(context.sqrt(num))
+
+    def test_select_by_input_size(self):
+        """Test that inputs longer than the precision use their own band."""
+        registry = BackendRegistry(
+            short_input_band=(100, 1000), long_input_band=(400, 600)
+        )
+        registry.register(IntegerBackend("isqrt", isqrt_rem))
+        assert registry.select(Decimal("7" * 300), 300).name == "isqrt"
+        assert registry.select(Decimal("7" * 301), 300).name == "decimal"
+        assert registry.select(Decimal("7" * 501), 500).name == "isqrt"
+
+    def test_invalid_band_raises_error(self):
+        """Test that bands must be ordered and positive."""
+        registry = BackendRegistry()
+        with pytest.raises(ValueError):
+            registry.set_band(0, 10)
+        with pytest.raises(ValueError):
+            registry.set_band(10, 9)
+        registry.set_band(10, 20)
+        registry.set_band(30, 30, long_input=True)
+        assert registry.band() == (10, 20)
+        assert registry.band(long_input=True) == (30, 30)
+
+    def test_select_without_integer_backend(self):
+        """Test that Decimal.sqrt is used when nothing else is registered."""
+        registry = BackendRegistry(short_input_band=(100, 1000))
+        assert registry.select(Decimal(2), 500).name == "decimal"
+
+    def test_register_replaces_backend(self):
+        """Test that registering a name again replaces the backend."""
+        registry = BackendRegistry()
+        replacement = DecimalBackend()
+        registry.register(replacement)
+        assert registry.get("decimal") is replacement
+        assert registry.available() == ("decimal",)
+
+    def test_gmpy2_backend(self):
+        """Test the gmpy2 backend when gmpy2 is installed."""
+        pytest.importorskip("gmpy2")
+        context = decimal.Context(prec=300)
+        backend = default_registry.get("gmpy2")
+        assert str(backend.sqrt(Decimal(2), context)) == str(context.sqrt(Decimal(2)))
+
+
+class TestCalculatorEngines:
+    """Test engine selection in the calculator."""
+
+    def test_auto_is_default(self):
+        """Test that calculators pick backends automatically by default."""
+        assert SquareRootCalculator().engine == "auto"
+
+    @pytest.mark.parametrize("precision", [20, 300])
+    def test_auto_matches_every_engine(self, precision):
+        """Test that auto selection gives the digits of every engine."""
+        auto = SquareRootCalculator(precision)
+        for name in default_registry.available():
+            calc = SquareRootCalculator(precision, engine=name)
+            for value in _VALUES:
+                assert str(calc.sqrt_real(value)) == str(auto.sqrt_real(value))
+            assert str(calc.sqrt_complex(3, -4.5)) == str(auto.sqrt_complex(3, -4.5))
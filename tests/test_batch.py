@@ -0,0 +1,78 @@
+"""Tests for batch execution of calculations."""
+
+import pytest  # noqa: F401
+from decimal import Decimal
+from square_root_calculator.core.batch import (
+    BatchJob,
+    ProcessPoolBatchExecutor,
+    ThreadPoolBatchExecutor,
+    deserialize_result,
+    serialize_result,
+)
+from square_root_calculator.core.calculator import SquareRootCalculator
+
+
+class TestThreadPoolBatchExecutor:
+    """Test ThreadPoolBatchExecutor class."""
+
+    def test_map_preserves_order(self):
+        """Test that results come back in input order."""
+        values = [str(n) for n in range(1, 50)]
+        with ThreadPoolBatchExecutor(max_workers=4) as executor:
+            results = executor.map(values, precision=20)
+        assert [r.input_value for r in results] == values
+        assert results[3].roots[0][0] == Decimal(2)
+
+    def test_mixed_precision_jobs(self):
+        """Test that jobs with different precisions do not interfere."""
+        jobs = [BatchJob(2, precision=p) for p in (5, 30, 12, 80)]
+        jobs.append(BatchJob(real_part=3, imag_part=4, precision=10))
+        with ThreadPoolBatchExecutor(max_workers=4) as executor:
+            results = executor.run(jobs)
+        for job, result in zip(jobs[:4], results):
+            expected = SquareRootCalculator(job.precision).sqrt_real(2)
+            assert result.roots[0][0] == expected
+            assert result.precision == job.precision
+        assert results[4].is_complex
+
+
+class TestProcessPoolBatchExecutor:
+    """Test ProcessPoolBatchExecutor class."""
+
+    def test_map_matches_calculate(self):
+        """Test that process results match local results in input order."""
+        calculator = SquareRootCalculator(precision=60)
+        values = [str(n) for n in range(1, 40)] + [(3, 4), (-7, 24)]
+        with ProcessPoolBatchExecutor(60, max_workers=2, chunk_size=5) as executor:
+            results = list(executor.map(values))
+        assert len(results) == len(values)
+        for value, result in zip(values, results):
+            if isinstance(value, tuple):
+                expected = calculator.calculate(None, *value)
+            else:
+                expected = calculator.calculate(value)
+            assert result.input_value == expected.input_value
+            assert result.roots == expected.roots
+            assert result.precision == 60
+            assert result.is_exact == expected.is_exact
+            assert result.get_representations() == expected.get_representations()
+
+    def test_serialization_round_trip(self):
+        """Test that the compact format preserves every digit."""
+        result = SquareRootCalculator(precision=200).calculate(None, 2, -3)
+        data = serialize_result(result)
+        assert all(isinstance(field, (str, bool, type(None))) for field in data)
+        restored = deserialize_result(data, 200)
+        assert restored.roots == result.roots
+        assert restored.is_complex
+        assert restored.complex_parts == (2, -3)
+
+    def test_serialization_keeps_exactness_and_integer_root(self):
+        """Test that exact flags, integer roots and zero parts survive."""
+        result = SquareRootCalculator(precision=20).calculate("16")
+        restored = deserialize_result(serialize_result(result), 20)
+        assert restored.is_exact
+        assert restored.get_representation("integer") == "4²"
+        assert str(restored.roots[1][1]) == "0"
+        places = SquareRootCalculator(4, decimal_places=True).calculate("2")
+        assert deserialize_result(serialize_result(places), 4).decimal_places
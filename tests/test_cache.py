@@ -0,0 +1,161 @@
+"""Tests for the result cache."""
+
+import pytest  # noqa: F401
+from decimal import Decimal
+from square_root_calculator.core.cache import ResultCache
+from square_root_calculator.core.calculator import SquareRootCalculator
+
+
+def _root(digits: int):
+    """Build a cached root with the given number of digits."""
+    return (Decimal("1." + "4" * digits), Decimal(0))
+
+
+def _key(name, precision: int = 10):
+    """Build a cache key for a real input."""
+    return ("real", name, precision)
+
+
+class TestResultCache:
+    """Test ResultCache class."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups update the counters."""
+        cache = ResultCache()
+        assert cache.get(_key("a")) is None
+        cache.put(_key("a"), _root(5), cost=0.001)
+        assert cache.get(_key("a")) == _root(5)
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_lru_eviction_by_count(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResultCache(max_entries=2)
+        cache.put(_key("a"), _root(5), cost=0.001)
+        cache.put(_key("b"), _root(5), cost=0.001)
+        cache.get(_key("a"))
+        cache.put(_key("c"), _root(5), cost=0.001)
+        assert cache.get(_key("b")) is None
+        assert cache.get(_key("a")) is not None
+        assert cache.evictions == 1
+
+    def test_cheap_large_entry_does_not_flush_cache(self):
+        """Test that a big cheap result is dropped instead of small costly ones."""
+        small_size = ResultCache.estimate_size(_root(5))
+        cache = ResultCache(max_bytes=small_size * 10)
+        for n in range(8):
+            cache.put(_key(n), _root(5), cost=0.01)
+        cache.put(_key("big"), _root(2000), cost=0.001)
+        assert len(cache) == 8
+        assert cache.get(_key("big")) is None
+        assert cache.rejections == 1
+        assert cache.evictions == 0
+
+    def test_oversized_entry_rejected(self):
+        """Test that an entry larger than the byte budget is never stored."""
+        cache = ResultCache(max_bytes=10)
+        cache.put(_key("a"), _root(5), cost=1.0)
+        assert len(cache) == 0
+        assert cache.rejections == 1
+
+
+class TestCalculatorCache:
+    """Test the cache in front of SquareRootCalculator.calculate."""
+
+    def test_repeated_calculation_hits_cache(self):
+        """Test that equal normalized inputs share one cache entry."""
+        cache = ResultCache()
+        calc = SquareRootCalculator(precision=30, cache=cache)
+        first = calc.calculate("2")
+        second = calc.calculate("02")
+        assert second.roots == first.roots
+        assert second.input_value == "02"
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_precision_and_mode_are_part_of_key(self):
+        """Test that different precisions and modes do not collide."""
+        cache = ResultCache()
+        calc = SquareRootCalculator(precision=10, cache=cache)
+        calc.calculate("2")
+        calc.set_precision(20)
+        calc.calculate("2")
+        calc.calculate(None, "2", "0")
+        assert cache.hits == 0
+        assert len(cache) == 3
+
+
+class TestPrecisionAwareCache:
+    """Test answering lower-precision requests from cached roots."""
+
+    def test_lower_precision_is_rounded_from_cache(self):
+        """Test that scrubbing precision down reuses the cached root."""
+        cache = ResultCache()
+        calc = SquareRootCalculator(precision=500, cache=cache)
+        calc.calculate("2")
+        for precision in (200, 50, 7, 1):
+            calc.set_precision(precision)
+            result = calc.calculate("2")
+            expected = SquareRootCalculator(precision).sqrt_real("2")
+            assert str(result.roots[0][0]) == str(expected)
+        assert cache.derived_hits == 4
+
+    def test_exact_roots_keep_ideal_form(self):
+        """Test that exact cached roots round to the same digits as sqrt."""
+        cache = ResultCache()
+        calc = SquareRootCalculator(precision=40, cache=cache)
+        for value in ("1.21", "12321", "0.0004"):
+            calc.set_precision(40)
+            calc.calculate(value)
+            calc.set_precision(2)
+            expected = SquareRootCalculator(2).sqrt_real(value)
+            assert str(calc.calculate(value).roots[0][0]) == str(expected)
+
+    def test_ambiguous_tie_is_recomputed(self):
+        """Test that a cached root ending in an exact half is not rounded."""
+        cache = ResultCache()
+        # sqrt(773.093) = 27.80454999..., cached as 27.8045500 at 9 digits,
+        # which would wrongly round half-even to 27.8046 at 6 digits
+        calc = SquareRootCalculator(precision=9, cache=cache)
+        calc.calculate("773.093")
+        calc.set_precision(6)
+        result = calc.calculate("773.093")
+        assert str(result.roots[0][0]) == "27.8045"
+
+    def test_fraction_tie_is_checked_exactly(self):
+        """Test that a cached fraction root ending in an exact half rounds."""
+        cache = ResultCache()
+        calc = SquareRootCalculator(precision=3, cache=cache)
+        calc.calculate("25/16")
+        calc.set_precision(2)
+        result = calc.calculate("25/16")
+        assert str(result.roots[0][0]) == str(
+            SquareRootCalculator(2).sqrt_real("25/16")
+        )
+        assert cache.derived_hits == 1
+
+    def test_complex_roots_are_rounded(self):
+        """Test that complex cached roots are rounded component-wise."""
+        cache = ResultCache()
+        calc = SquareRootCalculator(precision=60, cache=cache)
+        calc.calculate(None, "1", "1")
+        calc.set_precision(10)
+        result = calc.calculate(None, "1", "1")
+        assert cache.derived_hits == 1
+        assert result.roots[0] == SquareRootCalculator(10).sqrt_complex("1", "1")
+
+    def test_complex_ties_are_recomputed(self):
+        """Test that complex parts ending in an exact half are not rounded."""
+        # sqrt(-11-438i) has imaginary part -14.98 and sqrt(341+890i) has
+        # 17.494; cached as -15 and 17.5 they would round half-even away
+        for real, imag, high, low in (("-11", "-438", 2, 1), ("341", "890", 3, 2)):
+            calc = SquareRootCalculator(precision=high, cache=ResultCache())
+            calc.calculate(None, real, imag)
+            calc.set_precision(low)
+            result = calc.calculate(None, real, imag)
+            expected = SquareRootCalculator(low).sqrt_complex(real, imag)
+            assert [str(part) for part in result.roots[0]] == [
+                str(part) for part in expected
+            ]
@@ -1,7 +1,7 @@
 """Tests for calculator core functionality."""
 
 import pytest  # noqa: F401
-from decimal import Decimal
+from decimal import Context, Decimal
 from square_root_calculator.core.calculator import (  # noqa: F401
     SquareRootCalculator,
     InvalidInputError,
@@ -107,3 +107,757 @@ class TestCalculationResult:
         reps = result.get_representations()
         assert "polar" in reps
         assert "exponential" in reps
+
+
+class TestFixedPointEngine:
+    """Test the math.isqrt fixed-point engine."""
+
+    def test_isqrt_engine_matches_decimal(self):
+        """Test that the isqrt engine reproduces Decimal.sqrt digits."""
+        decimal_calc = SquareRootCalculator(precision=30)
+        isqrt_calc = SquareRootCalculator(precision=30, engine="isqrt")
+        for value in ["2", "16", "0.0004", "1E+4", "123456789.987654321", "0.00"]:
+            expected = decimal_calc.sqrt_real(value)
+            assert str(isqrt_calc.sqrt_real(value)) == str(expected)
+
+    def test_sqrt_real_fixed(self):
+        """Test fixed-point result and on-demand conversion."""
+        calc = SquareRootCalculator(precision=5, engine="isqrt")
+        root = calc.sqrt_real_fixed(2)
+        assert root.mantissa == 14142
+        assert root.exponent == -4
+        assert not root.is_exact
+        assert root.to_decimal() == Decimal("1.4142")
+
+    def test_sqrt_real_fixed_exact(self):
+        """Test that perfect squares are flagged as exact."""
+        calc = SquareRootCalculator(precision=10, engine="isqrt")
+        root = calc.sqrt_real_fixed(144)
+        assert root.is_exact
+        assert root.to_decimal() == Decimal("12")
+
+    def test_unknown_engine_raises_error(self):
+        """Test that an unknown engine is rejected."""
+        with pytest.raises(InvalidInputError):
+            SquareRootCalculator(engine="abacus")
+
+
+class TestDecimalContextIsolation:
+    """Test that calculators do not share decimal context state."""
+
+    def test_calculators_with_different_precisions(self):
+        """Test interleaved calculators keep their own precision."""
+        low = SquareRootCalculator(precision=5)
+        high = SquareRootCalculator(precision=40)
+        assert str(low.sqrt_real(2)) == "1.4142"
+        assert len(str(high.sqrt_real(2))) == 41
+        assert str(low.sqrt_real(2)) == "1.4142"
+        real, _ = low.sqrt_complex(3, 5)
+        assert len(str(real)) == 6
+
+    def test_global_context_untouched(self):
+        """Test that creating a calculator leaves the global context alone."""
+        import decimal
+
+        before = decimal.getcontext().prec
+        calc = SquareRootCalculator(precision=before + 7)
+        calc.set_precision(before + 11)
+        calc.sqrt_complex(3, 4)
+        assert decimal.getcontext().prec == before
+
+    def test_negative_root_keeps_precision(self):
+        """Test that the negative root is not rounded by the global context."""
+        calc = SquareRootCalculator(precision=60)
+        result = calc.calculate(2)
+        assert str(result.roots[1][0]) == "-" + str(result.roots[0][0])
+
+
+class TestCalculateMany:
+    """Test the batch calculate_many API."""
+
+    def test_matches_calculate(self, calculator):
+        """Test that batch results match single calculations in order."""
+        values = ["2", 3, Decimal("0.25"), (3, 4), complex(-1, 0), "1E+4"]
+        results = list(calculator.calculate_many(values, chunk_size=4))
+        assert len(results) == len(values)
+        for value, result in zip(values, results):
+            if isinstance(value, tuple):
+                expected = calculator.calculate(None, *value)
+            elif isinstance(value, complex):
+                expected = calculator.calculate(None, value.real, value.imag)
+            else:
+                expected = calculator.calculate(value)
+            assert result.input_value == expected.input_value
+            assert result.roots == expected.roots
+            assert result.is_complex == expected.is_complex
+
+    def test_is_lazy(self, calculator):
+        """Test that inputs are consumed one chunk at a time."""
+        consumed = []
+
+        def values():
+            for n in range(1, 100):
+                consumed.append(n)
+                yield n
+
+        results = calculator.calculate_many(values(), chunk_size=10)
+        first = next(results)
+        assert first.roots[0][0] == Decimal(1)
+        assert len(consumed) == 10
+
+    def test_invalid_chunk_size(self, calculator):
+        """Test that a non-positive chunk size is rejected."""
+        with pytest.raises(InvalidInputError):
+            list(calculator.calculate_many([1], chunk_size=0))
+
+
+class TestNewtonRefinement:
+    """Test refining roots from lower-precision seeds."""
+
+    def test_refined_real_root_matches_sqrt(self):
+        """Test that a seeded root is digit-for-digit the direct root."""
+        seed = SquareRootCalculator(precision=400).sqrt_real("3.7")
+        calc = SquareRootCalculator(precision=900)
+        assert calc.sqrt_real("3.7", seed=seed) == calc.sqrt_real("3.7")
+        assert str(calc.sqrt_real("3.7", seed=seed)) == str(calc.sqrt_real("3.7"))
+
+    def test_exact_root_from_seed(self):
+        """Test that refining an exact root keeps its ideal form."""
+        calc = SquareRootCalculator(precision=500)
+        assert str(calc.sqrt_real("1.44", seed=Decimal("1.2"))) == "1.2"
+
+    def test_exact_roots_match_sqrt_forms(self):
+        """Test that refined exact roots take the exponent Decimal.sqrt gives."""
+        from decimal import MAX_EMAX, Context
+        from square_root_calculator.core.fixed_point import (
+            FixedPointRoot,
+            reduce_exact_root,
+        )
+
+        direct = Context(prec=3000, Emax=MAX_EMAX)
+        calc = SquareRootCalculator(precision=3000, engine="newton")
+        for value in ("4", "4E+3000", "1.4400", "0.000144", "1E+6"):
+            expected = direct.sqrt(Decimal(value))
+            assert str(calc.sqrt_real(value)) == str(expected)
+        reduced = reduce_exact_root(FixedPointRoot(12 * 10**5000, -5010, True), -20)
+        assert (reduced.mantissa, reduced.exponent) == (12 * 10**10, -20)
+
+    def test_bad_seed_falls_back(self):
+        """Test that a useless seed still gives the correct root."""
+        calc = SquareRootCalculator(precision=400)
+        root = calc.sqrt_real("2", seed=Decimal("123456789"))
+        assert root == calc.sqrt_real("2")
+
+    def test_refined_complex_root(self):
+        """Test that a seeded complex root agrees with the direct one."""
+        seed = SquareRootCalculator(precision=300).sqrt_complex(3, 5)
+        calc = SquareRootCalculator(precision=700)
+        real, imag = calc.sqrt_complex(3, 5, seed=seed)
+        expected_real, expected_imag = calc.sqrt_complex(3, 5)
+        assert abs(real - expected_real) <= Decimal("1e-698")
+        assert abs(imag - expected_imag) <= Decimal("1e-698")
+
+    def test_cache_seeds_higher_precision(self):
+        """Test that raising the precision refines the cached root."""
+        from square_root_calculator.core.cache import ResultCache
+
+        cache = ResultCache()
+        calc = SquareRootCalculator(precision=400, cache=cache)
+        calc.calculate("5")
+        calc.set_precision(800)
+        result = calc.calculate("5")
+        assert cache.seed_hits == 1
+        assert result.roots[0][0] == SquareRootCalculator(800).sqrt_real("5")
+
+
+class TestDigitStreaming:
+    """Test streaming digit generation of real roots."""
+
+    def test_digits_match_truncated_root(self):
+        """Test that streamed digits equal the truncated root."""
+        calc = SquareRootCalculator(precision=10)
+        digits = "".join(calc.iter_sqrt_real_digits(2, decimal_places=50))
+        expected = SquareRootCalculator(precision=60).sqrt_real(2)
+        assert digits == str(expected)[:52]
+
+    def test_small_chunks(self):
+        """Test that the chunk size only changes how digits are split."""
+        calc = SquareRootCalculator(precision=10)
+        chunks = list(calc.iter_sqrt_real_digits("123.456", 30, chunk_size=7))
+        assert chunks[0] == "11"
+        assert chunks[1].startswith(".")
+        assert all(len(chunk.lstrip(".")) <= 7 for chunk in chunks)
+        assert "".join(chunks) == "".join(calc.iter_sqrt_real_digits("123.456", 30))
+
+    def test_exact_roots_stop_early(self):
+        """Test that exact roots are streamed without trailing zeros."""
+        calc = SquareRootCalculator(precision=50)
+        assert "".join(calc.iter_sqrt_real_digits("0.25")) == "0.5"
+        assert "".join(calc.iter_sqrt_real_digits(16)) == "4"
+        assert "".join(calc.iter_sqrt_real_digits("1E+4")) == "100"
+        assert "".join(calc.iter_sqrt_real_digits("0.0004")) == "0.02"
+
+    def test_invalid_arguments(self):
+        """Test that negative inputs and empty chunks are rejected."""
+        calc = SquareRootCalculator(precision=10)
+        with pytest.raises(InvalidInputError):
+            calc.iter_sqrt_real_digits(-1)
+        with pytest.raises(InvalidInputError):
+            calc.iter_sqrt_real_digits(2, chunk_size=0)
+
+
+class TestLazyRepresentations:
+    """Test memoized, on-demand result representations."""
+
+    def test_subset_of_representations(self):
+        """Test that only the requested representations are built."""
+        result = SquareRootCalculator(precision=20).calculate(2)
+        reps = result.get_representations(["decimal"])
+        assert list(reps) == ["decimal"]
+        assert "fraction" not in result._representations
+
+    def test_representations_are_memoized(self):
+        """Test that repeated calls reuse the computed strings."""
+        result = SquareRootCalculator(precision=20).calculate(None, 3, 4)
+        first = result.get_representations()
+        assert result.get_representations() == first
+        assert result.get_representation("polar") is first["polar"]
+        assert result.get_formatted_roots() == result.get_formatted_roots(20)
+
+    def test_representation_of_other_mode(self):
+        """Test that forms of the other mode are skipped."""
+        result = SquareRootCalculator(precision=20).calculate(2)
+        assert result.get_representation("polar") is None
+        assert result.get_representations(["polar", "decimal"]) == {
+            "decimal": result.get_representation("decimal")
+        }
+
+    def test_unknown_representation(self):
+        """Test that unknown representation kinds are rejected."""
+        result = SquareRootCalculator(precision=20).calculate(2)
+        with pytest.raises(InvalidInputError):
+            result.get_representation("hexadecimal")
+
+
+class TestRationalApproximation:
+    """Test continued-fraction rational approximations."""
+
+    def test_matches_limit_denominator(self):
+        """Test that the best approximation agrees with Fraction."""
+        from fractions import Fraction
+        from square_root_calculator.core.rational import ContinuedFraction
+
+        value = SquareRootCalculator(precision=40).sqrt_real(2)
+        fraction = ContinuedFraction(value)
+        for bound in (1, 7, 100, 10**6, 10**12):
+            expected = Fraction(value).limit_denominator(bound)
+            assert fraction.best_approximation(bound) == expected
+
+    def test_quotients_are_reused(self):
+        """Test that a tighter bound extends the cached expansion."""
+        from square_root_calculator.core.rational import ContinuedFraction
+
+        fraction = ContinuedFraction(Decimal("1.41421356237309504880168872420969808"))
+        fraction.best_approximation(100)
+        quotients = list(fraction.quotients)
+        fraction.best_approximation(10**9)
+        assert fraction.quotients[: len(quotients)] == quotients
+        assert len(fraction.quotients) > len(quotients)
+
+    def test_max_error(self):
+        """Test that the first convergent within the error is returned."""
+        from fractions import Fraction
+
+        result = SquareRootCalculator(precision=50).calculate(2)
+        approx = result.get_rational_approximation(max_error=Decimal("1e-20"))
+        assert abs(Fraction(result.roots[0][0]) - approx) <= Fraction(1, 10**20)
+        assert result.get_rational_approximation(max_denominator=12) == Fraction(17, 12)
+
+    def test_exact_value_terminates(self):
+        """Test that a terminating decimal expands to itself."""
+        from fractions import Fraction
+        from square_root_calculator.core.rational import ContinuedFraction
+
+        fraction = ContinuedFraction(Decimal("1.5"))
+        assert list(fraction.iter_convergents()) == [Fraction(1), Fraction(3, 2)]
+        assert fraction.is_complete
+
+    def test_value_in_lowest_terms_without_gcd(self):
+        """Test that the value is reduced by its factors 2 and 5 only."""
+        from fractions import Fraction
+        from square_root_calculator.core.rational import ContinuedFraction
+
+        for text in ["0.0625", "-2.5E-7", "3.2E+5", "0", "1.41421356", "0.00800"]:
+            fraction = ContinuedFraction(Decimal(text))
+            assert fraction._ratio == Decimal(text).as_integer_ratio()
+            assert fraction.value == Fraction(Decimal(text))
+        with pytest.raises(ValueError):
+            ContinuedFraction(Decimal("NaN"))
+
+    def test_errors_compared_without_value(self):
+        """Test that bounds are checked without building the exact Fraction."""
+        from fractions import Fraction
+
+        result = SquareRootCalculator(precision=3000).calculate(2)
+        fraction = result.get_continued_fraction()
+        approx = result.get_rational_approximation(max_error=Fraction(1, 10**500))
+        assert result.get_representation("fraction") == "8119/5741"
+        assert fraction._value is None
+        assert abs(fraction.value - approx) <= Fraction(1, 10**500)
+        assert not fraction.is_within(Fraction(3, 2), Decimal("0.08"))
+        assert fraction.is_within(Fraction(3, 2), Decimal("0.09"))
+
+    def test_fraction_representation_of_large_root(self):
+        """Test that roots above the old value cap get a fraction."""
+        result = SquareRootCalculator(precision=30).calculate(10**8 + 1)
+        assert "fraction" in result.get_representations()
+
+
+class TestScientificNotation:
+    """Test Decimal-native scientific notation."""
+
+    def test_matches_float_format(self):
+        """Test that the output agrees with float formatting."""
+        from square_root_calculator.core.formatting import format_scientific
+
+        for value in (1.5, 0.000123456, 98765.4321, -2.5e-7, 9.9999):
+            for digits in (0, 3, 10):
+                expected = f"{value:.{digits}e}"
+                assert format_scientific(Decimal(value), digits) == expected
+
+    def test_beyond_float_range(self):
+        """Test scientific notation of a root too large for float."""
+        result = SquareRootCalculator(precision=5).calculate("1e1000")
+        assert result.get_representation("scientific") == "1.0000e+500"
+
+    def test_full_precision(self):
+        """Test that all significant digits are shown."""
+        result = SquareRootCalculator(precision=30).calculate(2)
+        scientific = result.get_representation("scientific")
+        assert scientific == "1.41421356237309504880168872421e+00"
+
+    def test_zero(self):
+        """Test scientific notation of zero."""
+        from square_root_calculator.core.formatting import format_scientific
+
+        assert format_scientific(Decimal("0E-8"), 2) == "0.00e+00"
+
+
+class TestPolarForms:
+    """Test arbitrary-precision polar and exponential forms."""
+
+    def test_pi_digits(self):
+        """Test pi against its known digits and the Machin formula."""
+        import decimal
+        from square_root_calculator.core.transcendental import atan, pi
+
+        assert str(pi(30)) == "3.14159265358979323846264338328"
+        context = decimal.Context(prec=520)
+        machin = context.multiply(
+            4,
+            context.subtract(
+                context.multiply(4, atan(context.divide(1, 5), 520)),
+                atan(context.divide(1, 239), 520),
+            ),
+        )
+        assert decimal.Context(prec=500).plus(machin) == pi(500)
+
+    def test_atan2_matches_math(self):
+        """Test atan2 quadrants against the float implementation."""
+        import math
+        from square_root_calculator.core.transcendental import atan2
+
+        for y, x in ((1, 2), (3, -4), (-5, -0.5), (-2, 7), (1, 0), (-1, 0), (0, -3)):
+            angle = atan2(Decimal(y), Decimal(x), 30)
+            assert math.isclose(float(angle), math.atan2(y, x), rel_tol=1e-15)
+
+    def test_full_precision_polar_form(self):
+        """Test that the polar form carries all requested digits."""
+        result = SquareRootCalculator(precision=40).calculate(None, 0, 2)
+        # sqrt(2i) = 1 + i, so r = sqrt(2) and theta = pi / 4
+        polar = result.get_representation("polar")
+        assert polar.startswith("1.414213562373095048801688724209698078570 ∠ ")
+        assert "0.7853981633974483096156608458198757210493 rad" in polar
+        assert polar.endswith("(45.00°)")
+
+    def test_low_precision_degrees(self):
+        """Test that the degrees keep two correct decimals at any precision."""
+        for precision in (1, 2, 3, 4):
+            result = SquareRootCalculator(precision).calculate(None, -4, 0)
+            assert result.get_representation("polar").endswith("(90.00°)")
+
+    def test_modulus_from_input_parts(self):
+        """Test that the modulus is not rebuilt from the rounded root."""
+        # sqrt(-5i) = 1.58113883 - 1.58113883i; the rounded parts 1.5811 give
+        # a modulus of 2.23603..., while sqrt(5) = 2.2360679...
+        calc = SquareRootCalculator(4, decimal_places=True)
+        polar = calc.calculate(None, 0, -5).get_representation("polar")
+        assert polar == "2.2361 ∠ -0.7854 rad (-45.00°)"
+
+
+class TestStableComplexRoot:
+    """Test the single-square-root complex algorithm."""
+
+    def test_no_cancellation_at_low_precision(self):
+        """Test inputs that used to need a precision retry."""
+        calc = SquareRootCalculator(precision=3)
+        real, imag = calc.sqrt_complex("-1e20", "1e-20")
+        assert real == Decimal("5E-31")
+        assert imag == Decimal("1.00E+10")
+
+    def test_signs_follow_principal_branch(self):
+        """Test the component signs in every quadrant."""
+        calc = SquareRootCalculator(precision=20)
+        for a, b in ((3, 4), (-3, 4), (-3, -4), (3, -4)):
+            real, imag = calc.sqrt_complex(a, b)
+            expected = complex(a, b) ** 0.5
+            assert abs(float(real) - expected.real) < 1e-12
+            assert abs(float(imag) - expected.imag) < 1e-12
+
+    def test_huge_exponents(self):
+        """Test that the modulus does not overflow for huge parts."""
+        calc = SquareRootCalculator(precision=10)
+        real, imag = calc.sqrt_complex("1E+999990", "-1E+999990")
+        assert real.adjusted() == 499995
+        assert imag.is_signed()
+
+    def test_correctly_rounded_components(self):
+        """Test that components agree with a higher-precision root."""
+        calc = SquareRootCalculator(precision=25)
+        reference = SquareRootCalculator(precision=60)
+        for a, b in (("-7.5", "0.001"), ("2", "-9"), ("-1e-30", "5")):
+            real, imag = calc.sqrt_complex(a, b)
+            exact_real, exact_imag = reference.sqrt_complex(a, b)
+            assert real == calc.context.plus(exact_real)
+            assert imag == calc.context.plus(exact_imag)
+
+
+class TestScaledModulus:
+    """Test the scale-aware complex modulus."""
+
+    def test_negligible_component(self):
+        """Test that a negligible part is skipped without squaring."""
+        from square_root_calculator.core.transcendental import modulus
+
+        assert modulus(Decimal("1e500000"), Decimal("1e-500000"), 50) == Decimal(
+            "1e500000"
+        )
+        assert modulus(Decimal("-3"), Decimal(0), 10) == 3
+
+    def test_extreme_complex_root(self):
+        """Test complex roots of parts far outside the default exponent range."""
+        calc = SquareRootCalculator(precision=20)
+        real, imag = calc.sqrt_complex("1e500000", "1e-500000")
+        assert real == Decimal("1e250000")
+        assert imag == Decimal("5e-750001")
+        real, imag = calc.sqrt_complex("9e999999", "9e999999")
+        assert str(real).startswith("1.042303268280346884")
+
+    def test_matches_exact_modulus(self):
+        """Test that scaling does not change ordinary results."""
+        from square_root_calculator.core.transcendental import modulus
+
+        assert modulus(Decimal(3), Decimal(-4), 10) == 5
+        assert str(modulus(Decimal("1e-30"), Decimal("1e-30"), 20)) == (
+            "1.4142135623730950488E-30"
+        )
+
+    def test_modulus_is_rounded_once(self):
+        """Test that the modulus is the correctly rounded exact root."""
+        from square_root_calculator.core.transcendental import modulus
+
+        real, imag = Decimal("25.053019577"), Decimal("6.09753739872E+15")
+        squares = Context(prec=100).fma(real, real, imag * imag)
+        expected = Context(prec=120).plus(Context(prec=2000).sqrt(squares))
+        assert modulus(real, imag, 120) == expected
+        # sqrt(1.5625 + 1e-60) is just above the tie 1.25 at two digits
+        assert modulus(Decimal("1.25"), Decimal("1e-30"), 2) == Decimal("1.3")
+
+
+class TestExponentInput:
+    """Test inputs in scientific notation with huge exponents."""
+
+    def test_even_power_split(self):
+        """Test that the exponent is split off exactly."""
+        calc = SquareRootCalculator(precision=10)
+        assert str(calc.sqrt_real("4e2000000")) == "2E+1000000"
+        assert str(calc.sqrt_real("1.44")) == "1.2"
+        assert str(calc.sqrt_real("1E+2")) == "1E+1"
+
+    def test_beyond_context_emax(self):
+        """Test that exponents beyond the context range still work."""
+        calc = SquareRootCalculator(precision=20)
+        root = calc.sqrt_real("2e-3000001")
+        assert root.adjusted() == -1500001
+        assert str(root).startswith("4.4721359549995793928")
+        huge = calc.sqrt_real("7E+99999999999")
+        assert huge.adjusted() == 49999999999
+        assert str(huge).startswith("8.3666002653407554798")
+
+    def test_context_range_edges(self):
+        """Test values on both sides of the context Emax and Emin."""
+        calc = SquareRootCalculator(precision=20)
+        assert str(calc.sqrt_real("4E+999998")) == "2E+499999"
+        assert str(calc.sqrt_real("4E+1000000")) == "2E+500000"
+        inside, outside = calc.sqrt_real("9E-999999"), calc.sqrt_real("9E-1000001")
+        assert (inside.adjusted(), outside.adjusted()) == (-500000, -500001)
+        assert inside.as_tuple().digits == outside.as_tuple().digits
+        real, imag = calc.sqrt_complex("3E+999999", "4E+999999")
+        assert real.adjusted() == imag.adjusted() == 499999
+        real, imag = calc.sqrt_complex("3E+1000001", "4E+1000001")
+        assert real.adjusted() == imag.adjusted() == 500000
+
+    def test_engines_agree(self):
+        """Test that both engines give the same digits for huge exponents."""
+        decimal_root = SquareRootCalculator(50).sqrt_real("3e-7777777")
+        isqrt_root = SquareRootCalculator(50, engine="isqrt").sqrt_real("3e-7777777")
+        assert decimal_root == isqrt_root
+
+    def test_complex_exponent_input(self):
+        """Test complex parts in scientific notation."""
+        calc = SquareRootCalculator(precision=20)
+        real, imag = calc.sqrt_complex("-9e999999999", "0")
+        assert real == 0 and str(real) == "0"
+        assert str(imag).startswith("9.486832980505137996")
+        assert imag.adjusted() == 499999999
+
+    def test_huge_and_tiny_complex_parts(self):
+        """Test that a tiny part survives scaling a huge input back."""
+        calc = SquareRootCalculator(precision=20)
+        real, imag = calc.sqrt_complex("-1e1200000", "1e-1")
+        assert real == Decimal("5E-600002")
+        assert imag == Decimal("1E+600000")
+        real, imag = calc.sqrt_complex("1e1200000", "-3e-1")
+        assert imag == Decimal("-1.5E-600001")
+        polar = calc.calculate(None, "1e1200000", "1e-1").get_representation("polar")
+        assert polar.startswith("1E+600000 ∠ 5")
+
+
+class TestIntegerMode:
+    """Test exact integer square roots."""
+
+    def test_floor_root_and_remainder(self):
+        """Test the floor root, remainder and perfect-square flag."""
+        calc = SquareRootCalculator(precision=10)
+        result = calc.sqrt_integer(10**40 + 12345)
+        assert result.root == 10**20
+        assert result.remainder == 12345
+        assert not result.is_perfect_square
+
+        square = calc.sqrt_integer((3**200) ** 2)
+        assert square.root == 3**200
+        assert square.remainder == 0
+        assert square.is_perfect_square
+
+    def test_residue_filters(self):
+        """Test that filters keep all squares and reject most non-squares."""
+        from square_root_calculator.core.exact import passes_residue_filters
+
+        assert all(passes_residue_filters(k * k) for k in range(5000))
+        rejected = sum(not passes_residue_filters(n) for n in range(10**5, 2 * 10**5))
+        assert rejected > 0.95 * 10**5
+
+    def test_filtered_non_square_skips_isqrt(self):
+        """Test that a filtered non-square is decided without a root."""
+        calc = SquareRootCalculator(precision=10)
+        result = calc.sqrt_integer(2 * 10**1000 + 3)
+        assert result.is_perfect_square is False
+        assert result._root is None
+
+    def test_string_input_filtered_before_conversion(self):
+        """Test that a decimal non-square is rejected while still a Decimal."""
+        calc = SquareRootCalculator(precision=10)
+        result = calc.sqrt_integer("2" + "0" * 5000 + "3")
+        assert result.is_perfect_square is False
+        assert isinstance(result._value, Decimal)
+        assert result.value == 2 * 10**5001 + 3
+        square = calc.sqrt_integer("1" + "0" * 6000)
+        assert square.is_perfect_square
+        assert square.root == 10**3000
+
+    def test_large_conversions(self):
+        """Test int <-> Decimal conversions above the direct threshold."""
+        from square_root_calculator.core.fixed_point import (
+            decimal_to_integer,
+            integer_to_decimal,
+            integer_to_str,
+        )
+
+        for n in (3**30000, 10**20000 - 1, 10**20000, 7 * 2**70000 + 1):
+            converted = integer_to_decimal(n)
+            assert decimal_to_integer(converted) == n
+            assert integer_to_str(n) == str(converted)
+            assert -n == decimal_to_integer(integer_to_decimal(-n))
+        assert integer_to_str(10**9000) == "1" + "0" * 9000
+        assert decimal_to_integer(Decimal("12345" + "0" * 8000 + ".000")) == (
+            12345 * 10**8000
+        )
+
+    def test_string_and_invalid_inputs(self):
+        """Test integer inputs given as strings and rejected inputs."""
+        calc = SquareRootCalculator(precision=10)
+        assert calc.sqrt_integer("1E+6").root == 1000
+        assert calc.sqrt_integer("99.000").remainder == 18
+        with pytest.raises(InvalidInputError):
+            calc.sqrt_integer("2.5")
+        with pytest.raises(InvalidInputError):
+            calc.sqrt_integer(-4)
+
+    def test_integer_representation(self):
+        """Test the integer representation of integer inputs."""
+        calc = SquareRootCalculator(precision=20)
+        assert calc.calculate(16).get_representation("integer") == "4²"
+        reps = calc.calculate("123456789").get_representations()
+        assert reps["integer"] == "11111² + 2468"
+        assert "integer" not in calc.calculate("2.5").get_representations()
+
+
+class TestRationalInput:
+    """Test square roots of fractions given as p/q."""
+
+    def test_irrational_root_matches_high_precision(self):
+        """Test that sqrt(p/q) is correctly rounded."""
+        import decimal
+
+        calc = SquareRootCalculator(precision=50)
+        reference = decimal.Context(prec=50).sqrt(
+            decimal.Context(prec=200).divide(Decimal(1), Decimal(3))
+        )
+        assert calc.sqrt_real("1/3") == reference
+        assert calc.sqrt_real("2.5/7") == calc.sqrt_real("5/14")
+
+    def test_exact_roots(self):
+        """Test fractions whose terms are both perfect squares."""
+        calc = SquareRootCalculator(precision=20)
+        assert str(calc.sqrt_real("9/4")) == "1.5"
+        assert str(calc.sqrt_real("1/4")) == "0.5"
+        assert str(calc.sqrt_real("8/2")) == "2"
+        assert str(calc.sqrt_real("0/5")) == "0"
+        assert str(calc.sqrt_real("1/9")) == "0." + "3" * 20
+
+    def test_long_terms(self):
+        """Test that long terms are not limited by int string conversion."""
+        calc = SquareRootCalculator(precision=100)
+        root = calc.sqrt_real("7" * 6000 + "/" + "3" * 5999 + "1")
+        assert str(root).startswith("1.527525231651946668")
+
+    def test_exponent_terms(self):
+        """Test that powers of ten of the terms are not expanded."""
+        calc = SquareRootCalculator(precision=30)
+        assert calc.sqrt_real("1/1e2000000") == Decimal("1E-1000000")
+        wide = Context(prec=30, Emin=-(10**7))
+        expected = calc.sqrt_real("3/70").scaleb(-1000000, wide)
+        assert calc.sqrt_real("3/7e2000001") == expected
+        assert calc.sqrt_real("2.5e-7/1e3") == calc.sqrt_real("2.5e-10")
+        result = calc.calculate("1e400/4")
+        assert result.get_representation("integer") == "5" + "0" * 199 + "²"
+
+    def test_calculate_and_cache(self):
+        """Test fraction inputs through calculate and calculate_many."""
+        from fractions import Fraction
+
+        calc = SquareRootCalculator(precision=30)
+        result = calc.calculate("1/3")
+        assert result.input_value == "1/3"
+        assert result.get_representation("integer") is None
+        again = calc.calculate(Fraction(2, 6))
+        assert again.roots == result.roots
+        batch = list(calc.calculate_many(["16/4", "1/3"]))
+        assert batch[0].get_representation("integer") == "2²"
+        assert batch[1].roots == result.roots
+
+    def test_invalid_fractions(self):
+        """Test rejected fraction inputs."""
+        calc = SquareRootCalculator(precision=10)
+        for value in ["1/0", "1/2/3", "-1/3", "a/3", "1/inf"]:
+            with pytest.raises(InvalidInputError):
+                calc.sqrt_real(value)
+        with pytest.raises(InvalidInputError, match="only supported in real mode"):
+            calc.calculate(None, "1/2", "1")
+
+
+class TestExactComplexRoots:
+    """Test exact roots of Gaussian-integer and decimal complex inputs."""
+
+    def test_gaussian_integer_roots(self):
+        """Test inputs whose roots are Gaussian integers."""
+        calc = SquareRootCalculator(precision=10)
+        assert calc.sqrt_complex(3, 4) == (Decimal(2), Decimal(1))
+        assert calc.sqrt_complex(-7, 24) == (Decimal(3), Decimal(4))
+        assert calc.sqrt_complex(5, -12) == (Decimal(3), Decimal(-2))
+        assert calc.sqrt_complex(-4, 0) == (Decimal(0), Decimal(2))
+
+    def test_half_integer_and_decimal_roots(self):
+        """Test roots with halves and decimal inputs."""
+        calc = SquareRootCalculator(precision=10)
+        assert calc.sqrt_complex(0, 2) == (Decimal(1), Decimal(1))
+        assert calc.sqrt_complex(0, "0.5") == (Decimal("0.5"), Decimal("0.5"))
+        assert calc.sqrt_complex("0.03", "0.04") == (Decimal("0.2"), Decimal("0.1"))
+
+    def test_exact_root_ignores_precision(self):
+        """Test that exact roots are not rounded to the precision."""
+        calc = SquareRootCalculator(precision=2)
+        root = 10**30 + 7
+        real, imag = calc.sqrt_complex(root * root - 1, 2 * root)
+        assert real == root and imag == 1
+
+    def test_result_marked_exact(self):
+        """Test the exact flag on complex and real results."""
+        calc = SquareRootCalculator(precision=10)
+        result = calc.calculate(None, real_part="3", imag_part="4")
+        assert result.is_exact
+        assert result.get_formatted_roots() == ["2+1i", "-2-1i"]
+        assert not calc.calculate(None, real_part="0", imag_part="1").is_exact
+        assert calc.calculate("2.25").is_exact
+        assert calc.calculate("9/4").is_exact
+        assert not calc.calculate("2").is_exact
+        batch = list(calc.calculate_many([(3, 4), (1, 1)]))
+        assert [item.is_exact for item in batch] == [True, False]
+
+
+class TestFloatFastPath:
+    """Test the cmath fast path for low-precision complex roots."""
+
+    def test_matches_decimal_path(self, monkeypatch):
+        """Test that accepted fast results equal the Decimal results."""
+        import random
+        import square_root_calculator.core.calculator as calculator_module
+        from square_root_calculator.core.fast_paths import float_complex_sqrt
+
+        rng = random.Random(7)
+        accepted = 0
+        for precision in (1, 4, 9, 13):
+            calc = SquareRootCalculator(precision=precision)
+            for _ in range(100):
+                a = Decimal(rng.randint(-(10**6), 10**6)).scaleb(rng.randint(-9, 9))
+                b = Decimal(rng.randint(-(10**6), 10**6)).scaleb(rng.randint(-9, 9))
+                fast = float_complex_sqrt(a, b, precision)
+                with monkeypatch.context() as patch:
+                    patch.setattr(
+                        calculator_module, "float_complex_sqrt", lambda *args: None
+                    )
+                    expected = calc._sqrt_complex_local(a, b)
+                if fast is not None:
+                    accepted += 1
+                    assert [str(part) for part in fast] == [
+                        str(part) for part in expected
+                    ]
+        assert accepted > 200
+
+    def test_zero_imaginary_part(self):
+        """Test zero components and their signs."""
+        from square_root_calculator.core.fast_paths import float_complex_sqrt
+
+        real, imag = float_complex_sqrt(Decimal(2), Decimal("-0"), 4)
+        assert str(real) == "1.414" and str(imag) == "-0"
+        real, imag = float_complex_sqrt(Decimal(-2), Decimal(0), 4)
+        assert str(real) == "0" and str(imag) == "1.414"
+
+    def test_declines_when_not_applicable(self):
+        """Test high precision, extreme exponents and trailing zeros."""
+        from square_root_calculator.core.fast_paths import float_complex_sqrt
+
+        assert float_complex_sqrt(Decimal(1), Decimal(1), 30) is None
+        assert float_complex_sqrt(Decimal("1E+400"), Decimal(1), 4) is None
+        # 2.56E+18 has the exact root 1.6E+9, printed short by Decimal
+        assert float_complex_sqrt(Decimal("2.56E+18"), Decimal(1), 6) is None
@@ -0,0 +1,178 @@
+"""Tests for on-host calibration of the backend bands."""
+
+import json
+import pytest  # noqa: F401
+from square_root_calculator.core.backends import (
+    BackendRegistry,
+    IntegerBackend,
+    default_registry,
+)
+from square_root_calculator.core.calibration import (
+    apply_calibration,
+    calibrate,
+    find_band,
+    fit_cost_model,
+    load_calibration,
+    measure,
+    measure_memory,
+    save_calibration,
+)
+from square_root_calculator.core.estimation import CostModel
+from square_root_calculator.core.fixed_point import isqrt_rem
+
+
+def _rows(ratios):
+    """Build benchmark rows with the given isqrt/decimal time ratios."""
+    return [
+        {
+            "precision": precision,
+            "input_digits": precision,
+            "decimal": 1.0,
+            "isqrt": ratio,
+        }
+        for precision, ratio in ratios
+    ]
+
+
+def _registry():
+    """Build a registry with the math.isqrt backend."""
+    registry = BackendRegistry()
+    registry.register(IntegerBackend("isqrt", isqrt_rem))
+    return registry
+
+
+class TestFindBand:
+    """Test crossover detection from benchmark rows."""
+
+    def test_band_inside_ladder(self):
+        """Test a band that starts and ends on measured rungs."""
+        rows = _rows([(100, 2.0), (200, 0.9), (500, 0.5), (1000, 1.2)])
+        assert find_band(rows, "isqrt") == (200, 1000)
+
+    def test_integer_never_wins(self):
+        """Test that equal bounds are returned when Decimal always wins."""
+        rows = _rows([(100, 2.0), (200, 1.5)])
+        assert find_band(rows, "isqrt") == (200, 200)
+
+    def test_upper_crossover_extrapolated(self):
+        """Test extrapolation when the integer backend wins at the top rung."""
+        rows = _rows([(100, 2.0), (1000, 0.25), (10000, 0.5)])
+        # The ratio doubles per decade, so it reaches 1 one decade later
+        assert find_band(rows, "isqrt") == (1000, 100000)
+
+    def test_slowest_input_decides(self):
+        """Test that a rung is only won when every input size is faster."""
+        rows = _rows([(100, 0.5), (200, 0.5)])
+        rows.append(
+            {"precision": 100, "input_digits": 1000, "decimal": 1.0, "isqrt": 3.0}
+        )
+        assert find_band(rows, "isqrt")[0] == 200
+
+    def test_band_ends_where_newton_wins(self):
+        """Test that the upper crossover compares against the Newton backend."""
+        rows = _rows([(100, 2.0), (200, 0.5), (500, 0.3), (1000, 0.2)])
+        for row, newton in zip(rows, [3.0, 1.0, 0.3, 0.1]):
+            row["newton"] = newton
+        assert find_band(rows, "isqrt", "newton") == (200, 500)
+
+
+class TestCalibration:
+    """Test measuring, saving and loading calibration data."""
+
+    def test_measure_ladder(self):
+        """Test that every rung and input size is timed."""
+        backends = [default_registry.get("decimal"), default_registry.get("isqrt")]
+        rows = measure(backends, precisions=[10, 20], input_factors=[1, 3])
+        assert [(row["precision"], row["input_digits"]) for row in rows] == [
+            (10, 10),
+            (10, 30),
+            (20, 20),
+            (20, 60),
+        ]
+        assert all(row["decimal"] > 0 and row["isqrt"] > 0 for row in rows)
+
+    def test_calibrate_and_apply(self):
+        """Test that calibration data applies to a registry."""
+        registry = _registry()
+        data = calibrate(registry, precisions=[10, 20, 40])
+        assert data["integer_backend"] == "isqrt"
+        assert data["high_precision_backend"] == "decimal"
+        model = CostModel()
+        apply_calibration(data, registry, model)
+        assert registry.band() == tuple(data["short_input_band"])
+        assert registry.band(long_input=True) == tuple(data["long_input_band"])
+        assert model.to_data() == data["cost_model"]
+
+    def test_measure_memory(self):
+        """Test that peak memory is traced per engine and input size."""
+        backends = [default_registry.get("decimal"), default_registry.get("isqrt")]
+        rows = measure_memory(backends, precision=2000, input_factors=[1, 10])
+        assert [row["input_digits"] for row in rows] == [2000, 20000]
+        assert all(row["decimal"] > 0 and row["isqrt"] > 0 for row in rows)
+
+    def test_fit_cost_model(self):
+        """Test that measured timings and memory replace the reference ones."""
+        rows = _rows([(100, 2.0), (1000, 0.5)])
+        memory = [{"precision": 1000, "input_digits": 1000, "isqrt": 5000}]
+        model = fit_cost_model(rows, memory)
+        assert model.estimate("decimal", 1000, 10).seconds == pytest.approx(1.0)
+        estimate = model.estimate("isqrt", 1000, 10)
+        assert estimate.seconds == pytest.approx(0.5)
+        assert estimate.peak_bytes == int(5 * 1000 + 10 * 8 / 19)
+
+    def test_save_and_load(self, tmp_path):
+        """Test that saved bands are applied at load time."""
+        data = {
+            "version": 2,
+            "integer_backend": "isqrt",
+            "high_precision_backend": "decimal",
+            "short_input_band": [300, 4000],
+            "long_input_band": [500, 600],
+        }
+        path = save_calibration(data, tmp_path / "calibration.json")
+        registry = _registry()
+        assert load_calibration(path, registry)
+        assert registry.band() == (300, 4000)
+        assert registry.band(long_input=True) == (500, 600)
+
+    def test_load_rejects_old_version(self, tmp_path):
+        """Test that bands measured without the Newton backend are ignored."""
+        path = tmp_path / "calibration.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "integer_backend": "isqrt",
+                    "short_input_band": [300, 4000],
+                    "long_input_band": [500, 600],
+                }
+            )
+        )
+        registry = _registry()
+        assert not load_calibration(path, registry)
+        assert registry.band() != (300, 4000)
+
+    def test_load_missing_file(self, tmp_path):
+        """Test that a missing file keeps the built-in bands."""
+        registry = _registry()
+        bands = registry.band(), registry.band(long_input=True)
+        assert not load_calibration(tmp_path / "calibration.json", registry)
+        assert (registry.band(), registry.band(long_input=True)) == bands
+
+    def test_load_rejects_other_backend(self, tmp_path):
+        """Test that bands measured for another integer backend are ignored."""
+        path = tmp_path / "calibration.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "version": 2,
+                    "integer_backend": "gmpy2",
+                    "high_precision_backend": "decimal",
+                    "short_input_band": [300, 4000],
+                    "long_input_band": [500, 600],
+                }
+            )
+        )
+        registry = _registry()
+        assert not load_calibration(path, registry)
+        assert registry.band() != (300, 4000)
@@ -0,0 +1,159 @@
+"""Tests for cooperative cancellation and progress reporting."""
+
+import threading
+import pytest  # noqa: F401
+from square_root_calculator.core.batch import BatchJob, ThreadPoolBatchExecutor
+from square_root_calculator.core.calculator import SquareRootCalculator
+from square_root_calculator.core.cancellation import (
+    CalculationCancelledError,
+    CancellationToken,
+    checkpoint,
+    is_monitored,
+    monitoring,
+    stage,
+)
+
+
+class _CancelAfter:
+    """Progress callback cancelling a token after a number of reports."""
+
+    def __init__(self, token, reports):
+        self.token = token
+        self.reports = reports
+        self.values = []
+
+    def __call__(self, fraction):
+        self.values.append(fraction)
+        if len(self.values) >= self.reports:
+            self.token.cancel()
+
+
+class TestMonitor:
+    """Test tokens, checkpoints and stages."""
+
+    def test_token(self):
+        """Test that a cancelled token raises."""
+        token = CancellationToken()
+        token.raise_if_cancelled()
+        token.cancel()
+        assert token.is_cancelled
+        with pytest.raises(CalculationCancelledError):
+            token.raise_if_cancelled()
+
+    def test_checkpoint_without_monitor(self):
+        """Test that checkpoints do nothing outside a monitored calculation."""
+        assert not is_monitored()
+        checkpoint(0.5)
+
+    def test_stages_map_progress(self):
+        """Test that nested stages report monotonic overall fractions."""
+        values = []
+        with monitoring(progress=values.append):
+            assert is_monitored()
+            with stage(0.0, 0.5):
+                checkpoint(0.5)
+            with stage(0.5, 1.0):
+                with stage(0.0, 0.5):
+                    checkpoint(1.0)
+                checkpoint(0.25)
+        assert values == [0.25, 0.5, 0.75, 1.0]
+        assert not is_monitored()
+
+    def test_nested_monitoring_shares_monitor(self):
+        """Test that monitoring without arguments keeps the active monitor."""
+        token = CancellationToken()
+        with monitoring(token) as outer:
+            with monitoring() as inner:
+                assert inner is outer
+
+    def test_cancelled_before_start(self):
+        """Test that a calculation with a cancelled token never starts."""
+        token = CancellationToken()
+        token.cancel()
+        with pytest.raises(CalculationCancelledError):
+            SquareRootCalculator(20).calculate(2, token=token)
+
+
+class TestCalculatorMonitoring:
+    """Test cancellation and progress of calculator methods."""
+
+    @pytest.mark.parametrize("precision", [50, 1500])
+    def test_monitored_results_unchanged(self, precision):
+        """Test that monitoring does not change any digit."""
+        calc = SquareRootCalculator(precision)
+        for value in ["2", "0.0004", "123456789.987654321", "1E+1001", "22/7E-5"]:
+            plain = calc.sqrt_real(value)
+            monitored = calc.sqrt_real(value, token=CancellationToken())
+            assert str(monitored) == str(plain)
+        plain = calc.sqrt_complex(3, -4.5)
+        monitored = calc.sqrt_complex(3, -4.5, progress=lambda fraction: None)
+        assert str(monitored) == str(plain)
+
+    def test_progress_reaches_one(self):
+        """Test that progress increases and ends at 1."""
+        values = []
+        SquareRootCalculator(3000).sqrt_real(2, progress=values.append)
+        assert len(values) > 2
+        assert values == sorted(values)
+        assert values[-1] == 1.0
+
+    def test_cancel_during_newton_steps(self):
+        """Test that a long root stops at a checkpoint between steps."""
+        token = CancellationToken()
+        callback = _CancelAfter(token, 2)
+        with pytest.raises(CalculationCancelledError):
+            SquareRootCalculator(5000).calculate(2, token=token, progress=callback)
+        assert callback.values[-1] < 1.0
+
+    def test_cancel_fraction_root(self):
+        """Test that a fraction root stops at a checkpoint between steps."""
+        token = CancellationToken()
+        callback = _CancelAfter(token, 2)
+        with pytest.raises(CalculationCancelledError):
+            SquareRootCalculator(5000).sqrt_real("2/3", token=token, progress=callback)
+        assert callback.values[-1] < 1.0
+
+    def test_cancel_complex_root(self):
+        """Test that complex roots stop at a checkpoint as well."""
+        token = CancellationToken()
+        with pytest.raises(CalculationCancelledError):
+            SquareRootCalculator(3000).sqrt_complex(
+                3, 4.5, token=token, progress=_CancelAfter(token, 2)
+            )
+
+    def test_calculate_many_cancelled(self):
+        """Test that a shared token stops a batch between items."""
+        token = CancellationToken()
+        token.cancel()
+        calc = SquareRootCalculator(20)
+        with pytest.raises(CalculationCancelledError):
+            list(calc.calculate_many(["2", "3", "5"], token=token))
+
+    def test_representations_progress(self):
+        """Test that representations report progress per kind."""
+        result = SquareRootCalculator(30).calculate(2)
+        values = []
+        representations = result.get_representations(progress=values.append)
+        assert representations == result.get_representations()
+        assert values[-1] == 1.0
+        assert len(values) >= 2
+
+    def test_cancel_from_another_thread(self):
+        """Test that a token cancelled by another thread stops a batch job."""
+        token = CancellationToken()
+        started = threading.Event()
+
+        def progress(fraction):
+            started.set()
+
+        def cancel():
+            started.wait(5)
+            token.cancel()
+
+        canceller = threading.Thread(target=cancel)
+        canceller.start()
+        job = BatchJob(2, precision=200000, token=token, progress=progress)
+        with ThreadPoolBatchExecutor(max_workers=1) as executor:
+            with pytest.raises(CalculationCancelledError):
+                executor.run([job])
+        canceller.join()
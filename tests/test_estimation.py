@@ -0,0 +1,190 @@
+"""Tests for cost estimation and admission control."""
+
+import pytest  # noqa: F401
+from square_root_calculator.core.batch import BatchJob, ThreadPoolBatchExecutor
+from square_root_calculator.core.calculator import (
+    InvalidInputError,
+    SquareRootCalculator,
+)
+from square_root_calculator.core.estimation import (
+    AdmissionPolicy,
+    AdmissionRejectedError,
+    CostEstimate,
+    CostModel,
+)
+
+
+def _linear(precision):
+    """Estimate one millisecond and one kilobyte per digit."""
+    return CostEstimate(precision / 1000, precision * 1000, "decimal", precision)
+
+
+class TestCostModel:
+    """Test CostModel class."""
+
+    def test_interpolates_in_log_log(self):
+        """Test that times between and beyond points follow a power law."""
+        model = CostModel()
+        model.set_points("decimal", [(100, 1.0), (1000, 100.0)], False)
+        assert model.estimate("decimal", 100, 100).seconds == pytest.approx(1.0)
+        assert model.estimate("decimal", 316, 316).seconds == pytest.approx(
+            10.0, rel=0.01
+        )
+        assert model.estimate("decimal", 10000, 1).seconds == pytest.approx(1e4)
+
+    def test_input_classes(self):
+        """Test that inputs longer than the precision use their own points."""
+        model = CostModel()
+        model.set_points("isqrt", [(100, 1.0), (1000, 10.0)], False)
+        model.set_points("isqrt", [(100, 2.0), (1000, 20.0)], True)
+        assert model.estimate("isqrt", 100, 100).seconds == pytest.approx(1.0)
+        assert model.estimate("isqrt", 100, 101).seconds == pytest.approx(2.0)
+
+    def test_memory_grows_with_precision_and_input(self):
+        """Test that peak memory counts the root and the input digits."""
+        model = CostModel()
+        small = model.estimate("newton", 1000, 1000)
+        assert model.estimate("newton", 2000, 1000).peak_bytes > small.peak_bytes
+        assert model.estimate("newton", 1000, 900).peak_bytes < small.peak_bytes
+
+    def test_unknown_engine_uses_decimal(self):
+        """Test that engines without points are estimated like Decimal.sqrt."""
+        model = CostModel()
+        expected = model.estimate("decimal", 5000, 10)
+        estimate = model.estimate("abacus", 5000, 10)
+        assert estimate.seconds == expected.seconds
+        assert estimate.engine == "abacus"
+
+    def test_data_round_trip(self):
+        """Test that exported data restores the model."""
+        model = CostModel()
+        model.set_points("isqrt", [(10, 1.0), (20, 3.0)], False)
+        model.set_bytes_per_digit("isqrt", 42.0, False)
+        restored = CostModel()
+        restored.load_data(model.to_data())
+        assert restored.to_data() == model.to_data()
+
+    def test_invalid_points_raise_error(self):
+        """Test that empty or non-positive points are rejected."""
+        model = CostModel()
+        with pytest.raises(ValueError):
+            model.set_points("decimal", [], False)
+        with pytest.raises(ValueError):
+            model.set_points("decimal", [(100, 0.0)], False)
+
+
+class TestAdmissionPolicy:
+    """Test AdmissionPolicy class."""
+
+    def test_within_limits(self):
+        """Test that a cheap job keeps its precision."""
+        policy = AdmissionPolicy(max_seconds=1.0, max_bytes=10**7)
+        assert policy.admit(_linear, 500) == 500
+
+    def test_reject(self):
+        """Test that a costly job is rejected with its estimate."""
+        policy = AdmissionPolicy(max_seconds=1.0)
+        with pytest.raises(AdmissionRejectedError) as error:
+            policy.admit(_linear, 5000)
+        assert error.value.estimate.precision == 5000
+
+    def test_downgrade(self):
+        """Test that a downgrade picks the highest precision within limits."""
+        assert (
+            AdmissionPolicy(max_seconds=1.0, downgrade=True).admit(_linear, 5000)
+            == 1000
+        )
+        assert (
+            AdmissionPolicy(max_bytes=250000, downgrade=True).admit(_linear, 5000)
+            == 250
+        )
+
+    def test_downgrade_below_minimum_rejected(self):
+        """Test that a job is rejected when even the minimum does not fit."""
+        policy = AdmissionPolicy(max_seconds=1.0, downgrade=True, min_precision=2000)
+        with pytest.raises(AdmissionRejectedError):
+            policy.admit(_linear, 5000)
+
+
+class TestCalculatorEstimates:
+    """Test cost estimates of the calculator."""
+
+    def test_estimate_grows_with_precision(self):
+        """Test that estimates increase with the precision."""
+        low = SquareRootCalculator(1000).estimate_cost("2")
+        high = SquareRootCalculator(100000).estimate_cost("2")
+        assert high.seconds > low.seconds
+        assert high.peak_bytes > low.peak_bytes
+        assert high.precision == 100000
+
+    def test_estimate_uses_selected_engine(self):
+        """Test that the estimate names the engine the root would use."""
+        assert SquareRootCalculator(100000).estimate_cost(2).engine == "newton"
+        forced = SquareRootCalculator(100000, engine="decimal")
+        assert forced.estimate_cost(2).engine == "decimal"
+        assert (
+            forced.estimate_cost(2).seconds
+            > SquareRootCalculator(100000).estimate_cost(2).seconds
+        )
+
+    def test_estimate_complex_and_fraction(self):
+        """Test estimates of complex and fraction inputs."""
+        calc = SquareRootCalculator(20000)
+        real = calc.estimate_cost("2")
+        assert calc.estimate_cost(real_part=3, imag_part=4).seconds > real.seconds
+        assert calc.estimate_cost("1/3").engine == "isqrt"
+
+    def test_huge_fraction_terms_rejected(self):
+        """Test that long fraction terms count even at a low precision."""
+        calc = SquareRootCalculator(4)
+        value = "7" * 30000 + "/" + "3" * 30001
+        estimate = calc.estimate_cost(value)
+        assert estimate.seconds > 1000 * calc.estimate_cost("7/3").seconds
+        assert estimate.peak_bytes > 10**5
+        for policy in (
+            AdmissionPolicy(max_seconds=0.02, downgrade=True),
+            AdmissionPolicy(max_bytes=10**5),
+        ):
+            with pytest.raises(AdmissionRejectedError):
+                calc.check_admission(policy, value)
+
+    def test_estimate_other_precision(self):
+        """Test that an explicit precision leaves the calculator unchanged."""
+        calc = SquareRootCalculator(50)
+        assert calc.estimate_cost("2", precision=5000).precision == 5000
+        assert calc.precision == 50
+
+    def test_estimate_invalid_input(self):
+        """Test that invalid inputs are reported like in calculate."""
+        with pytest.raises(InvalidInputError):
+            SquareRootCalculator(50).estimate_cost("-4")
+
+    def test_check_admission(self):
+        """Test that the calculator applies a policy to its precision."""
+        calc = SquareRootCalculator(200000)
+        policy = AdmissionPolicy(max_seconds=0.01, downgrade=True)
+        precision = calc.check_admission(policy, "2")
+        assert precision < 200000
+        assert policy.allows(calc.estimate_cost("2", precision=precision))
+        with pytest.raises(AdmissionRejectedError):
+            calc.check_admission(AdmissionPolicy(max_seconds=0.01), "2")
+
+
+class TestBatchAdmission:
+    """Test admission control in the thread pool executor."""
+
+    def test_batch_rejects_costly_job(self):
+        """Test that a job over the limits fails the batch."""
+        policy = AdmissionPolicy(max_seconds=0.01)
+        with ThreadPoolBatchExecutor(max_workers=2, admission_policy=policy) as ex:
+            assert ex.run([BatchJob(2, precision=50)])[0].precision == 50
+            with pytest.raises(AdmissionRejectedError):
+                ex.run([BatchJob(2, precision=10**6)])
+
+    def test_batch_downgrades_costly_job(self):
+        """Test that a downgraded job runs at a lower precision."""
+        policy = AdmissionPolicy(max_seconds=0.01, downgrade=True)
+        with ThreadPoolBatchExecutor(max_workers=2, admission_policy=policy) as ex:
+            result = ex.run([BatchJob(2, precision=10**6)])[0]
+        assert result.precision < 10**6
+        assert str(result.roots[0][0]).startswith("1.41421356")
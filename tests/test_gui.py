@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock  # noqa: F401
-from square_root_calculator.core.calculator import CalculationResult
+from square_root_calculator.core.calculator import CalculationResult, InvalidInputError
 from square_root_calculator.core.history import HistoryManager
 from square_root_calculator.ui.history_display import HistoryDisplayManager
 from square_root_calculator.locales.translator import Translator
@@ -179,6 +179,45 @@ class TestCalculationResultIntegration:
         assert entries[0].result_text == "2"
 
 
+class TestComplexInputParsing:
+    """Test parsing of complex inputs stored in history."""
+
+    def test_simple_forms(self):
+        """Test the plain a+bi forms."""
+        parse = HistoryDisplayManager._parse_complex_input
+        assert parse("3+4i") == ("3", "4")
+        assert parse("-3-4i") == ("-3", "-4")
+        assert parse("-4i") == ("0", "-4")
+        assert parse("5") == ("5", "0")
+
+    def test_exponent_signs(self):
+        """Test that exponent signs do not split the number."""
+        parse = HistoryDisplayManager._parse_complex_input
+        assert parse("1e-5+2E+3i") == ("1e-5", "2E+3")
+        assert parse("-1E+5-2e-3i") == ("-1E+5", "-2e-3")
+        assert parse("2e-7i") == ("0", "2e-7")
+
+    def test_validator_accepts_exponents(self):
+        """Test that the input validator allows e/E exponents."""
+        from square_root_calculator.ui.input_validator import InputValidator
+
+        validator = InputValidator(Translator("en"))
+        assert validator.normalize_number_input("4e2000000") == "4e2000000"
+        assert validator.normalize_number_input("1,5E-3") == "1.5E-3"
+
+    def test_validator_accepts_fractions(self):
+        """Test that the input validator allows p/q fractions."""
+        from square_root_calculator.ui.input_validator import InputValidator
+
+        validator = InputValidator(Translator("en"))
+        assert validator.normalize_number_input("1/3") == "1/3"
+        assert validator.normalize_number_input("2,5/7,5") == "2.5/7.5"
+        with pytest.raises(InvalidInputError):
+            validator.normalize_number_input("1.2.3/4")
+        with pytest.raises(InvalidInputError):
+            validator.normalize_number_input("1/3", allow_fraction=False)
+
+
 class TestGUIErrorHandling:
     """Test error handling in GUI components."""
 
@@ -47,6 +47,14 @@ class TestHistoryManager:
         assert not history_manager.is_empty()
         assert len(history_manager.get_entries()) == 1
 
+    def test_add_exact_entry(self, history_manager):
+        """Test that the exact flag is kept with the entry."""
+        history_manager.add_entry("3+4i", "2+1i", is_complex=True, is_exact=True)
+        history_manager.add_entry("2", "1.414...")
+        older, newer = history_manager.get_entries()[::-1]
+        assert older.is_exact
+        assert not newer.is_exact
+
     def test_add_multiple_entries(self, history_manager):
         """Test adding multiple entries."""
         for i in range(5):
@@ -0,0 +1,167 @@
+"""Tests for results to a number of decimal places."""
+
+import pytest  # noqa: F401
+from decimal import Context, Decimal
+from fractions import Fraction
+from square_root_calculator.core.calculator import SquareRootCalculator
+from square_root_calculator.core.formatting import format_decimal
+from square_root_calculator.core.precision import (
+    complex_significant_digits,
+    fraction_adjusted,
+    real_significant_digits,
+    round_small_root,
+    round_to_places,
+)
+
+_REFERENCE = Context(prec=2000, Emax=10**6, Emin=-(10**6))
+
+
+def _reference_root(value, places):
+    """Round a 2000-digit root to a number of places."""
+    root = _REFERENCE.sqrt(Decimal(value))
+    return root.quantize(Decimal(1).scaleb(-places), context=Context(prec=3000))
+
+
+class TestPlanner:
+    """Test the working precision planner."""
+
+    def test_real_significant_digits(self):
+        """Test that the digits cover the integer part of the root."""
+        assert real_significant_digits(Decimal("2").adjusted(), 4) == 5
+        assert real_significant_digits(Decimal("1E+40").adjusted(), 4) == 25
+        assert real_significant_digits(Decimal("0.0004").adjusted(), 4) == 3
+        assert real_significant_digits(Decimal("1E-10").adjusted(), 4) == 0
+
+    def test_fraction_adjusted(self):
+        """Test the leading digit exponent of fractions."""
+        assert fraction_adjusted(1, 3) == -1
+        assert fraction_adjusted(10, 1) == 1
+        assert fraction_adjusted(99, 10) == 0
+        assert fraction_adjusted(1, 10**50) == -50
+
+    def test_complex_significant_digits(self):
+        """Test that the digits cover the larger part and the guard."""
+        assert complex_significant_digits(Decimal(3), Decimal(4), 4, 3) == 8
+        assert complex_significant_digits(Decimal(0), Decimal("1E-40"), 4, 3) == 1
+
+    def test_round_to_places(self):
+        """Test rounding with and without an error bound."""
+        assert round_to_places(Decimal("1.23456"), 3) == Decimal("1.235")
+        assert round_to_places(Decimal("1.2345"), 3) == Decimal("1.234")
+        assert round_to_places(Decimal("1.2345"), 3, Decimal("1E-6")) is None
+        assert round_to_places(Decimal("1.2346"), 3, Decimal("1E-6")) == Decimal(
+            "1.235"
+        )
+
+    def test_round_small_root(self):
+        """Test roots below one unit of the last place."""
+        assert round_small_root(Decimal("2.6E-7"), 3, 0) == Decimal("0.001")
+        assert round_small_root(Fraction(1, 4000000), 3, 0) == Decimal("0.000")
+        assert round_small_root(Decimal("1E-100"), 3, -47) == Decimal("0.000")
+
+
+class TestDecimalPlaces:
+    """Test calculators counting precision in decimal places."""
+
+    @pytest.mark.parametrize("places", [1, 4, 30])
+    def test_real_roots_correctly_rounded(self, places):
+        """Test that real roots of any magnitude are correctly rounded."""
+        calc = SquareRootCalculator(places, decimal_places=True)
+        for value in ["2", "0.0004", "99.99999999", "1E+41", "3E-9", "7E+999"]:
+            root = calc.calculate(value).roots[0][0]
+            assert root == _reference_root(value, places)
+            assert root.as_tuple().exponent == -places
+
+    def test_large_input_keeps_every_place(self):
+        """Test that roots with many integer digits get all places."""
+        result = SquareRootCalculator(4, decimal_places=True).calculate(
+            "123456789012345"
+        )
+        assert result.get_formatted_roots()[0] == "11111111.0611"
+
+    def test_tiny_inputs(self):
+        """Test that roots below the last place round to zero or one unit."""
+        calc = SquareRootCalculator(3, decimal_places=True)
+        assert calc.calculate("1E-100001").get_formatted_roots()[0] == "0.000"
+        assert calc.calculate("0.00000025").roots[0][0] == Decimal("0.000")
+        assert calc.calculate("0.0000002500001").roots[0][0] == Decimal("0.001")
+        assert calc.calculate("1/3999999").roots[0][0] == Decimal("0.001")
+
+    def test_huge_roots_keep_significant_digits(self):
+        """Test that roots too long for places fall back to scientific form."""
+        calc = SquareRootCalculator(4, decimal_places=True)
+        result = calc.calculate("2e2000001")
+        assert not result.decimal_places
+        assert result.precision == 4
+        assert result.get_formatted_roots()[0] == "4.472E+1000000"
+        real, imag = calc.calculate(None, "-4e2000000", "0").roots[0]
+        assert (str(real), str(imag)) == ("0", "2E+1000000")
+        assert calc.estimate_cost("2e2000001").seconds < 0.01
+
+    def test_fraction_and_exact_roots(self):
+        """Test fraction inputs and exactness of rounded roots."""
+        calc = SquareRootCalculator(5, decimal_places=True)
+        assert calc.calculate("1/3").roots[0][0] == Decimal("0.57735")
+        exact = calc.calculate("0.0004")
+        assert exact.is_exact
+        assert exact.get_formatted_roots() == ["0.02000", "-0.02000"]
+        assert not calc.calculate("2").is_exact
+
+    def test_complex_roots(self):
+        """Test that complex parts are rounded to the places."""
+        calc = SquareRootCalculator(4, decimal_places=True)
+        reference = SquareRootCalculator(200).sqrt_complex(1, 1)
+        quantum = Decimal("0.0001")
+        expected = tuple(part.quantize(quantum) for part in reference)
+        result = calc.calculate(None, 1, 1)
+        assert result.roots[0] == expected
+        assert calc.calculate(None, "1E+20", 0).get_formatted_roots()[0] == (
+            "10000000000.0000"
+        )
+        assert calc.calculate(None, 3, 4).is_exact
+
+    def test_batch_matches_calculate(self):
+        """Test that calculate_many plans each input the same way."""
+        calc = SquareRootCalculator(6, decimal_places=True)
+        values = ["2", "1E+30", "2E-7", (1, 2)]
+        batch = [result.roots for result in calc.calculate_many(values)]
+        single = [
+            (
+                calc.calculate(None, *value)
+                if isinstance(value, tuple)
+                else calc.calculate(value)
+            ).roots
+            for value in values
+        ]
+        assert batch == single
+
+    def test_positional_representations(self):
+        """Test that results to decimal places are written without exponents."""
+        result = SquareRootCalculator(8, decimal_places=True).calculate("1E-14")
+        assert result.get_representation("decimal") == "0.00000010"
+        assert result.get_representation("scientific") == "1.0e-07"
+
+    def test_estimate_uses_planned_digits(self):
+        """Test that estimates grow with the integer digits of the root."""
+        calc = SquareRootCalculator(10, decimal_places=True)
+        small = calc.estimate_cost("2")
+        large = calc.estimate_cost("1E+3000")
+        assert large.seconds > small.seconds
+        assert large.precision == small.precision == 10
+
+
+class TestRoundedFormatting:
+    """Test that extra decimal places are rounded, not cut off."""
+
+    def test_format_decimal(self):
+        """Test half-even rounding and positional output."""
+        assert format_decimal(Decimal("1.99999"), 2) == "2.00"
+        assert format_decimal(Decimal("1.125"), 2) == "1.12"
+        assert format_decimal(Decimal("1E-7"), 3) == "1E-7"
+        assert format_decimal(Decimal("1E-7"), 8, positional=True) == "0.0000001"
+
+    def test_formatted_roots_rounded(self):
+        """Test that shorter displays of a root are rounded."""
+        result = SquareRootCalculator(20).calculate("3")
+        assert result.get_formatted_roots(3)[0] == "1.732"
+        assert result.get_formatted_roots(4)[0] == "1.7321"